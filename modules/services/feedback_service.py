@@ -1,6 +1,5 @@
 # services/feedback_service.py
 
-import base64
 import io
 import logging
 import threading
@@ -15,7 +14,7 @@ from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime,
 from sqlalchemy.orm import sessionmaker, relationship, declarative_base
 from sqlalchemy.exc import SQLAlchemyError
 import requests
-from modules.services.performance_analytics_service import PerformanceReport
+from modules.services.performance_analytics_service import PerformanceReport, encode_chart_image, migrate_chart_images
 from modules.utilities.logging_manager import setup_logging
 from modules.utilities.config_loader import ConfigLoader
 from modules.security.encryption_manager import EncryptionManager
@@ -93,6 +92,10 @@ class FeedbackService:
             connection_string = self._build_connection_string(db_type, username, password, host, port, database)
             self.engine = create_engine(connection_string, pool_pre_ping=True, echo=False)
             Base.metadata.create_all(self.engine)
+            # Feedback reports are saved in the analytics service's performance_reports table
+            converted = migrate_chart_images(self.engine)
+            if converted:
+                self.logger.info(f"Converted {converted} stored report charts from base64 text to binary.")
             self.Session = sessionmaker(bind=self.engine)
             self.logger.debug("Database initialized and tables created if not existing.")
         except Exception as e:
@@ -319,8 +322,7 @@ class FeedbackService:
             img_buffer = io.BytesIO()
             plt.savefig(img_buffer, format='png')
             plt.close()
-            img_buffer.seek(0)
-            chart_base64 = base64.b64encode(img_buffer.getvalue()).decode('utf-8')
+            chart_bytes = img_buffer.getvalue()
 
             # Compile report data
             report_data = {
@@ -337,7 +339,7 @@ class FeedbackService:
                 report_name=f"Feedback Report for {service_name}",
                 generated_at=datetime.utcnow(),
                 report_data=json.dumps(report_data),
-                chart_image=chart_base64
+                chart_image=chart_bytes
             )
             self.session.add(report)
             self.session.commit()
@@ -376,12 +378,14 @@ class FeedbackService:
                     'Authorization': f"Bearer {self.analytics_api_key}",
                     'Content-Type': 'application/json'
                 }
+                chart_image, chart_content_type = encode_chart_image(report.chart_image)
                 payload = {
                     'report_id': report.id,
                     'report_name': report.report_name,
                     'generated_at': report.generated_at.strftime('%Y-%m-%d %H:%M:%S'),
                     'report_data': json.loads(report.report_data),
-                    'chart_image': report.chart_image,
+                    'chart_image': chart_image,
+                    'chart_content_type': chart_content_type,
                     'recipient_email': user_email
                 }
                 response = self.session_requests.post(
@@ -567,8 +571,7 @@ class FeedbackService:
             img_buffer = io.BytesIO()
             plt.savefig(img_buffer, format='png')
             plt.close()
-            img_buffer.seek(0)
-            chart_base64 = base64.b64encode(img_buffer.getvalue()).decode('utf-8')
+            chart_bytes = img_buffer.getvalue()
 
             # Compile report data
             report_data = {
@@ -587,7 +590,7 @@ class FeedbackService:
                 report_name=f"Insights Report{' for ' + service_name if service_name else ''}",
                 generated_at=datetime.utcnow(),
                 report_data=json.dumps(report_data),
-                chart_image=chart_base64
+                chart_image=chart_bytes
             )
             self.session.add(report)
             self.session.commit()
@@ -626,12 +629,14 @@ class FeedbackService:
                     'Authorization': f"Bearer {self.analytics_api_key}",
                     'Content-Type': 'application/json'
                 }
+                chart_image, chart_content_type = encode_chart_image(report.chart_image)
                 payload = {
                     'report_id': report.id,
                     'report_name': report.report_name,
                     'generated_at': report.generated_at.strftime('%Y-%m-%d %H:%M:%S'),
                     'report_data': json.loads(report.report_data),
-                    'chart_image': report.chart_image,
+                    'chart_image': chart_image,
+                    'chart_content_type': chart_content_type,
                     'recipient_email': user_email
                 }
                 response = self.session_requests.post(
@@ -762,8 +767,7 @@ class FeedbackService:
             img_buffer = io.BytesIO()
             plt.savefig(img_buffer, format='png')
             plt.close()
-            img_buffer.seek(0)
-            chart_base64 = base64.b64encode(img_buffer.getvalue()).decode('utf-8')
+            chart_bytes = img_buffer.getvalue()
 
             # Compile report data
             report_data = {
@@ -780,7 +784,7 @@ class FeedbackService:
                 report_name=f"Statistics Report{' for ' + service_name if service_name else ''}",
                 generated_at=datetime.utcnow(),
                 report_data=json.dumps(report_data),
-                chart_image=chart_base64
+                chart_image=chart_bytes
             )
             self.session.add(report)
             self.session.commit()
@@ -819,12 +823,14 @@ class FeedbackService:
                     'Authorization': f"Bearer {self.analytics_api_key}",
                     'Content-Type': 'application/json'
                 }
+                chart_image, chart_content_type = encode_chart_image(report.chart_image)
                 payload = {
                     'report_id': report.id,
                     'report_name': report.report_name,
                     'generated_at': report.generated_at.strftime('%Y-%m-%d %H:%M:%S'),
                     'report_data': json.loads(report.report_data),
-                    'chart_image': report.chart_image,
+                    'chart_image': chart_image,
+                    'chart_content_type': chart_content_type,
                     'recipient_email': user_email
                 }
                 response = self.session_requests.post(
@@ -1,9 +1,15 @@
 # services/music_player_service.py
 
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
 import logging
 import threading
-from typing import Any, Dict, List, Optional
+import weakref
+from typing import Any, Dict, Iterable, List, Optional
 import os
+import random
+import stat
+import tempfile
 import pygame
 from pygame import mixer
 from modules.utilities.logging_manager import setup_logging
@@ -11,6 +17,26 @@ from modules.utilities.config_loader import ConfigLoader
 from modules.security.encryption_manager import EncryptionManager
 from modules.security.authentication import AuthenticationManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library encoder
+
+# Mode open() gives new files. Read once at import, since reading the umask briefly clears it process-wide.
+_umask = os.umask(0)
+os.umask(_umask)
+DEFAULT_FILE_MODE = 0o666 & ~_umask
+del _umask
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serializes an object to JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
 
 class MusicPlayerServiceError(Exception):
     """Custom exception for MusicPlayerService-related errors."""
@@ -36,13 +62,113 @@ class MusicPlayerService:
         self.encryption_manager = EncryptionManager()
         self.auth_manager = AuthenticationManager()
         self.lock = threading.Lock()
-        self.playlist: List[str] = []
+        # Tracks are stored as a shared root plus per-track names; when the
+        # playlist does not come from a single directory, _root is None and
+        # _names holds full paths.
+        self._root: Optional[str] = None
+        self._names: List[str] = []
+        # Lazy shuffle order: indices before _shuffle_head have been drawn,
+        # the rest are still to be picked by partial Fisher-Yates.
+        self._shuffle_perm: Optional[List[int]] = None
+        self._shuffle_head: int = 0
         self.current_track_index: int = -1
         self.is_paused: bool = False
         self.volume: float = 0.5  # Default volume
+        self._scan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="MusicScan")
         self._initialize_mixer()
         self.logger.info("MusicPlayerService initialized successfully.")
 
+    @property
+    def playlist(self) -> List[str]:
+        """
+        Returns the full paths of the tracks in the playlist.
+
+        Returns:
+            List[str]: A list of track file paths.
+        """
+        if self._root is None:
+            return list(self._names)
+        return [os.path.join(self._root, name) for name in self._names]
+
+    def _track_path(self, track_index: int) -> str:
+        """
+        Resolves the full path of the track at the given playlist index.
+
+        Args:
+            track_index (int): The index of the track.
+
+        Returns:
+            str: The file path of the track.
+        """
+        if self._root is None:
+            return self._names[track_index]
+        return os.path.join(self._root, self._names[track_index])
+
+    def _is_supported_audio(self, track_path: str) -> bool:
+        """
+        Checks whether the file extension is one of the supported audio formats.
+
+        Args:
+            track_path (str): The file path of the track.
+
+        Returns:
+            bool: True if the format is supported, False otherwise.
+        """
+        return track_path.lower().endswith(self.SUPPORTED_FORMATS)
+
+    @staticmethod
+    def _is_regular_file(track_path: str) -> bool:
+        """
+        Checks with a single stat call whether the path is an existing regular file.
+
+        Args:
+            track_path (str): The file path to check.
+
+        Returns:
+            bool: True if the path is a regular file, False otherwise.
+        """
+        try:
+            return stat.S_ISREG(os.stat(track_path).st_mode)
+        except OSError:
+            return False
+
+    def _append_tracks(self, track_paths: List[str]):
+        """
+        Appends validated tracks to the playlist. Must be called with the lock held.
+
+        Args:
+            track_paths (List[str]): The file paths of the tracks to append.
+        """
+        start = len(self._names)
+        if self._root is not None and all(os.path.dirname(path) == self._root for path in track_paths):
+            self._names.extend(os.path.basename(path) for path in track_paths)
+        else:
+            if self._root is not None:
+                # Tracks from elsewhere: switch to full paths, once
+                self._names = self.playlist
+                self._root = None
+            self._names.extend(track_paths)
+        if self._shuffle_perm is not None:
+            self._shuffle_perm.extend(range(start, len(self._names)))
+
+    def _next_shuffled_index(self) -> int:
+        """
+        Draws the next track index from the lazy shuffle permutation, performing
+        a single Fisher-Yates step. Starts a new cycle once every track has been drawn.
+
+        Returns:
+            int: The index of the next track to play.
+        """
+        perm = self._shuffle_perm
+        n = len(perm)
+        if self._shuffle_head >= n:
+            self._shuffle_head = 0
+        head = self._shuffle_head
+        j = random.randrange(head, n)
+        perm[head], perm[j] = perm[j], perm[head]
+        self._shuffle_head = head + 1
+        return perm[head]
+
     def _initialize_mixer(self):
         """
         Initializes the pygame mixer for audio playback.
@@ -51,7 +177,21 @@ class MusicPlayerService:
             self.logger.debug("Initializing pygame mixer for audio playback.")
             pygame.init()
             mixer.init()
-            mixer.music.set_volume(self.volume)
+            # Bind the mixer.music functions once to skip the module attribute
+            # lookups on every playback call.
+            music = mixer.music
+            self._m_load = music.load
+            self._m_play = music.play
+            self._m_pause = music.pause
+            self._m_unpause = music.unpause
+            self._m_stop = music.stop
+            self._m_get_busy = music.get_busy
+            self._m_set_volume = music.set_volume
+            self._m_get_volume = music.get_volume
+            self._m_set_volume(self.volume)
+            # Shut the mixer down on garbage collection or interpreter exit
+            # if close_service is never called.
+            self._finalizer = weakref.finalize(self, MusicPlayerService._static_close, self._scan_executor)
             self.logger.debug("Pygame mixer initialized successfully.")
         except Exception as e:
             self.logger.error(f"Error initializing pygame mixer: {e}", exc_info=True)
@@ -61,6 +201,56 @@ class MusicPlayerService:
         """
         Loads all supported audio files from the specified directory into the playlist.
 
+        Args:
+            directory_path (str): The path to the directory containing audio files.
+
+        Returns:
+            bool: True if the playlist is loaded successfully, False otherwise.
+        """
+        try:
+            return self.load_playlist_async(directory_path).result()
+        except RuntimeError as e:
+            # The scan executor refuses new work once close_service has shut it down
+            self.logger.error(f"Cannot load playlist from '{directory_path}': {e}")
+            return False
+
+    def load_playlist_async(self, directory_path: str) -> Future:
+        """
+        Scans the specified directory in a background thread and loads the supported
+        audio files into the playlist, so the calling thread is not blocked.
+
+        Args:
+            directory_path (str): The path to the directory containing audio files.
+
+        Returns:
+            Future: A future resolving to True if the playlist is loaded successfully, False otherwise.
+
+        Raises:
+            RuntimeError: If the service has been closed.
+        """
+        return self._scan_executor.submit(self._load_scanned_playlist, directory_path)
+
+    def _scan_dir(self, directory_path: str) -> List[str]:
+        """
+        Lists the names of the supported audio files in a directory.
+
+        Args:
+            directory_path (str): The path to the directory containing audio files.
+
+        Returns:
+            List[str]: The file names of the supported audio files.
+        """
+        with os.scandir(directory_path) as entries:
+            return [
+                entry.name
+                for entry in entries
+                if self._is_supported_audio(entry.name) and entry.is_file()
+            ]
+
+    def _load_scanned_playlist(self, directory_path: str) -> bool:
+        """
+        Scans a directory and replaces the playlist with its supported audio files.
+
         Args:
             directory_path (str): The path to the directory containing audio files.
 
@@ -69,21 +259,20 @@ class MusicPlayerService:
         """
         try:
             self.logger.debug(f"Loading playlist from directory: {directory_path}.")
-            if not os.path.isdir(directory_path):
-                self.logger.error(f"Directory '{directory_path}' does not exist.")
+            try:
+                names = self._scan_dir(directory_path)
+            except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
+                self.logger.error(f"Cannot scan directory '{directory_path}': {e}")
                 return False
-
             with self.lock:
-                self.playlist = [
-                    os.path.join(directory_path, file)
-                    for file in os.listdir(directory_path)
-                    if file.lower().endswith(self.SUPPORTED_FORMATS)
-                ]
-                if not self.playlist:
+                self._root = directory_path
+                self._names = names
+                self._shuffle_perm = None
+                if not self._names:
                     self.logger.warning(f"No supported audio files found in '{directory_path}'.")
                     return False
                 self.current_track_index = 0
-                self.logger.info(f"Playlist loaded with {len(self.playlist)} tracks.")
+                self.logger.info(f"Playlist loaded with {len(self._names)} tracks.")
             return True
         except Exception as e:
             self.logger.error(f"Error loading playlist from '{directory_path}': {e}", exc_info=True)
@@ -102,27 +291,28 @@ class MusicPlayerService:
         try:
             with self.lock:
                 if track_index is not None:
-                    if 0 <= track_index < len(self.playlist):
+                    if 0 <= track_index < len(self._names):
                         self.current_track_index = track_index
-                        self.logger.debug(f"Playing track index {self.current_track_index}: {self.playlist[self.current_track_index]}.")
+                        self.logger.debug(f"Playing track index {self.current_track_index}: {self._track_path(self.current_track_index)}.")
                     else:
                         self.logger.error(f"Track index {track_index} is out of range.")
                         return False
                 elif self.is_paused:
-                    mixer.music.unpause()
+                    self._m_unpause()
                     self.is_paused = False
                     self.logger.info("Resumed playback.")
                     return True
                 else:
-                    if not self.playlist:
+                    if not self._names:
                         self.logger.warning("Playlist is empty. Load a playlist before playing.")
                         return False
                     self.current_track_index = self.current_track_index if self.current_track_index >= 0 else 0
-                    self.logger.debug(f"Playing track index {self.current_track_index}: {self.playlist[self.current_track_index]}.")
+                    self.logger.debug(f"Playing track index {self.current_track_index}: {self._track_path(self.current_track_index)}.")
 
-                mixer.music.load(self.playlist[self.current_track_index])
-                mixer.music.play()
-                self.logger.info(f"Playback started for '{self.playlist[self.current_track_index]}'.")
+                track_path = self._track_path(self.current_track_index)
+                self._m_load(track_path)
+                self._m_play()
+                self.logger.info(f"Playback started for '{track_path}'.")
             return True
         except Exception as e:
             self.logger.error(f"Error playing track: {e}", exc_info=True)
@@ -137,8 +327,8 @@ class MusicPlayerService:
         """
         try:
             with self.lock:
-                if mixer.music.get_busy():
-                    mixer.music.pause()
+                if self._m_get_busy():
+                    self._m_pause()
                     self.is_paused = True
                     self.logger.info("Playback paused.")
                     return True
@@ -158,8 +348,8 @@ class MusicPlayerService:
         """
         try:
             with self.lock:
-                if mixer.music.get_busy() or self.is_paused:
-                    mixer.music.stop()
+                if self._m_get_busy() or self.is_paused:
+                    self._m_stop()
                     self.is_paused = False
                     self.logger.info("Playback stopped.")
                     return True
@@ -179,14 +369,21 @@ class MusicPlayerService:
         """
         try:
             with self.lock:
-                if not self.playlist:
+                n = len(self._names)
+                if not n:
                     self.logger.warning("Playlist is empty. Load a playlist before proceeding to the next track.")
                     return False
-                self.current_track_index = (self.current_track_index + 1) % len(self.playlist)
-                self.logger.debug(f"Moving to next track index {self.current_track_index}: {self.playlist[self.current_track_index]}.")
-                mixer.music.load(self.playlist[self.current_track_index])
-                mixer.music.play()
-                self.logger.info(f"Playback started for '{self.playlist[self.current_track_index]}'.")
+                if self._shuffle_perm is not None:
+                    self.current_track_index = self._next_shuffled_index()
+                else:
+                    self.current_track_index = (self.current_track_index + 1) % n
+                track_index = self.current_track_index
+                track_path = self._track_path(track_index)
+            # Hand the track to pygame outside the lock so rapid skips do not contend on it.
+            self.logger.debug(f"Moving to next track index {track_index}: {track_path}.")
+            self._m_load(track_path)
+            self._m_play()
+            self.logger.info(f"Playback started for '{track_path}'.")
             return True
         except Exception as e:
             self.logger.error(f"Error moving to the next track: {e}", exc_info=True)
@@ -201,14 +398,23 @@ class MusicPlayerService:
         """
         try:
             with self.lock:
-                if not self.playlist:
+                n = len(self._names)
+                if not n:
                     self.logger.warning("Playlist is empty. Load a playlist before proceeding to the previous track.")
                     return False
-                self.current_track_index = (self.current_track_index - 1) % len(self.playlist)
-                self.logger.debug(f"Moving to previous track index {self.current_track_index}: {self.playlist[self.current_track_index]}.")
-                mixer.music.load(self.playlist[self.current_track_index])
-                mixer.music.play()
-                self.logger.info(f"Playback started for '{self.playlist[self.current_track_index]}'.")
+                if self._shuffle_perm is not None:
+                    if self._shuffle_head > 1:
+                        self._shuffle_head -= 1
+                    self.current_track_index = self._shuffle_perm[max(self._shuffle_head - 1, 0)]
+                else:
+                    self.current_track_index = (self.current_track_index - 1) % n
+                track_index = self.current_track_index
+                track_path = self._track_path(track_index)
+            # Hand the track to pygame outside the lock so rapid skips do not contend on it.
+            self.logger.debug(f"Moving to previous track index {track_index}: {track_path}.")
+            self._m_load(track_path)
+            self._m_play()
+            self.logger.info(f"Playback started for '{track_path}'.")
             return True
         except Exception as e:
             self.logger.error(f"Error moving to the previous track: {e}", exc_info=True)
@@ -230,7 +436,7 @@ class MusicPlayerService:
                 return False
             with self.lock:
                 self.volume = volume
-                mixer.music.set_volume(self.volume)
+                self._m_set_volume(self.volume)
                 self.logger.info(f"Volume set to {self.volume * 100}%.")
             return True
         except Exception as e:
@@ -246,7 +452,7 @@ class MusicPlayerService:
         """
         try:
             with self.lock:
-                current_volume = mixer.music.get_volume()
+                current_volume = self._m_get_volume()
             self.logger.debug(f"Current volume is {current_volume * 100}%.")
             return current_volume
         except Exception as e:
@@ -264,20 +470,45 @@ class MusicPlayerService:
             bool: True if the track is added successfully, False otherwise.
         """
         try:
-            if not os.path.isfile(track_path):
+            if not self._is_regular_file(track_path):
                 self.logger.error(f"Track file '{track_path}' does not exist.")
                 return False
-            if not track_path.lower().endswith(self.SUPPORTED_FORMATS):
+            if not self._is_supported_audio(track_path):
                 self.logger.error(f"Unsupported audio format for file '{track_path}'.")
                 return False
             with self.lock:
-                self.playlist.append(track_path)
+                self._append_tracks([track_path])
                 self.logger.info(f"Track '{track_path}' added to the playlist.")
             return True
         except Exception as e:
             self.logger.error(f"Error adding track '{track_path}': {e}", exc_info=True)
             return False
 
+    def bulk_add_tracks(self, track_paths: Iterable[str]) -> int:
+        """
+        Adds multiple tracks to the playlist, skipping missing files and unsupported formats.
+        Logs a single summary instead of one entry per track.
+
+        Args:
+            track_paths (Iterable[str]): The file paths of the tracks to add.
+
+        Returns:
+            int: The number of tracks added.
+        """
+        try:
+            valid = [
+                path for path in track_paths
+                if self._is_supported_audio(path) and self._is_regular_file(path)
+            ]
+            if valid:
+                with self.lock:
+                    self._append_tracks(valid)
+            self.logger.info(f"Added {len(valid)} tracks to the playlist.")
+            return len(valid)
+        except Exception as e:
+            self.logger.error(f"Error adding tracks: {e}", exc_info=True)
+            return 0
+
     def remove_track(self, track_index: int) -> bool:
         """
         Removes a track from the playlist by its index.
@@ -290,11 +521,18 @@ class MusicPlayerService:
         """
         try:
             with self.lock:
-                if 0 <= track_index < len(self.playlist):
-                    removed_track = self.playlist.pop(track_index)
+                if 0 <= track_index < len(self._names):
+                    removed_track = self._track_path(track_index)
+                    del self._names[track_index]
+                    if self._shuffle_perm is not None:
+                        position = self._shuffle_perm.index(track_index)
+                        if position < self._shuffle_head:
+                            self._shuffle_head -= 1
+                        del self._shuffle_perm[position]
+                        self._shuffle_perm = [i - 1 if i > track_index else i for i in self._shuffle_perm]
                     self.logger.info(f"Track '{removed_track}' removed from the playlist.")
                     if track_index == self.current_track_index:
-                        mixer.music.stop()
+                        self._m_stop()
                         self.is_paused = False
                         self.current_track_index = -1
                         self.logger.debug("Current track was removed. Playback stopped.")
@@ -311,17 +549,19 @@ class MusicPlayerService:
 
     def shuffle_playlist(self) -> bool:
         """
-        Shuffles the current playlist randomly.
+        Shuffles the playback order of the current playlist randomly.
+        The order is drawn lazily as tracks are advanced, so shuffling is cheap
+        even for very large playlists.
 
         Returns:
             bool: True if the playlist is shuffled successfully, False otherwise.
         """
         try:
-            import random
             with self.lock:
-                random.shuffle(self.playlist)
-                self.current_track_index = 0 if self.playlist else -1
-                mixer.music.stop()
+                self._shuffle_perm = list(range(len(self._names)))
+                self._shuffle_head = 0
+                self.current_track_index = self._next_shuffled_index() if self._names else -1
+                self._m_stop()
                 self.is_paused = False
                 self.logger.info("Playlist shuffled successfully.")
             return True
@@ -340,11 +580,29 @@ class MusicPlayerService:
             bool: True if the playlist is saved successfully, False otherwise.
         """
         try:
-            import json
             with self.lock:
-                with open(file_path, 'w') as f:
-                    json.dump(self.playlist, f)
-                self.logger.info(f"Playlist saved to '{file_path}'.")
+                data = _dumps(self.playlist)
+            # Write to a temporary file in the target directory and atomically
+            # swap it in, so a crash mid-write never leaves a truncated playlist.
+            directory = os.path.dirname(file_path) or '.'
+            try:
+                mode = stat.S_IMODE(os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                mode = DEFAULT_FILE_MODE
+            with tempfile.NamedTemporaryFile('wb', dir=directory, delete=False) as tf:
+                tmp_path = tf.name
+                try:
+                    # Temporary files are created 0600; keep the playlist's own permissions across the swap
+                    os.chmod(tmp_path, mode)
+                    tf.write(data)
+                    tf.flush()
+                    os.fsync(tf.fileno())
+                except Exception:
+                    tf.close()
+                    os.unlink(tmp_path)
+                    raise
+            os.replace(tmp_path, file_path)
+            self.logger.info(f"Playlist saved to '{file_path}'.")
             return True
         except Exception as e:
             self.logger.error(f"Error saving playlist to '{file_path}': {e}", exc_info=True)
@@ -361,19 +619,22 @@ class MusicPlayerService:
             bool: True if the playlist is loaded successfully, False otherwise.
         """
         try:
-            import json
-            if not os.path.isfile(file_path):
+            try:
+                f = open(file_path, 'rb')
+            except (FileNotFoundError, IsADirectoryError):
                 self.logger.error(f"Playlist file '{file_path}' does not exist.")
                 return False
             with self.lock:
-                with open(file_path, 'r') as f:
+                with f:
                     loaded_playlist = json.load(f)
                 if not isinstance(loaded_playlist, list):
                     self.logger.error(f"Invalid playlist format in '{file_path}'.")
                     return False
-                self.playlist = loaded_playlist
-                self.current_track_index = 0 if self.playlist else -1
-                mixer.music.stop()
+                self._root = None
+                self._names = loaded_playlist
+                self._shuffle_perm = None
+                self.current_track_index = 0 if self._names else -1
+                self._m_stop()
                 self.is_paused = False
                 self.logger.info(f"Playlist loaded successfully from '{file_path}'.")
             return True
@@ -387,10 +648,29 @@ class MusicPlayerService:
         """
         try:
             self.logger.debug("Closing MusicPlayerService resources.")
-            mixer.music.stop()
+            self._finalizer.detach()
+            self._scan_executor.shutdown(wait=False)
+            self._m_stop()
             mixer.quit()
             pygame.quit()
             self.logger.info("MusicPlayerService closed successfully.")
         except Exception as e:
             self.logger.error(f"Error closing MusicPlayerService: {e}", exc_info=True)
             raise MusicPlayerServiceError(f"Error closing MusicPlayerService: {e}")
+
+    @staticmethod
+    def _static_close(scan_executor: ThreadPoolExecutor):
+        """
+        Shuts down the pygame mixer and scan executor without touching the service instance.
+        Invoked by the finalizer when the service is collected or the interpreter exits.
+
+        Args:
+            scan_executor (ThreadPoolExecutor): The executor used for directory scans.
+        """
+        try:
+            scan_executor.shutdown(wait=False)
+            mixer.music.stop()
+            mixer.quit()
+            pygame.quit()
+        except Exception:
+            pass
@@ -1,16 +1,61 @@
 # services/news_aggregation_service.py
 
+import asyncio
+import hashlib
+import json
 import logging
+import math
 import threading
 import time
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+from urllib.parse import urlencode
+import aiohttp
+import redis
 import requests
-from datetime import datetime, timedelta
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter, Retry
 from modules.utilities.logging_manager import setup_logging
 from modules.utilities.config_loader import ConfigLoader
 from modules.security.encryption_manager import EncryptionManager
 from modules.security.authentication import AuthenticationManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library encoder
+
+REDIS_KEY_PREFIX = 'news:'
+REDIS_RETRY_INTERVAL = 30  # seconds to wait before retrying Redis after an error
+STALE_RETRY_BACKOFF = 60  # seconds a stale entry is treated as fresh after an upstream failure
+NEGATIVE_CACHE_TTL = 2  # seconds an API error payload is cached to absorb retry bursts
+DEFAULT_READ_TIMEOUTS = {'sources': 5, 'top-headlines': 8, 'everything': 15}  # seconds per endpoint
+HTTP_RETRIES = 3  # upstream connection and status retries per request
+HTTP_BACKOFF_FACTOR = 0.3  # urllib3 backoff factor between retries
+
+# (endpoint, sorted query parameter items)
+CacheKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+# (data, fresh_until, stale_until, etag, last_modified)
+CacheEntry = Tuple[Dict[str, Any], float, float, Optional[str], Optional[str]]
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serializes an object to JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Deserializes JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class NewsAggregationServiceError(Exception):
     """Custom exception for NewsAggregationService-related errors."""
     pass
@@ -22,6 +67,14 @@ class NewsAggregationService:
     Ensures secure handling of API keys and configurations.
     """
 
+    __slots__ = (
+        'logger', 'config_loader', 'encryption_manager', 'auth_manager', 'api_key', 'base_url', '_urls', '_timeouts',
+        'cache_duration', '_ttl_by_endpoint', 'stale_grace', 'cache_max_entries', 'cache',
+        'supported_sources', 'supported_categories', 'lock', '_session', '_aio_session',
+        '_redis', '_redis_retry_at', '_refreshing', '_refresh_executor', '_executor',
+        '_inflight', '_inflight_lock'
+    )
+
     def __init__(self):
         """
         Initializes the NewsAggregationService with necessary configurations and authentication.
@@ -32,13 +85,187 @@ class NewsAggregationService:
         self.auth_manager = AuthenticationManager()
         self.api_key = self._load_api_key()
         self.base_url = self.config_loader.get('NEWS_API_BASE_URL', 'https://newsapi.org/v2')
+        self._urls: Dict[str, str] = {
+            endpoint: f"{self.base_url}/{endpoint}" for endpoint in ('top-headlines', 'everything', 'sources')
+        }
+        self._timeouts = self._load_timeouts()
         self.cache_duration = self.config_loader.get('NEWS_CACHE_DURATION', 1800)  # in seconds (30 minutes)
-        self.cache: Dict[str, Any] = {}
+        # Per-endpoint freshness: sources rarely change, headlines should refresh quickly.
+        self._ttl_by_endpoint: Dict[str, int] = self.config_loader.get(
+            'NEWS_CACHE_TTL_BY_ENDPOINT', {'sources': 3600, 'top-headlines': 300, 'everything': 900}
+        )
+        self.stale_grace = self.config_loader.get('NEWS_STALE_GRACE', 3600)  # seconds expired data may still be served
+        self.cache_max_entries = self.config_loader.get('NEWS_CACHE_MAX_ENTRIES', 1024)
+        self.cache: TTLCache = self._new_memory_cache()
         self.supported_sources = self._load_supported_sources()
         self.supported_categories = self._load_supported_categories()
         self.lock = threading.Lock()
+        self._session = self._initialize_session()
+        self._aio_session: Optional[aiohttp.ClientSession] = None
+        self._redis = self._initialize_redis()
+        self._redis_retry_at = 0.0
+        self._refreshing: Set[CacheKey] = set()
+        self._inflight: Dict[CacheKey, Future] = {}
+        self._inflight_lock = threading.Lock()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='news-refresh')
+        self._executor = ThreadPoolExecutor(max_workers=self.config_loader.get('NEWS_WORKERS', 8), thread_name_prefix='news-fetch')
         self.logger.info("NewsAggregationService initialized successfully.")
 
+    def _load_timeouts(self) -> Dict[str, Tuple[float, float]]:
+        """
+        Loads the (connect, read) timeout budget for each endpoint. The connect timeout
+        comes from NEWS_CONNECT_TIMEOUT and read timeouts from NEWS_READ_TIMEOUT_<ENDPOINT>.
+
+        Returns:
+            Dict[str, Tuple[float, float]]: The timeout budgets keyed by endpoint.
+        """
+        connect_timeout = self.config_loader.get('NEWS_CONNECT_TIMEOUT', 3.05)
+        return {
+            endpoint: (
+                connect_timeout,
+                self.config_loader.get(f"NEWS_READ_TIMEOUT_{endpoint.upper().replace('-', '_')}", read_timeout)
+            )
+            for endpoint, read_timeout in DEFAULT_READ_TIMEOUTS.items()
+        }
+
+    def _timeout(self, endpoint: str) -> Tuple[float, float]:
+        """
+        Returns the (connect, read) timeout budget for an endpoint.
+
+        Args:
+            endpoint (str): The API endpoint.
+
+        Returns:
+            Tuple[float, float]: The connect and read timeouts in seconds.
+        """
+        return self._timeouts.get(endpoint) or (self.config_loader.get('NEWS_CONNECT_TIMEOUT', 3.05), 10)
+
+    def _inflight_wait_timeout(self, endpoint: str) -> float:
+        """
+        Returns how long a caller waits for a concurrent fetch of the same key: the leader's
+        worst case of every retry attempt using its full connect and read budget, plus backoff.
+
+        Args:
+            endpoint (str): The API endpoint.
+
+        Returns:
+            float: The wait timeout in seconds.
+        """
+        connect_timeout, read_timeout = self._timeout(endpoint)
+        backoff = sum(HTTP_BACKOFF_FACTOR * 2 ** retry for retry in range(HTTP_RETRIES))
+        return (HTTP_RETRIES + 1) * (connect_timeout + read_timeout) + backoff
+
+    def _new_memory_cache(self) -> TTLCache:
+        """
+        Creates the in-memory cache. Entries are kept past their longest fresh
+        lifetime so they can still be served stale.
+
+        Returns:
+            TTLCache: An empty in-memory cache.
+        """
+        longest_ttl = max([self.cache_duration, *self._ttl_by_endpoint.values()])
+        return TTLCache(maxsize=self.cache_max_entries, ttl=longest_ttl + self.stale_grace)
+
+    def _cache_ttl(self, endpoint: str) -> int:
+        """
+        Returns how long responses from an endpoint stay fresh.
+
+        Args:
+            endpoint (str): The API endpoint.
+
+        Returns:
+            int: The cache lifetime in seconds.
+        """
+        return self._ttl_by_endpoint.get(endpoint, self.cache_duration)
+
+    def _initialize_session(self) -> requests.Session:
+        """
+        Initializes a pooled requests session so consecutive API calls reuse keep-alive connections.
+
+        Returns:
+            requests.Session: The configured session object.
+
+        Raises:
+            NewsAggregationServiceError: If the session cannot be initialized.
+        """
+        try:
+            self.logger.debug("Initializing HTTP session for news API requests.")
+            session = requests.Session()
+            session.headers.update({'User-Agent': 'NewsAggregationService/1.0'})
+            # Sent with every request, so the key never has to be added to caller params.
+            session.params = {'apiKey': self.api_key}
+            # Connection failures are retried, read timeouts are not: a request that
+            # timed out mid-read has already cost its full read budget.
+            retries = Retry(total=HTTP_RETRIES,
+                            connect=HTTP_RETRIES,
+                            read=0,
+                            backoff_factor=HTTP_BACKOFF_FACTOR,
+                            status_forcelist=[429, 500, 502, 503, 504])
+            adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self.logger.debug("HTTP session initialized successfully.")
+            return session
+        except Exception as e:
+            self.logger.error(f"Error initializing HTTP session: {e}", exc_info=True)
+            raise NewsAggregationServiceError(f"Error initializing HTTP session: {e}")
+
+    def _initialize_redis(self) -> Optional[redis.Redis]:
+        """
+        Initializes a pooled Redis client used as the shared cache across worker processes.
+
+        Returns:
+            Optional[redis.Redis]: The Redis client, or None if it cannot be configured.
+        """
+        try:
+            self.logger.debug("Initializing Redis connection pool for the news cache.")
+            pool = redis.ConnectionPool(
+                host=self.config_loader.get('REDIS_HOST', 'localhost'),
+                port=self.config_loader.get('REDIS_PORT', 6379),
+                max_connections=20,
+                socket_connect_timeout=1,
+                socket_timeout=1
+            )
+            return redis.Redis(connection_pool=pool)
+        except Exception as e:
+            self.logger.error(f"Error initializing Redis client, using in-memory cache only: {e}", exc_info=True)
+            return None
+
+    def _redis_available(self) -> bool:
+        """
+        Checks whether the Redis cache should be used for the next operation.
+
+        Returns:
+            bool: True if Redis is configured and not backing off after an error.
+        """
+        return self._redis is not None and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, error: Exception):
+        """
+        Records a Redis error and backs off to the in-memory cache for a while.
+
+        Args:
+            error (Exception): The Redis error that occurred.
+        """
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        self.logger.warning(f"Redis cache unavailable, falling back to in-memory cache: {error}")
+
+    def _get_aio_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the shared aiohttp session, creating it on first use inside the running event loop.
+
+        Returns:
+            aiohttp.ClientSession: The shared asynchronous HTTP session.
+        """
+        if self._aio_session is None or self._aio_session.closed:
+            self.logger.debug("Initializing aiohttp session for news API requests.")
+            self._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+                headers={'User-Agent': 'NewsAggregationService/1.0'},
+                timeout=aiohttp.ClientTimeout(sock_connect=3.05, sock_read=10)
+            )
+        return self._aio_session
+
     def _load_api_key(self) -> str:
         """
         Loads and decrypts the news API key from the configuration.
@@ -62,76 +289,71 @@ class NewsAggregationService:
             self.logger.error(f"Error loading news API key: {e}", exc_info=True)
             raise NewsAggregationServiceError(f"Error loading news API key: {e}")
 
-    def _load_supported_sources(self) -> List[str]:
+    def _load_supported_sources(self) -> FrozenSet[str]:
         """
         Loads supported news sources from configuration.
 
         Returns:
-            List[str]: A list of supported news source identifiers.
+            FrozenSet[str]: The supported news source identifiers.
         """
         try:
             self.logger.debug("Loading supported news sources from configuration.")
-            sources = self.config_loader.get('SUPPORTED_NEWS_SOURCES', [])
-            self.logger.debug(f"Supported news sources loaded: {sources}")
+            sources = frozenset(self.config_loader.get('SUPPORTED_NEWS_SOURCES', []))
+            self.logger.debug("Supported news sources loaded: %s", sources)
             return sources
         except Exception as e:
             self.logger.error(f"Error loading supported news sources: {e}", exc_info=True)
-            return []
+            return frozenset()
 
-    def _load_supported_categories(self) -> List[str]:
+    def _load_supported_categories(self) -> FrozenSet[str]:
         """
         Loads supported news categories from configuration.
 
         Returns:
-            List[str]: A list of supported news categories.
+            FrozenSet[str]: The supported news categories.
         """
         try:
             self.logger.debug("Loading supported news categories from configuration.")
-            categories = self.config_loader.get('SUPPORTED_NEWS_CATEGORIES', [])
-            self.logger.debug(f"Supported news categories loaded: {categories}")
+            categories = frozenset(self.config_loader.get('SUPPORTED_NEWS_CATEGORIES', []))
+            self.logger.debug("Supported news categories loaded: %s", categories)
             return categories
         except Exception as e:
             self.logger.error(f"Error loading supported news categories: {e}", exc_info=True)
-            return []
+            return frozenset()
 
-    def _get_cache_key(self, endpoint: str, params: Dict[str, Any]) -> str:
+    def _get_cache_key(self, endpoint: str, params: Dict[str, Any]) -> CacheKey:
         """
-        Generates a unique cache key based on the endpoint and parameters.
+        Generates a unique cache key based on the endpoint and parameters. The key is
+        a plain tuple so it can be used directly as a dictionary key without hashing.
 
         Args:
             endpoint (str): The API endpoint.
             params (Dict[str, Any]): The query parameters.
 
         Returns:
-            str: The generated cache key.
+            CacheKey: The generated cache key.
         """
-        import hashlib
-        import json
+        return endpoint, tuple(sorted(item for item in params.items() if item[0] != 'apiKey'))
 
-        hash_input = f"{endpoint}_{json.dumps(params, sort_keys=True)}".encode('utf-8')
-        cache_key = hashlib.md5(hash_input).hexdigest()
-        self.logger.debug(f"Generated cache key: {cache_key} for endpoint: '{endpoint}' with params: {params}")
-        return cache_key
-
-    def _is_cache_valid(self, timestamp: float) -> bool:
+    @staticmethod
+    def _redis_key(cache_key: CacheKey) -> str:
         """
-        Checks if the cached data is still valid based on the cache duration.
+        Derives the Redis key for a cache key.
 
         Args:
-            timestamp (float): The timestamp when the data was cached.
+            cache_key (CacheKey): The cache key.
 
         Returns:
-            bool: True if the cache is valid, False otherwise.
+            str: The namespaced Redis key.
         """
-        import time
-        current_time = time.time()
-        is_valid = (current_time - timestamp) < self.cache_duration
-        self.logger.debug(f"Cache validity check: {is_valid} (current_time={current_time}, cached_time={timestamp})")
-        return is_valid
+        return REDIS_KEY_PREFIX + hashlib.blake2b(repr(cache_key).encode('utf-8'), digest_size=16).hexdigest()
 
     def _fetch_news_data(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Fetches news data from the external API with caching.
+        Fetches news data from the external API with caching. Expired entries are
+        served stale while a background refresh runs, and are used as a fallback
+        when the upstream API fails. Concurrent misses on the same key share a
+        single upstream request.
 
         Args:
             endpoint (str): The API endpoint.
@@ -141,34 +363,378 @@ class NewsAggregationService:
             Optional[Dict[str, Any]]: The news data, or None if fetching fails.
         """
         cache_key = self._get_cache_key(endpoint, params)
-        with self.lock:
-            if cache_key in self.cache:
-                cached_response, timestamp = self.cache[cache_key]
-                if self._is_cache_valid(timestamp):
-                    self.logger.debug(f"Returning cached data for key '{cache_key}'.")
-                    return cached_response
-                else:
-                    self.logger.debug(f"Cache expired for key '{cache_key}'. Removing from cache.")
-                    del self.cache[cache_key]
-
-        url = f"{self.base_url}/{endpoint}"
-        params['apiKey'] = self.api_key
+        entry = self._get_cached(cache_key)
+        if entry is not None:
+            if entry[1] > time.monotonic():
+                self.logger.debug("Cache HIT-FRESH for key '%s'.", cache_key)
+                return entry[0]
+            if self._serve_stale(endpoint, params, cache_key, entry):
+                return entry[0]
+        self.logger.debug("Cache MISS for key '%s'.", cache_key)
+
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[cache_key] = future
+        if not is_leader:
+            self.logger.debug("Waiting for in-flight fetch of key '%s'.", cache_key)
+            try:
+                return future.result(timeout=self._inflight_wait_timeout(endpoint))
+            except FutureTimeoutError:
+                self.logger.error("Timed out waiting for in-flight fetch of key '%s'.", cache_key)
+                return None
+
+        data = None
         try:
-            self.logger.debug(f"Fetching news data from '{url}' with params: {params}")
-            response = requests.get(url, params=params, timeout=10)
+            data = self._request_news_data(endpoint, params, cache_key, entry)
+            return data
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
+            future.set_result(data)
+
+    def _request_news_data(self, endpoint: str, params: Dict[str, Any], cache_key: CacheKey,
+                           stale_entry: Optional[CacheEntry] = None) -> Optional[Dict[str, Any]]:
+        """
+        Requests news data from the external API and caches the response.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (Dict[str, Any]): The query parameters.
+            cache_key (CacheKey): The cache key for the response.
+            stale_entry (Optional[CacheEntry], optional): A stale cache entry used to
+                revalidate with a conditional GET and served if the request fails. Defaults to None.
+
+        Returns:
+            Optional[Dict[str, Any]]: The news data, or None if fetching fails.
+        """
+        url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint}"
+        try:
+            self.logger.debug("Fetching news data from '%s' with params: %s", url, params)
+            response = self._session.get(url, params=params, headers=self._conditional_headers(stale_entry),
+                                         timeout=self._timeout(endpoint))
+            if response.status_code == 304 and stale_entry is not None:
+                return self._revalidated(endpoint, cache_key, stale_entry)
+            if response.status_code >= 400:
+                self._cache_error_body(endpoint, cache_key, response.content)
             response.raise_for_status()
-            data = response.json()
-            with self.lock:
-                self.cache[cache_key] = (data, time.time())
+            data = _loads(response.content)
+            self._cache_response(endpoint, cache_key, data,
+                                 response.headers.get('ETag'), response.headers.get('Last-Modified'))
             self.logger.info(f"News data fetched successfully from '{url}'.")
             return data
         except requests.exceptions.RequestException as e:
+            if stale_entry is not None:
+                return self._serve_stale_on_error(cache_key, stale_entry, e)
+            self.logger.error(f"HTTP request error when fetching news data: {e}", exc_info=True)
+            return None
+        except Exception as e:
+            self.logger.error(f"Unexpected error when fetching news data: {e}", exc_info=True)
+            return None
+
+    async def _afetch_news_data(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Asynchronously fetches news data from the external API with caching.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (Dict[str, Any]): The query parameters.
+
+        Returns:
+            Optional[Dict[str, Any]]: The news data, or None if fetching fails.
+        """
+        cache_key = self._get_cache_key(endpoint, params)
+        # The cache helpers make blocking Redis calls, so they run off the event loop
+        entry = await asyncio.to_thread(self._get_cached, cache_key)
+        if entry is not None:
+            if entry[1] > time.monotonic():
+                self.logger.debug("Cache HIT-FRESH for key '%s'.", cache_key)
+                return entry[0]
+            if self._serve_stale(endpoint, params, cache_key, entry):
+                return entry[0]
+        self.logger.debug("Cache MISS for key '%s'.", cache_key)
+
+        url = self._urls.get(endpoint) or f"{self.base_url}/{endpoint}"
+        # aiohttp rejects None query values, which requests silently drops.
+        query = {key: value for key, value in params.items() if value is not None}
+        query['apiKey'] = self.api_key
+        try:
+            self.logger.debug("Fetching news data asynchronously from '%s' with params: %s", url, params)
+            connect_timeout, read_timeout = self._timeout(endpoint)
+            timeout = aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+            async with self._get_aio_session().get(url, params=query, headers=self._conditional_headers(entry),
+                                                   timeout=timeout) as response:
+                if response.status == 304 and entry is not None:
+                    return await asyncio.to_thread(self._revalidated, endpoint, cache_key, entry)
+                if response.status >= 400:
+                    await asyncio.to_thread(self._cache_error_body, endpoint, cache_key, await response.read())
+                response.raise_for_status()
+                data = _loads(await response.read())
+                etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+            await asyncio.to_thread(self._cache_response, endpoint, cache_key, data, etag, last_modified)
+            self.logger.info(f"News data fetched successfully from '{url}'.")
+            return data
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if entry is not None:
+                return await asyncio.to_thread(self._serve_stale_on_error, cache_key, entry, e)
             self.logger.error(f"HTTP request error when fetching news data: {e}", exc_info=True)
             return None
         except Exception as e:
             self.logger.error(f"Unexpected error when fetching news data: {e}", exc_info=True)
             return None
 
+    @staticmethod
+    def _conditional_headers(entry: Optional[CacheEntry]) -> Optional[Dict[str, str]]:
+        """
+        Builds conditional GET headers from the validators of a cached entry.
+
+        Args:
+            entry (Optional[CacheEntry]): The cached entry, if any.
+
+        Returns:
+            Optional[Dict[str, str]]: The If-None-Match/If-Modified-Since headers, or None if there are no validators.
+        """
+        if entry is None:
+            return None
+        headers = {}
+        if entry[3]:
+            headers['If-None-Match'] = entry[3]
+        if entry[4]:
+            headers['If-Modified-Since'] = entry[4]
+        return headers or None
+
+    def _revalidated(self, endpoint: str, cache_key: CacheKey, entry: CacheEntry) -> Dict[str, Any]:
+        """
+        Renews a cached entry after the API answered 304 Not Modified.
+
+        Args:
+            endpoint (str): The API endpoint.
+            cache_key (CacheKey): The cache key.
+            entry (CacheEntry): The cached entry that is still current.
+
+        Returns:
+            Dict[str, Any]: The cached news data.
+        """
+        self.logger.debug("Cache entry '%s' not modified upstream. Extending its lifetime.", cache_key)
+        self._store_cached(cache_key, entry[0], self._cache_ttl(endpoint), etag=entry[3], last_modified=entry[4])
+        return entry[0]
+
+    def _serve_stale(self, endpoint: str, params: Dict[str, Any], cache_key: CacheKey,
+                     entry: CacheEntry) -> bool:
+        """
+        Decides whether an expired cache entry can still be served stale, scheduling
+        a background refresh when it can.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (Dict[str, Any]): The query parameters.
+            cache_key (CacheKey): The cache key.
+            entry (CacheEntry): The cached data with its fresh-until and
+                stale-until times on the monotonic clock.
+
+        Returns:
+            bool: True if the cached data should be returned, False otherwise.
+        """
+        if time.monotonic() < entry[2]:
+            self.logger.debug("Cache HIT-STALE for key '%s'. Scheduling refresh.", cache_key)
+            self._schedule_refresh(endpoint, params, cache_key, entry)
+            return True
+        return False
+
+    def _serve_stale_on_error(self, cache_key: CacheKey, stale_entry: CacheEntry,
+                              error: Exception) -> Optional[Dict[str, Any]]:
+        """
+        Serves a stale cache entry after an upstream failure and extends its lease
+        briefly so the upstream API is not hammered while it is down.
+
+        Negative-cached API error payloads are never served stale; their lease is
+        renewed for the negative-cache TTL only and the fetch fails as it would uncached.
+
+        Args:
+            cache_key (CacheKey): The cache key.
+            stale_entry (CacheEntry): The stale cache entry.
+            error (Exception): The upstream error.
+
+        Returns:
+            Optional[Dict[str, Any]]: The stale news data, or None if the entry is an error payload.
+        """
+        if stale_entry[0].get('status') == 'error':
+            self.logger.error(f"HTTP request error when fetching news data: {error}", exc_info=error)
+            self._store_cached(cache_key, stale_entry[0], NEGATIVE_CACHE_TTL, stale_grace=0)
+            return None
+        self.logger.warning(f"HTTP request error when fetching news data, serving stale cache for key '{cache_key}': {error}")
+        self._store_cached(cache_key, stale_entry[0], STALE_RETRY_BACKOFF,
+                           etag=stale_entry[3], last_modified=stale_entry[4])
+        return stale_entry[0]
+
+    def _schedule_refresh(self, endpoint: str, params: Dict[str, Any], cache_key: CacheKey,
+                          entry: CacheEntry):
+        """
+        Submits a background refresh of a stale cache entry, unless one is already running.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (Dict[str, Any]): The query parameters.
+            cache_key (CacheKey): The cache key.
+            entry (CacheEntry): The stale cache entry.
+        """
+        with self.lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+        try:
+            self._refresh_executor.submit(self._background_refresh, endpoint, dict(params), cache_key, entry)
+        except RuntimeError:
+            # The executor has been shut down; the stale entry is still served.
+            with self.lock:
+                self._refreshing.discard(cache_key)
+
+    def _background_refresh(self, endpoint: str, params: Dict[str, Any], cache_key: CacheKey,
+                            entry: CacheEntry):
+        """
+        Refreshes a stale cache entry from the upstream API.
+
+        Args:
+            endpoint (str): The API endpoint.
+            params (Dict[str, Any]): The query parameters.
+            cache_key (CacheKey): The cache key.
+            entry (CacheEntry): The stale cache entry.
+        """
+        try:
+            self._request_news_data(endpoint, params, cache_key, entry)
+        finally:
+            with self.lock:
+                self._refreshing.discard(cache_key)
+
+    def _get_cached(self, cache_key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Returns the cache entry for a key, checking the shared Redis cache first and
+        the in-memory cache second. The entry may be stale.
+
+        Args:
+            cache_key (CacheKey): The cache key.
+
+        Returns:
+            Optional[CacheEntry]: The cached data with its fresh-until and
+            stale-until times, or None on a miss.
+        """
+        if self._redis_available():
+            try:
+                cached = self._redis.get(self._redis_key(cache_key))
+                if cached is not None:
+                    # Redis entries carry wall-clock times so they can be shared across
+                    # processes; convert them to this process's monotonic clock.
+                    data, fresh_until, stale_until, etag, last_modified = _loads(cached)
+                    offset = time.monotonic() - time.time()
+                    return data, fresh_until + offset, stale_until + offset, etag, last_modified
+            except redis.RedisError as e:
+                self._redis_failed(e)
+        # TTLCache expires entries itself, but reorders on every read, so the
+        # lookup has to stay under the lock.
+        with self.lock:
+            return self.cache.get(cache_key)
+
+    def _cache_response(self, endpoint: str, cache_key: CacheKey, data: Dict[str, Any],
+                        etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Caches a fetched response according to its content: successful non-empty results
+        use the endpoint TTL, API error payloads are cached only briefly and are never
+        served stale, and empty results are not cached.
+
+        Args:
+            endpoint (str): The API endpoint.
+            cache_key (CacheKey): The cache key.
+            data (Dict[str, Any]): The news data returned by the API.
+            etag (Optional[str], optional): The ETag response header. Defaults to None.
+            last_modified (Optional[str], optional): The Last-Modified response header. Defaults to None.
+        """
+        status = data.get('status')
+        if status == 'ok' and data.get('totalResults', 1) > 0:
+            self._store_cached(cache_key, data, self._cache_ttl(endpoint), etag=etag, last_modified=last_modified)
+        elif status == 'error':
+            self.logger.debug("Negative-caching error response for key '%s'.", cache_key)
+            self._store_cached(cache_key, data, NEGATIVE_CACHE_TTL, stale_grace=0)
+        else:
+            self.logger.debug("Not caching empty response for key '%s'.", cache_key)
+
+    def _cache_error_body(self, endpoint: str, cache_key: CacheKey, body: bytes):
+        """
+        Negative-caches the API error payload of a 4xx/5xx response before its status is raised.
+        Bodies that are not an API error payload, such as proxy error pages, are not cached.
+
+        Args:
+            endpoint (str): The API endpoint.
+            cache_key (CacheKey): The cache key.
+            body (bytes): The raw response body.
+        """
+        try:
+            data = _loads(body)
+        except ValueError:
+            return
+        if isinstance(data, dict) and data.get('status') == 'error':
+            self._cache_response(endpoint, cache_key, data)
+
+    def _store_cached(self, cache_key: CacheKey, data: Dict[str, Any], ttl: float, stale_grace: Optional[float] = None,
+                      etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        Stores a fetched response in the shared Redis cache, or in the in-memory
+        cache when Redis is unavailable.
+
+        Args:
+            cache_key (CacheKey): The cache key.
+            data (Dict[str, Any]): The news data to cache.
+            ttl (float): Seconds the data stays fresh.
+            stale_grace (Optional[float], optional): Seconds the data may be served stale afterwards.
+                Defaults to the configured stale grace.
+            etag (Optional[str], optional): The upstream ETag for conditional revalidation. Defaults to None.
+            last_modified (Optional[str], optional): The upstream Last-Modified value. Defaults to None.
+        """
+        now = time.monotonic()
+        fresh_until = now + ttl
+        stale_until = fresh_until + (self.stale_grace if stale_grace is None else stale_grace)
+        entry = (data, fresh_until, stale_until, etag, last_modified)
+        if self._redis_available():
+            try:
+                offset = time.time() - now
+                wall_entry = (data, fresh_until + offset, stale_until + offset, etag, last_modified)
+                self._redis.setex(self._redis_key(cache_key), math.ceil(stale_until - now), _dumps(wall_entry))
+                return
+            except redis.RedisError as e:
+                self._redis_failed(e)
+        with self.lock:
+            self.cache[cache_key] = entry
+
+    def fetch_many(self, queries: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetches news data for several endpoint queries concurrently.
+
+        Args:
+            queries (List[Tuple[str, Dict[str, Any]]]): A list of (endpoint, params) pairs.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: The news data for each query, in order, with None for failed fetches.
+        """
+        return list(self._executor.map(lambda query: self._fetch_news_data(*query), queries))
+
+    def get_many_headlines(self, queries: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Retrieves top headlines for several country/category combinations concurrently.
+
+        Args:
+            queries (List[Dict[str, Any]]): A list of keyword arguments accepted by get_top_headlines.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: The top headlines data for each query, in order, with None for failed fetches.
+        """
+        return self.fetch_many([
+            ('top-headlines', self._build_top_headlines_params(
+                query.get('country', 'us'), query.get('category'), query.get('sources'), query.get('page_size', 20)
+            ))
+            for query in queries
+        ])
+
     def get_top_headlines(self, country: str = 'us', category: Optional[str] = None, sources: Optional[List[str]] = None, page_size: int = 20) -> Optional[Dict[str, Any]]:
         """
         Retrieves the top news headlines for a specified country and category.
@@ -182,18 +748,41 @@ class NewsAggregationService:
         Returns:
             Optional[Dict[str, Any]]: The top headlines data, or None if retrieval fails.
         """
-        endpoint = 'top-headlines'
+        return self._fetch_news_data('top-headlines', self._build_top_headlines_params(country, category, sources, page_size))
+
+    async def aget_top_headlines(self, country: str = 'us', category: Optional[str] = None, sources: Optional[List[str]] = None, page_size: int = 20) -> Optional[Dict[str, Any]]:
+        """
+        Asynchronously retrieves the top news headlines for a specified country and category.
+
+        Args:
+            country (str, optional): The country code (e.g., 'us', 'gb'). Defaults to 'us'.
+            category (Optional[str], optional): The news category (e.g., 'business', 'technology'). Defaults to None.
+            sources (Optional[List[str]], optional): A list of news sources. Defaults to None.
+            page_size (int, optional): The number of articles to retrieve. Defaults to 20.
+
+        Returns:
+            Optional[Dict[str, Any]]: The top headlines data, or None if retrieval fails.
+        """
+        return await self._afetch_news_data('top-headlines', self._build_top_headlines_params(country, category, sources, page_size))
+
+    def _build_top_headlines_params(self, country: str, category: Optional[str], sources: Optional[List[str]], page_size: int) -> Dict[str, Any]:
+        """
+        Builds the query parameters for the top-headlines endpoint.
+
+        Returns:
+            Dict[str, Any]: The query parameters.
+        """
         params = {
             'country': country,
             'pageSize': page_size
         }
         if category and category in self.supported_categories:
             params['category'] = category
-        if sources and all(source in self.supported_sources for source in sources):
+        if sources and self.supported_sources.issuperset(sources):
             params['sources'] = ','.join(sources)
         elif sources:
             self.logger.warning("One or more specified sources are not supported.")
-        return self._fetch_news_data(endpoint, params)
+        return params
 
     def search_news(self, query: str, from_date: Optional[str] = None, to_date: Optional[str] = None, language: Optional[str] = 'en', sort_by: Optional[str] = 'relevancy', page_size: int = 20) -> Optional[Dict[str, Any]]:
         """
@@ -210,7 +799,32 @@ class NewsAggregationService:
         Returns:
             Optional[Dict[str, Any]]: The search results data, or None if retrieval fails.
         """
-        endpoint = 'everything'
+        return self._fetch_news_data('everything', self._build_search_params(query, from_date, to_date, language, sort_by, page_size))
+
+    async def asearch_news(self, query: str, from_date: Optional[str] = None, to_date: Optional[str] = None, language: Optional[str] = 'en', sort_by: Optional[str] = 'relevancy', page_size: int = 20) -> Optional[Dict[str, Any]]:
+        """
+        Asynchronously searches for news articles based on a query.
+
+        Args:
+            query (str): The search query.
+            from_date (Optional[str], optional): The start date in 'YYYY-MM-DD' format. Defaults to None.
+            to_date (Optional[str], optional): The end date in 'YYYY-MM-DD' format. Defaults to None.
+            language (Optional[str], optional): The language code. Defaults to 'en'.
+            sort_by (Optional[str], optional): The sort order ('relevancy', 'popularity', 'publishedAt'). Defaults to 'relevancy'.
+            page_size (int, optional): The number of articles to retrieve. Defaults to 20.
+
+        Returns:
+            Optional[Dict[str, Any]]: The search results data, or None if retrieval fails.
+        """
+        return await self._afetch_news_data('everything', self._build_search_params(query, from_date, to_date, language, sort_by, page_size))
+
+    def _build_search_params(self, query: str, from_date: Optional[str], to_date: Optional[str], language: Optional[str], sort_by: Optional[str], page_size: int) -> Dict[str, Any]:
+        """
+        Builds the query parameters for the everything endpoint.
+
+        Returns:
+            Dict[str, Any]: The query parameters.
+        """
         params = {
             'q': query,
             'language': language,
@@ -221,7 +835,7 @@ class NewsAggregationService:
             params['from'] = from_date
         if to_date:
             params['to'] = to_date
-        return self._fetch_news_data(endpoint, params)
+        return params
 
     def get_sources(self, category: Optional[str] = None, language: Optional[str] = None, country: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
@@ -235,7 +849,29 @@ class NewsAggregationService:
         Returns:
             Optional[Dict[str, Any]]: The sources data, or None if retrieval fails.
         """
-        endpoint = 'sources'
+        return self._fetch_news_data('sources', self._build_sources_params(category, language, country))
+
+    async def aget_sources(self, category: Optional[str] = None, language: Optional[str] = None, country: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Asynchronously retrieves the list of news sources available.
+
+        Args:
+            category (Optional[str], optional): The news category. Defaults to None.
+            language (Optional[str], optional): The language code. Defaults to None.
+            country (Optional[str], optional): The country code. Defaults to None.
+
+        Returns:
+            Optional[Dict[str, Any]]: The sources data, or None if retrieval fails.
+        """
+        return await self._afetch_news_data('sources', self._build_sources_params(category, language, country))
+
+    def _build_sources_params(self, category: Optional[str], language: Optional[str], country: Optional[str]) -> Dict[str, Any]:
+        """
+        Builds the query parameters for the sources endpoint.
+
+        Returns:
+            Dict[str, Any]: The query parameters.
+        """
         params = {}
         if category and category in self.supported_categories:
             params['category'] = category
@@ -243,18 +879,22 @@ class NewsAggregationService:
             params['language'] = language
         if country:
             params['country'] = country
-        return self._fetch_news_data(endpoint, params)
+        return params
 
-    def list_cached_data(self) -> Dict[str, Any]:
+    def list_cached_data(self) -> Dict[str, float]:
         """
-        Lists all cached news data.
+        Lists the news data held in the in-memory cache. Entries stored in Redis are not included.
 
         Returns:
-            Dict[str, Any]: A dictionary of cached data keys and their timestamps.
+            Dict[str, float]: The cached requests, as 'endpoint?query' strings, mapped to the Unix times
+            until which they are fresh.
         """
         try:
             self.logger.debug("Listing all cached news data.")
-            cached_keys = {key: value[1] for key, value in self.cache.items()}
+            offset = time.time() - time.monotonic()
+            with self.lock:
+                cached_keys = {f"{endpoint}?{urlencode(params)}": value[1] + offset
+                               for (endpoint, params), value in self.cache.items()}
             self.logger.info(f"Retrieved {len(cached_keys)} cached news data entries.")
             return cached_keys
         except Exception as e:
@@ -274,14 +914,19 @@ class NewsAggregationService:
         """
         try:
             cache_key = self._get_cache_key(endpoint, params)
+            removed = False
+            if self._redis_available():
+                try:
+                    removed = bool(self._redis.delete(self._redis_key(cache_key)))
+                except redis.RedisError as e:
+                    self._redis_failed(e)
             with self.lock:
-                if cache_key in self.cache:
-                    del self.cache[cache_key]
-                    self.logger.info(f"Cache entry '{cache_key}' cleared successfully.")
-                    return True
-                else:
-                    self.logger.warning(f"Cache entry '{cache_key}' does not exist.")
-                    return False
+                removed = self.cache.pop(cache_key, None) is not None or removed
+            if removed:
+                self.logger.info(f"Cache entry '{cache_key}' cleared successfully.")
+                return True
+            self.logger.warning(f"Cache entry '{cache_key}' does not exist.")
+            return False
         except Exception as e:
             self.logger.error(f"Error clearing cache entry '{cache_key}': {e}", exc_info=True)
             return False
@@ -295,6 +940,13 @@ class NewsAggregationService:
         """
         try:
             self.logger.debug("Clearing all cached news data.")
+            if self._redis_available():
+                try:
+                    keys = list(self._redis.scan_iter(match=REDIS_KEY_PREFIX + '*'))
+                    if keys:
+                        self._redis.delete(*keys)
+                except redis.RedisError as e:
+                    self._redis_failed(e)
             with self.lock:
                 self.cache.clear()
             self.logger.info("All cached news data cleared successfully.")
@@ -305,7 +957,8 @@ class NewsAggregationService:
 
     def set_cache_duration(self, duration: int) -> bool:
         """
-        Sets the duration for which cache entries are considered valid.
+        Sets the duration for which cache entries are considered valid, for endpoints
+        without their own entry in NEWS_CACHE_TTL_BY_ENDPOINT.
 
         Args:
             duration (int): The cache duration in seconds.
@@ -314,8 +967,14 @@ class NewsAggregationService:
             bool: True if the cache duration is set successfully, False otherwise.
         """
         try:
-            self.logger.debug(f"Setting cache duration to {duration} seconds.")
-            self.cache_duration = duration
+            self.logger.debug("Setting cache duration to %s seconds.", duration)
+            with self.lock:
+                # The TTL of a TTLCache is fixed, so existing entries are carried
+                # over into a new cache with the updated duration.
+                self.cache_duration = duration
+                cache = self._new_memory_cache()
+                cache.update(self.cache)
+                self.cache = cache
             self.logger.info(f"Cache duration set to {duration} seconds successfully.")
             return True
         except Exception as e:
@@ -328,8 +987,25 @@ class NewsAggregationService:
         """
         try:
             self.logger.debug("Closing NewsAggregationService resources.")
-            # Currently, no persistent resources to close
+            self._executor.shutdown(wait=True)
+            self._refresh_executor.shutdown(wait=False)
+            self._session.close()
+            if self._redis is not None:
+                self._redis.close()
             self.logger.info("NewsAggregationService closed successfully.")
         except Exception as e:
             self.logger.error(f"Error closing NewsAggregationService: {e}", exc_info=True)
             raise NewsAggregationServiceError(f"Error closing NewsAggregationService: {e}")
+
+    async def aclose_service(self):
+        """
+        Closes the asynchronous HTTP session along with the other resources held by the service.
+        """
+        try:
+            if self._aio_session is not None and not self._aio_session.closed:
+                await self._aio_session.close()
+            self._aio_session = None
+        except Exception as e:
+            self.logger.error(f"Error closing aiohttp session: {e}", exc_info=True)
+            raise NewsAggregationServiceError(f"Error closing aiohttp session: {e}")
+        self.close_service()
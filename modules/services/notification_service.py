@@ -1,26 +1,90 @@
 # services/notification_service.py
 
+import asyncio
 import logging
 import threading
-from typing import Any, Dict, List, Optional
+import warnings
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
 from datetime import datetime, timedelta
 import uuid
+import html
 import json
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean
-from sqlalchemy.orm import sessionmaker, relationship, declarative_base
-from sqlalchemy.exc import SQLAlchemyError
-import requests
+import re
+import aiosmtplib
+from email.message import EmailMessage
+from sqlalchemy import and_, bindparam, create_engine, func, inspect, or_, select, update, Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, Index
+from sqlalchemy.orm import sessionmaker, scoped_session, selectinload, relationship, declarative_base
+from sqlalchemy.exc import IntegrityError, SAWarning, SQLAlchemyError
+from sqlalchemy.schema import CreateIndex
+import httpx
 from modules.utilities.logging_manager import setup_logging
 from modules.utilities.config_loader import ConfigLoader
 from modules.security.encryption_manager import EncryptionManager
 from modules.security.authentication import AuthenticationManager
-from ui.templates import User
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library encoder
+
+HTTP_HOST_CONCURRENCY = 64  # in-flight requests allowed per SMS/push provider host
+HTTP_KEEPALIVE_EXPIRY = 120  # seconds an idle provider connection is kept open
+JSON_HEADERS = {'Content-Type': 'application/json'}
+IN_CLAUSE_CHUNK_SIZE = 500  # user IDs per IN (...) lookup in batch sends
+BULK_INSERT_CHUNK_SIZE = 500  # notification log rows per executemany insert and commit
+SMTP_KEEPALIVE_INTERVAL = 60  # seconds between NOOPs on the idle SMTP connection
+JOB_QUEUE_MAXSIZE = 10000  # queued notifications before send_*_notification blocks
+DEFAULT_WORKER_CONCURRENCY = 64  # notifications delivered at once by the worker pool
+STATUS_BATCH_SIZE = 500  # delivery outcomes written per executemany UPDATE
+STATUS_FLUSH_INTERVAL = 0.05  # seconds the status writer waits for a batch to fill
+
+# {{placeholder}} markup in template subjects and bodies
+_PH_RE = re.compile(r"\{\{(.+?)\}\}")
+# HTML tags, stripped to derive the plain-text part of emails
+_TAG_RE = re.compile(r"<[^>]+>")
 
 Base = declarative_base()
 
+
+def _user_model() -> Any:
+    """
+    Returns the User model, importing it on first use so that loading this module does not pull in
+    the UI template stack.
+    """
+    from ui.templates import User
+    return User
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serializes an object to JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+class _SendJob(NamedTuple):
+    """
+    A rendered notification waiting in the worker queue.
+    """
+    notification_id: str
+    user_id: str
+    channel: str
+    send: Callable[[Any], Awaitable[None]]
+    message: Any
+
+
+class _Placeholders(dict):
+    """
+    Placeholder mapping that leaves unknown placeholders untouched.
+    """
+
+    def __missing__(self, key: str) -> str:
+        return f"{{{{{key}}}}}"
+
+
 class NotificationTemplate(Base):
     __tablename__ = 'notification_templates'
 
@@ -31,6 +95,9 @@ class NotificationTemplate(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # Case-insensitive uniqueness backs the duplicate-name check in add_notification_template
+    __table_args__ = (Index('ix_tpl_name_lower', func.lower(name), unique=True),)
+
 class UserNotification(Base):
     __tablename__ = 'user_notifications'
 
@@ -38,13 +105,16 @@ class UserNotification(Base):
     user_id = Column(String, ForeignKey('users.id'), nullable=False)
     template_id = Column(String, ForeignKey('notification_templates.id'), nullable=False)
     sent_at = Column(DateTime, nullable=False)
-    status = Column(String, default='sent')  # sent, failed
+    status = Column(String, default='sent')  # queued, sent, failed
     error_message = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     template = relationship("NotificationTemplate")
     user = relationship("User", backref="notifications")
 
+    # Serves the per-user history query: equality on user_id, newest-first keyset on (sent_at, id)
+    __table_args__ = (Index('ix_usernotif_user_sent', user_id, sent_at.desc(), id.desc()),)
+
 class NotificationServiceError(Exception):
     """Custom exception for NotificationService-related errors."""
     pass
@@ -63,36 +133,88 @@ class NotificationService:
         """
         self.logger = setup_logging('NotificationService')
         self.config_loader = ConfigLoader()
+        # One snapshot of the configuration instead of a get() call (and debug log) per key
+        self.config = self.config_loader.get_all()
         self.encryption_manager = EncryptionManager()
         self.auth_manager = AuthenticationManager()
-        self.lock = threading.Lock()
         self._initialize_database()
-        self.session = self.Session()
-        self.email_server = self.config_loader.get('EMAIL_SERVER', 'smtp.gmail.com')
-        self.email_port = self.config_loader.get('EMAIL_PORT', 587)
-        self.email_username_encrypted = self.config_loader.get('EMAIL_USERNAME')
-        self.email_password_encrypted = self.config_loader.get('EMAIL_PASSWORD')
+        self.email_server = self.config.get('EMAIL_SERVER', 'smtp.gmail.com')
+        self.email_port = self.config.get('EMAIL_PORT', 587)
+        self.email_username_encrypted = self.config.get('EMAIL_USERNAME')
+        self.email_password_encrypted = self.config.get('EMAIL_PASSWORD')
         self.email_username = self.encryption_manager.decrypt_data(self.email_username_encrypted).decode('utf-8')
         self.email_password = self.encryption_manager.decrypt_data(self.email_password_encrypted).decode('utf-8')
-        self.sms_api_url = self.config_loader.get('SMS_API_URL', 'https://api.smsprovider.com/send')
-        self.sms_api_key_encrypted = self.config_loader.get('SMS_API_KEY')
+        self.sms_api_url = self.config.get('SMS_API_URL', 'https://api.smsprovider.com/send')
+        self.sms_api_key_encrypted = self.config.get('SMS_API_KEY')
         self.sms_api_key = self.encryption_manager.decrypt_data(self.sms_api_key_encrypted).decode('utf-8')
-        self.push_api_url = self.config_loader.get('PUSH_API_URL', 'https://api.pushservice.com/notify')
-        self.push_api_key_encrypted = self.config_loader.get('PUSH_API_KEY')
+        self.push_api_url = self.config.get('PUSH_API_URL', 'https://api.pushservice.com/notify')
+        self.push_api_key_encrypted = self.config.get('PUSH_API_KEY')
         self.push_api_key = self.encryption_manager.decrypt_data(self.push_api_key_encrypted).decode('utf-8')
-        self.frontend_api_url = self.config_loader.get('FRONTEND_API_URL', 'https://api.frontend.com')
-        self.frontend_api_key_encrypted = self.config_loader.get('FRONTEND_API_KEY')
+        self.frontend_api_url = self.config.get('FRONTEND_API_URL', 'https://api.frontend.com')
+        self.frontend_api_key_encrypted = self.config.get('FRONTEND_API_KEY')
         self.frontend_api_key = self.encryption_manager.decrypt_data(self.frontend_api_key_encrypted).decode('utf-8')
-        self.session_requests = requests.Session()
+        self.http = self._initialize_http_client()
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # template_id -> (updated_at, compiled subject, compiled body)
+        self._tpl_cache: Dict[str, Tuple[datetime, List[str], List[str]]] = {}
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        self._smtp_lock = asyncio.Lock()
+        self._start_event_loop()
+        self._max_concurrent = self.config.get('NOTIFICATION_WORKER_CONCURRENCY', DEFAULT_WORKER_CONCURRENCY)
+        self._run_async(self._start_workers())
+        # channel -> (log label, message builder, sender) for enqueue_batch
+        self._channel_handlers = {
+            'email': ('email', self._build_email, self._send_email_async),
+            'sms': ('SMS', self._build_sms_payload, self._send_sms_async),
+            'push': ('push', self._build_push_payload, self._send_push_async),
+        }
         self.logger.info("NotificationService initialized successfully.")
 
+    def _initialize_http_client(self) -> httpx.AsyncClient:
+        """
+        Creates the HTTP/2 client shared by the SMS and push providers.
+
+        Returns:
+            httpx.AsyncClient: A pooled client that keeps provider connections open between sends.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=64,
+                max_connections=128,
+                # httpx drops idle connections after 5 seconds by default, forcing a new TLS handshake
+                keepalive_expiry=self.config.get('NOTIFICATION_HTTP_KEEPALIVE', HTTP_KEEPALIVE_EXPIRY)
+            ),
+            timeout=10
+        )
+
+    def _start_event_loop(self):
+        """
+        Starts the background event loop that owns the service's asynchronous connections.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name='NotificationLoop', daemon=True)
+        self._loop_thread.start()
+
+    def _run_async(self, coro):
+        """
+        Runs a coroutine on the service event loop and blocks until it completes.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            Any: The result of the coroutine.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
     def _initialize_database(self):
         """
         Initializes the database connection and creates tables if they do not exist.
         """
         try:
             self.logger.debug("Initializing database connection.")
-            db_config = self.config_loader.get('DATABASE_CONFIG', {})
+            db_config = self.config.get('DATABASE_CONFIG', {})
             db_type = db_config.get('type')
             username = db_config.get('username')
             password_encrypted = db_config.get('password')
@@ -106,14 +228,43 @@ class NotificationService:
 
             password = self.encryption_manager.decrypt_data(password_encrypted).decode('utf-8')
             connection_string = self._build_connection_string(db_type, username, password, host, port, database)
-            self.engine = create_engine(connection_string, pool_pre_ping=True, echo=False)
+            engine_options = {'pool_pre_ping': True, 'echo': False, 'query_cache_size': 1200, 'future': True}
+            if db_type.lower() != 'sqlite':
+                # SQLite's default pools do not take sizing arguments
+                engine_options.update(
+                    pool_size=db_config.get('pool_size', 20),
+                    max_overflow=db_config.get('max_overflow', 40),
+                    pool_recycle=db_config.get('pool_recycle', 1800)
+                )
+            self.engine = create_engine(connection_string, **engine_options)
             Base.metadata.create_all(self.engine)
-            self.Session = sessionmaker(bind=self.engine)
+            self._create_missing_indexes()
+            # Keep attributes loaded after commit so reading a new notification's ID does not re-SELECT it
+            self.Session = scoped_session(sessionmaker(bind=self.engine, expire_on_commit=False))
             self.logger.debug("Database initialized and tables created if not existing.")
         except Exception as e:
             self.logger.error(f"Error initializing database: {e}", exc_info=True)
             raise NotificationServiceError(f"Error initializing database: {e}")
 
+    def _create_missing_indexes(self):
+        """
+        Creates model indexes missing from tables created before the indexes were added,
+        which create_all skips because it never alters existing tables.
+        """
+        inspector = inspect(self.engine)
+        # MySQL has no CREATE INDEX IF NOT EXISTS
+        if_not_exists = self.engine.dialect.name != 'mysql'
+        with self.engine.begin() as conn:
+            for table in (NotificationTemplate.__table__, UserNotification.__table__):
+                with warnings.catch_warnings():
+                    # SQLite does not reflect expression indexes; IF NOT EXISTS covers them
+                    warnings.simplefilter('ignore', SAWarning)
+                    existing = {index['name'] for index in inspector.get_indexes(table.name)}
+                for index in table.indexes:
+                    if index.name not in existing:
+                        self.logger.debug(f"Creating missing index '{index.name}'.")
+                        conn.execute(CreateIndex(index, if_not_exists=if_not_exists))
+
     def _build_connection_string(self, db_type: str, username: str, password: str, host: str, port: int, database: str) -> str:
         """
         Builds the database connection string based on the database type.
@@ -151,32 +302,39 @@ class NotificationService:
         Returns:
             Optional[str]: The template ID if addition is successful, else None.
         """
+        session = self.Session()
         try:
             self.logger.debug(f"Adding notification template '{name}'.")
-            with self.lock:
-                existing_template = self.session.query(NotificationTemplate).filter(NotificationTemplate.name.ilike(name)).first()
-                if existing_template:
-                    self.logger.error(f"Notification template '{name}' already exists.")
-                    return None
-
-                template = NotificationTemplate(
-                    name=name,
-                    subject=subject,
-                    body=body
-                )
-                self.session.add(template)
-                self.session.commit()
-                template_id = template.id
-                self.logger.info(f"Notification template '{name}' added successfully with ID '{template_id}'.")
-                return template_id
+            existing_template = session.query(NotificationTemplate).filter(func.lower(NotificationTemplate.name) == name.lower()).first()
+            if existing_template:
+                self.logger.error(f"Notification template '{name}' already exists.")
+                return None
+
+            template = NotificationTemplate(
+                name=name,
+                subject=subject,
+                body=body
+            )
+            session.add(template)
+            session.commit()
+            template_id = template.id
+            self.logger.info(f"Notification template '{name}' added successfully with ID '{template_id}'.")
+            return template_id
+        except IntegrityError:
+            # A concurrent caller inserted the same name between the check and the commit
+            self.logger.error(f"Notification template '{name}' already exists.")
+            session.rollback()
+            return None
         except SQLAlchemyError as e:
             self.logger.error(f"Database error while adding notification template '{name}': {e}", exc_info=True)
-            self.session.rollback()
+            session.rollback()
             return None
         except Exception as e:
             self.logger.error(f"Unexpected error while adding notification template '{name}': {e}", exc_info=True)
-            self.session.rollback()
+            session.rollback()
             return None
+        finally:
+            self.Session.remove()
 
     def update_notification_template(self, template_id: str, name: Optional[str] = None,
                                      subject: Optional[str] = None, body: Optional[str] = None) -> bool:
@@ -192,36 +350,41 @@ class NotificationService:
         Returns:
             bool: True if the update is successful, False otherwise.
         """
+        session = self.Session()
         try:
             self.logger.debug(f"Updating notification template ID '{template_id}'.")
-            with self.lock:
-                template = self.session.query(NotificationTemplate).filter(NotificationTemplate.id == template_id).first()
-                if not template:
-                    self.logger.error(f"Notification template with ID '{template_id}' does not exist.")
-                    return False
-
-                if name:
-                    template.name = name
-                if subject:
-                    template.subject = subject
-                if body:
-                    template.body = body
-
-                self.session.commit()
-                self.logger.info(f"Notification template ID '{template_id}' updated successfully.")
-                return True
+            template = session.get(NotificationTemplate, template_id)
+            if not template:
+                self.logger.error(f"Notification template with ID '{template_id}' does not exist.")
+                return False
+
+            if name:
+                template.name = name
+            if subject:
+                template.subject = subject
+            if body:
+                template.body = body
+
+            session.commit()
+            self.logger.info(f"Notification template ID '{template_id}' updated successfully.")
+            return True
         except SQLAlchemyError as e:
             self.logger.error(f"Database error while updating notification template ID '{template_id}': {e}", exc_info=True)
-            self.session.rollback()
+            session.rollback()
             return False
         except Exception as e:
             self.logger.error(f"Unexpected error while updating notification template ID '{template_id}': {e}", exc_info=True)
-            self.session.rollback()
+            session.rollback()
             return False
+        finally:
+            self.Session.remove()
 
     def send_email_notification(self, user_id: str, template_id: str, placeholders: Dict[str, Any]) -> Optional[str]:
         """
-        Sends an email notification to a user based on a template.
+        Queues an email notification to a user based on a template.
+
+        The notification is recorded with status 'queued' and handed to the worker pool; its final
+        status ('sent' or 'failed') is recorded once delivery completes.
 
         Args:
             user_id (str): The unique identifier of the user.
@@ -229,163 +392,702 @@ class NotificationService:
             placeholders (Dict[str, Any]): A dictionary of placeholder values to personalize the email.
 
         Returns:
-            Optional[str]: The notification ID if sending is successful, else None.
+            Optional[str]: The notification ID if queuing is successful, else None.
+        """
+        return self._enqueue_notification('email', user_id, template_id, placeholders,
+                                          self._build_email, self._send_email_async)
+
+    def _enqueue_notification(self, channel: str, user_id: str, template_id: str, placeholders: Dict[str, Any],
+                              build: Callable[[Any, str, str], Any],
+                              send: Callable[[Any], Awaitable[None]]) -> Optional[str]:
         """
+        Renders a template for one user, records a 'queued' notification and hands it to the worker pool.
+
+        Args:
+            channel (str): The channel name used in log messages ('email', 'SMS', 'push').
+            user_id (str): The unique identifier of the user.
+            template_id (str): The unique identifier of the notification template.
+            placeholders (Dict[str, Any]): A dictionary of placeholder values.
+            build (Callable[[Any, str, str], Any]): Builds the channel message from (user, subject, body).
+            send (Callable[[Any], Awaitable[None]]): Coroutine function sending a built message.
+
+        Returns:
+            Optional[str]: The notification ID if queuing is successful, else None.
+        """
+        session = self.Session()
         try:
-            self.logger.debug(f"Sending email notification to user ID '{user_id}' using template ID '{template_id}'.")
-            with self.lock:
-                user = self.session.query(User).filter(User.id == user_id).first()
-                if not user:
-                    self.logger.error(f"User with ID '{user_id}' does not exist.")
-                    return None
-
-                template = self.session.query(NotificationTemplate).filter(NotificationTemplate.id == template_id).first()
-                if not template:
-                    self.logger.error(f"Notification template with ID '{template_id}' does not exist.")
-                    return None
-
-                subject = self._populate_placeholders(template.subject, placeholders)
-                body = self._populate_placeholders(template.body, placeholders)
-
-                # Send email using SMTP
-                msg = MIMEMultipart()
-                msg['From'] = self.email_username
-                msg['To'] = user.email
-                msg['Subject'] = subject
-                msg.attach(MIMEText(body, 'html'))
-
-                server = smtplib.SMTP(self.email_server, self.email_port)
-                server.starttls()
-                server.login(self.email_username, self.email_password)
-                server.sendmail(self.email_username, user.email, msg.as_string())
-                server.quit()
-
-                # Log the sent notification
-                notification = UserNotification(
-                    user_id=user_id,
-                    template_id=template_id,
-                    sent_at=datetime.utcnow(),
-                    status='sent',
-                    error_message=None
-                )
-                self.session.add(notification)
-                self.session.commit()
-                notification_id = notification.id
-                self.logger.info(f"Email notification sent successfully with ID '{notification_id}' to user ID '{user_id}'.")
-                return notification_id
-        except SQLAlchemyError as e:
-            self.logger.error(f"Database error while sending email notification to user ID '{user_id}': {e}", exc_info=True)
-            self.session.rollback()
-            return None
-        except smtplib.SMTPException as e:
-            self.logger.error(f"SMTP error while sending email to user ID '{user_id}': {e}", exc_info=True)
-            # Log the failed notification
+            self.logger.debug(f"Queuing {channel} notification to user ID '{user_id}' using template ID '{template_id}'.")
+            row = self._fetch_user_and_template(session, user_id, template_id)
+            if row is None:
+                return None
+            user, template = row
+            message = build(user, *self._render_template(template, placeholders))
+
             notification = UserNotification(
                 user_id=user_id,
                 template_id=template_id,
                 sent_at=datetime.utcnow(),
-                status='failed',
-                error_message=str(e)
+                status='queued',
+                error_message=None
             )
-            self.session.add(notification)
-            self.session.commit()
+            session.add(notification)
+            session.commit()
+            notification_id = notification.id
+
+            # Blocks while the queue is full, pushing back on producers
+            self._run_async(self.jobs.put(_SendJob(notification_id, user_id, channel, send, message)))
+            self.logger.info(f"{channel.capitalize()} notification queued with ID '{notification_id}' for user ID '{user_id}'.")
+            return notification_id
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error while queuing {channel} notification to user ID '{user_id}': {e}", exc_info=True)
+            session.rollback()
             return None
         except Exception as e:
-            self.logger.error(f"Unexpected error while sending email to user ID '{user_id}': {e}", exc_info=True)
-            self.session.rollback()
+            self.logger.error(f"Unexpected error while queuing {channel} notification to user ID '{user_id}': {e}", exc_info=True)
+            session.rollback()
             return None
+        finally:
+            self.Session.remove()
 
-    def _populate_placeholders(self, text: str, placeholders: Dict[str, Any]) -> str:
+    def enqueue_batch(self, user_ids: List[str], template_id: str, placeholders_list: List[Dict[str, Any]],
+                      channel: str = 'email') -> List[Optional[str]]:
         """
-        Replaces placeholders in the text with actual values.
+        Queues notifications for many users based on a single template without waiting for delivery.
+
+        All 'queued' records are written with bulk inserts before the jobs are handed to the worker pool.
 
         Args:
-            text (str): The text containing placeholders in the format {{placeholder}}.
-            placeholders (Dict[str, Any]): A dictionary of placeholder values.
+            user_ids (List[str]): The unique identifiers of the recipients.
+            template_id (str): The unique identifier of the notification template.
+            placeholders_list (List[Dict[str, Any]]): Placeholder values for each recipient, in the same order as user_ids.
+            channel (str, optional): The delivery channel ('email', 'sms', 'push'). Defaults to 'email'.
 
         Returns:
-            str: The text with placeholders replaced by actual values.
+            List[Optional[str]]: The notification ID for each recipient, or None where queuing failed.
         """
-        for key, value in placeholders.items():
-            text = text.replace(f"{{{{{key}}}}}", str(value))
-        return text
+        notification_ids: List[Optional[str]] = [None] * len(user_ids)
+        handlers = self._channel_handlers.get(channel.lower())
+        if handlers is None:
+            self.logger.error(f"Unsupported notification channel '{channel}'.")
+            return notification_ids
+        if len(placeholders_list) != len(user_ids):
+            self.logger.error("The number of placeholder sets does not match the number of recipients.")
+            return notification_ids
+        label, build, send = handlers
+        session = self.Session()
+        try:
+            self.logger.debug(f"Queuing {label} notifications to {len(user_ids)} users using template ID '{template_id}'.")
+            template = session.get(NotificationTemplate, template_id)
+            if not template:
+                self.logger.error(f"Notification template with ID '{template_id}' does not exist.")
+                return notification_ids
 
-    def send_sms_notification(self, user_id: str, template_id: str, placeholders: Dict[str, Any]) -> Optional[str]:
+            users = self._fetch_users(session, user_ids)
+            now = datetime.utcnow()
+            rows = []
+            jobs = []
+            for index, (user_id, placeholders) in enumerate(zip(user_ids, placeholders_list)):
+                user = users.get(user_id)
+                if not user:
+                    self.logger.error(f"User with ID '{user_id}' does not exist.")
+                    continue
+                message = build(user, *self._render_template(template, placeholders))
+                notification_id = str(uuid.uuid4())
+                rows.append({
+                    'id': notification_id,
+                    'user_id': user_id,
+                    'template_id': template_id,
+                    'sent_at': now,
+                    'status': 'queued',
+                    'error_message': None
+                })
+                jobs.append(_SendJob(notification_id, user_id, label, send, message))
+                notification_ids[index] = notification_id
+
+            for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                self._log_notifications_bulk(rows[start:start + BULK_INSERT_CHUNK_SIZE])
+            self._run_async(self._put_jobs(jobs))
+            self.logger.info(f"Queued {len(jobs)} of {len(user_ids)} {label} notifications using template ID '{template_id}'.")
+            return notification_ids
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error while queuing {label} batch using template ID '{template_id}': {e}", exc_info=True)
+            session.rollback()
+            return [None] * len(user_ids)
+        except Exception as e:
+            self.logger.error(f"Unexpected error while queuing {label} batch using template ID '{template_id}': {e}", exc_info=True)
+            session.rollback()
+            return [None] * len(user_ids)
+        finally:
+            self.Session.remove()
+
+    async def _put_jobs(self, jobs: List[_SendJob]):
         """
-        Sends an SMS notification to a user based on a template.
+        Hands a list of jobs to the worker pool, waiting for queue space as needed.
 
         Args:
-            user_id (str): The unique identifier of the user.
+            jobs (List[_SendJob]): The jobs to enqueue.
+        """
+        for job in jobs:
+            await self.jobs.put(job)
+
+    def set_max_concurrency(self, max_concurrent: int):
+        """
+        Changes how many queued notifications the worker pool delivers at once.
+
+        Args:
+            max_concurrent (int): The new cap on in-flight deliveries; must be at least 1.
+
+        Raises:
+            ValueError: If max_concurrent is less than 1.
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1.")
+        self._run_async(self._resize_workers(max_concurrent))
+        self.logger.info(f"Notification worker concurrency set to {max_concurrent}.")
+
+    async def _start_workers(self):
+        """
+        Creates the job queue and spawns the delivery workers, status writer and SMTP keepalive
+        on the service event loop.
+        """
+        self.jobs = asyncio.Queue(maxsize=JOB_QUEUE_MAXSIZE)
+        self._concurrency = asyncio.Condition()
+        self._active = 0
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self._max_concurrent)]
+        self._status_queue = asyncio.Queue()
+        self._status_writer_task = asyncio.create_task(self._status_writer())
+        self._smtp_keepalive_task = asyncio.create_task(self._smtp_keepalive())
+
+    async def _stop_workers(self):
+        """
+        Cancels the background tasks started by _start_workers and waits for them to finish.
+        """
+        tasks = [*self._workers, self._status_writer_task, self._smtp_keepalive_task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _resize_workers(self, max_concurrent: int):
+        """
+        Applies a new concurrency cap, spawning extra workers when the cap grows past the pool size.
+
+        Args:
+            max_concurrent (int): The new cap on in-flight deliveries.
+        """
+        async with self._concurrency:
+            self._max_concurrent = max_concurrent
+            while len(self._workers) < max_concurrent:
+                self._workers.append(asyncio.create_task(self._worker()))
+            self._concurrency.notify_all()
+
+    async def _worker(self):
+        """
+        Delivers queued notifications one at a time and records their outcome.
+        """
+        while True:
+            job = await self.jobs.get()
+            try:
+                async with self._concurrency:
+                    await self._concurrency.wait_for(lambda: self._active < self._max_concurrent)
+                    self._active += 1
+                try:
+                    await job.send(job.message)
+                    status, error_message = 'sent', None
+                    self.logger.info(f"{job.channel.capitalize()} notification sent successfully with ID '{job.notification_id}' to user ID '{job.user_id}'.")
+                except Exception as e:
+                    status, error_message = 'failed', str(e)
+                    self.logger.error(f"Error while sending {job.channel} to user ID '{job.user_id}': {e}", exc_info=True)
+                finally:
+                    async with self._concurrency:
+                        self._active -= 1
+                        self._concurrency.notify()
+                self._status_queue.put_nowait({
+                    'b_id': job.notification_id,
+                    'status': status,
+                    'error_message': error_message
+                })
+            except Exception as e:
+                self.logger.error(f"Unexpected error in notification worker: {e}", exc_info=True)
+            finally:
+                self.jobs.task_done()
+
+    async def _status_writer(self):
+        """
+        Drains delivery outcomes from the status queue and writes them in batches.
+
+        A batch is flushed once STATUS_BATCH_SIZE outcomes are waiting or STATUS_FLUSH_INTERVAL
+        has passed since the first one arrived, whichever comes first.
+        """
+        while True:
+            rows = [await self._status_queue.get()]
+            if self._status_queue.qsize() < STATUS_BATCH_SIZE - 1:
+                # Give concurrent deliveries a moment to complete and join this batch
+                await asyncio.sleep(STATUS_FLUSH_INTERVAL)
+            while len(rows) < STATUS_BATCH_SIZE and not self._status_queue.empty():
+                rows.append(self._status_queue.get_nowait())
+            try:
+                # Database writes are blocking, so keep them off the event loop
+                await self._loop.run_in_executor(None, self._update_notification_statuses, rows)
+            except Exception as e:
+                self.logger.error(f"Unexpected error while recording {len(rows)} notification statuses: {e}", exc_info=True)
+            finally:
+                for _ in rows:
+                    self._status_queue.task_done()
+
+    def _update_notification_statuses(self, rows: List[Dict[str, Any]]):
+        """
+        Records the delivery outcomes of queued notifications with a single executemany UPDATE.
+
+        Args:
+            rows (List[Dict[str, Any]]): One dict per notification with 'b_id' (the notification ID),
+                'status' and 'error_message'.
+        """
+        table = UserNotification.__table__
+        session = self.Session()
+        try:
+            session.execute(
+                update(table)
+                .where(table.c.id == bindparam('b_id'))
+                # One timestamp per flushed batch rather than one clock read per delivery
+                .values(status=bindparam('status'), error_message=bindparam('error_message'), sent_at=datetime.utcnow()),
+                rows
+            )
+            session.commit()
+            self.logger.debug(f"Recorded delivery status for {len(rows)} notifications.")
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error while recording {len(rows)} notification statuses: {e}", exc_info=True)
+            session.rollback()
+        finally:
+            self.Session.remove()
+
+    def send_email_batch(self, user_ids: List[str], template_id: str,
+                         placeholders_list: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Sends email notifications to many users concurrently based on a single template.
+
+        Args:
+            user_ids (List[str]): The unique identifiers of the recipients.
             template_id (str): The unique identifier of the notification template.
-            placeholders (Dict[str, Any]): A dictionary of placeholder values to personalize the SMS.
+            placeholders_list (List[Dict[str, Any]]): Placeholder values for each recipient, in the same order as user_ids.
 
         Returns:
-            Optional[str]: The notification ID if sending is successful, else None.
+            List[Optional[str]]: The notification ID for each recipient, or None where sending failed.
         """
+        return self._send_batch('email', user_ids, template_id, placeholders_list,
+                                self._build_email, self._send_email_async)
+
+    def send_sms_batch(self, user_ids: List[str], template_id: str,
+                       placeholders_list: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Sends SMS notifications to many users concurrently based on a single template.
+
+        Args:
+            user_ids (List[str]): The unique identifiers of the recipients.
+            template_id (str): The unique identifier of the notification template.
+            placeholders_list (List[Dict[str, Any]]): Placeholder values for each recipient, in the same order as user_ids.
+
+        Returns:
+            List[Optional[str]]: The notification ID for each recipient, or None where sending failed.
+        """
+        return self._send_batch('SMS', user_ids, template_id, placeholders_list,
+                                self._build_sms_payload, self._send_sms_async)
+
+    def send_push_batch(self, user_ids: List[str], template_id: str,
+                        placeholders_list: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Sends push notifications to many users concurrently based on a single template.
+
+        Args:
+            user_ids (List[str]): The unique identifiers of the recipients.
+            template_id (str): The unique identifier of the notification template.
+            placeholders_list (List[Dict[str, Any]]): Placeholder values for each recipient, in the same order as user_ids.
+
+        Returns:
+            List[Optional[str]]: The notification ID for each recipient, or None where sending failed.
+        """
+        return self._send_batch('push', user_ids, template_id, placeholders_list,
+                                self._build_push_payload, self._send_push_async)
+
+    def _send_batch(self, channel: str, user_ids: List[str], template_id: str,
+                    placeholders_list: List[Dict[str, Any]], build: Callable[[Any, str, str], Any],
+                    send: Callable[[Any], Awaitable[None]]) -> List[Optional[str]]:
+        """
+        Renders a template for each recipient, sends every message concurrently and logs the outcomes.
+
+        Args:
+            channel (str): The channel name used in log messages ('email', 'SMS', 'push').
+            user_ids (List[str]): The unique identifiers of the recipients.
+            template_id (str): The unique identifier of the notification template.
+            placeholders_list (List[Dict[str, Any]]): Placeholder values for each recipient, in the same order as user_ids.
+            build (Callable[[Any, str, str], Any]): Builds the channel message from (user, subject, body).
+            send (Callable[[Any], Awaitable[None]]): Coroutine function sending a built message.
+
+        Returns:
+            List[Optional[str]]: The notification ID for each recipient, or None where sending failed.
+        """
+        notification_ids: List[Optional[str]] = [None] * len(user_ids)
+        if len(placeholders_list) != len(user_ids):
+            self.logger.error("The number of placeholder sets does not match the number of recipients.")
+            return notification_ids
+        session = self.Session()
         try:
-            self.logger.debug(f"Sending SMS notification to user ID '{user_id}' using template ID '{template_id}'.")
-            with self.lock:
-                user = self.session.query(User).filter(User.id == user_id).first()
+            self.logger.debug(f"Sending {channel} notifications to {len(user_ids)} users using template ID '{template_id}'.")
+            template = session.get(NotificationTemplate, template_id)
+            if not template:
+                self.logger.error(f"Notification template with ID '{template_id}' does not exist.")
+                return notification_ids
+
+            users = self._fetch_users(session, user_ids)
+            messages = []
+            for index, (user_id, placeholders) in enumerate(zip(user_ids, placeholders_list)):
+                user = users.get(user_id)
                 if not user:
                     self.logger.error(f"User with ID '{user_id}' does not exist.")
-                    return None
-
-                template = self.session.query(NotificationTemplate).filter(NotificationTemplate.id == template_id).first()
-                if not template:
-                    self.logger.error(f"Notification template with ID '{template_id}' does not exist.")
-                    return None
-
-                subject = self._populate_placeholders(template.subject, placeholders)
-                body = self._populate_placeholders(template.body, placeholders)
-
-                # Send SMS using external SMS API
-                payload = {
-                    'api_key': self.sms_api_key,
-                    'to': user.phone,
-                    'message': f"{subject}\n{body}"
-                }
-                response = self.session_requests.post(
-                    self.sms_api_url,
-                    json=payload,
-                    timeout=10
-                )
-                if response.status_code != 200:
-                    raise Exception(f"SMS API responded with status code {response.status_code}: {response.text}")
-
-                # Log the sent notification
-                notification = UserNotification(
-                    user_id=user_id,
-                    template_id=template_id,
-                    sent_at=datetime.utcnow(),
-                    status='sent',
-                    error_message=None
-                )
-                self.session.add(notification)
-                self.session.commit()
-                notification_id = notification.id
-                self.logger.info(f"SMS notification sent successfully with ID '{notification_id}' to user ID '{user_id}'.")
-                return notification_id
+                    continue
+                messages.append((index, build(user, *self._render_template(template, placeholders))))
+
+            outcomes = self._run_async(self._send_all(send, messages))
+
+            # Log every attempt, sent or failed, with executemany inserts
+            now = datetime.utcnow()
+            rows = []
+            for (index, _), outcome in zip(messages, outcomes):
+                failed = isinstance(outcome, BaseException)
+                if failed:
+                    self.logger.error(f"Error while sending {channel} to user ID '{user_ids[index]}': {outcome}")
+                rows.append({
+                    'id': str(uuid.uuid4()),
+                    'user_id': user_ids[index],
+                    'template_id': template_id,
+                    'sent_at': now,
+                    'status': 'failed' if failed else 'sent',
+                    'error_message': str(outcome) if failed else None
+                })
+                if not failed:
+                    notification_ids[index] = rows[-1]['id']
+            for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                self._log_notifications_bulk(rows[start:start + BULK_INSERT_CHUNK_SIZE])
+
+            sent_count = sum(1 for notification_id in notification_ids if notification_id)
+            self.logger.info(f"Sent {sent_count} of {len(user_ids)} {channel} notifications using template ID '{template_id}'.")
+            return notification_ids
         except SQLAlchemyError as e:
-            self.logger.error(f"Database error while sending SMS notification to user ID '{user_id}': {e}", exc_info=True)
-            self.session.rollback()
-            return None
+            self.logger.error(f"Database error while sending {channel} batch using template ID '{template_id}': {e}", exc_info=True)
+            session.rollback()
+            return [None] * len(user_ids)
         except Exception as e:
-            self.logger.error(f"Error while sending SMS to user ID '{user_id}': {e}", exc_info=True)
-            # Log the failed notification
-            notification = UserNotification(
-                user_id=user_id,
-                template_id=template_id,
-                sent_at=datetime.utcnow(),
-                status='failed',
-                error_message=str(e)
-            )
-            self.session.add(notification)
-            self.session.commit()
-            return None
+            self.logger.error(f"Unexpected error while sending {channel} batch using template ID '{template_id}': {e}", exc_info=True)
+            session.rollback()
+            return [None] * len(user_ids)
+        finally:
+            self.Session.remove()
+
+    def _log_notifications_bulk(self, rows: List[Dict[str, Any]]):
+        """
+        Inserts many notification log rows with a single executemany statement and commit.
+
+        Args:
+            rows (List[Dict[str, Any]]): Column values for each UserNotification row.
+
+        Raises:
+            SQLAlchemyError: If the insert fails.
+        """
+        if not rows:
+            return
+        session = self.Session()
+        session.execute(UserNotification.__table__.insert(), rows)
+        session.commit()
+
+    def _fetch_user_and_template(self, session, user_id: str,
+                                 template_id: str) -> Optional[Tuple[Any, NotificationTemplate]]:
+        """
+        Loads a user and a notification template in a single round-trip.
+
+        Args:
+            session: The database session to query with.
+            user_id (str): The unique identifier of the user.
+            template_id (str): The unique identifier of the notification template.
+
+        Returns:
+            Optional[Tuple[Any, NotificationTemplate]]: The (user, template) pair, or None if either does not exist.
+        """
+        User = _user_model()
+        row = session.execute(
+            select(User, NotificationTemplate)
+            .join(NotificationTemplate, NotificationTemplate.id == template_id)
+            .where(User.id == user_id)
+        ).one_or_none()
+        if row is not None:
+            return row[0], row[1]
+
+        # Only the failure path pays for working out which of the two is missing
+        if session.get(User, user_id) is None:
+            self.logger.error(f"User with ID '{user_id}' does not exist.")
+        else:
+            self.logger.error(f"Notification template with ID '{template_id}' does not exist.")
+        return None
+
+    def _fetch_users(self, session, user_ids: List[str]) -> Dict[str, Any]:
+        """
+        Loads many users with IN queries, chunked to stay under driver bind-parameter limits.
+
+        Args:
+            session: The database session to query with.
+            user_ids (List[str]): The unique identifiers of the users.
+
+        Returns:
+            Dict[str, Any]: The users found, keyed by user ID.
+        """
+        User = _user_model()
+        unique_ids = list(dict.fromkeys(user_ids))
+        users: Dict[str, Any] = {}
+        for start in range(0, len(unique_ids), IN_CLAUSE_CHUNK_SIZE):
+            chunk = unique_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+            users.update((user.id, user) for user in session.scalars(select(User).where(User.id.in_(chunk))))
+        return users
+
+    async def _get_smtp(self) -> aiosmtplib.SMTP:
+        """
+        Returns the shared SMTP connection, connecting and authenticating it on first use.
+
+        Returns:
+            aiosmtplib.SMTP: A connected and authenticated SMTP client.
+        """
+        if self._smtp is None or not self._smtp.is_connected:
+            smtp = aiosmtplib.SMTP(hostname=self.email_server, port=int(self.email_port), start_tls=True)
+            await smtp.connect()
+            await smtp.login(self.email_username, self.email_password)
+            self._smtp = smtp
+            self.logger.debug(f"Connected to SMTP server '{self.email_server}'.")
+        return self._smtp
+
+    def _build_email(self, user: Any, subject: str, body: str) -> EmailMessage:
+        """
+        Builds an HTML email with a plain-text alternative.
+
+        Args:
+            user (Any): The recipient user.
+            subject (str): The subject line of the email.
+            body (str): The HTML body of the email.
+
+        Returns:
+            EmailMessage: The message ready to send.
+        """
+        msg = EmailMessage()
+        msg['From'] = self.email_username
+        msg['To'] = user.email
+        msg['Subject'] = subject
+        msg.set_content(html.unescape(_TAG_RE.sub('', body)))
+        msg.add_alternative(body, subtype='html')
+        return msg
+
+    async def _send_email_async(self, msg: EmailMessage):
+        """
+        Sends a single email over the shared SMTP connection.
+
+        Args:
+            msg (EmailMessage): The message to send.
+
+        Raises:
+            aiosmtplib.SMTPException: If the SMTP server rejects the message.
+        """
+        # One SMTP session carries one transaction at a time
+        async with self._smtp_lock:
+            smtp = await self._get_smtp()
+            try:
+                await smtp.send_message(msg)
+            except aiosmtplib.SMTPServerDisconnected:
+                # The server closed an idle session; reconnect and retry once
+                self.logger.debug("SMTP connection dropped, reconnecting.")
+                self._smtp = None
+                smtp = await self._get_smtp()
+                await smtp.send_message(msg)
+
+    async def _smtp_keepalive(self):
+        """
+        Periodically sends NOOP on the idle SMTP connection so the server does not drop it.
+        """
+        while True:
+            await asyncio.sleep(SMTP_KEEPALIVE_INTERVAL)
+            async with self._smtp_lock:
+                if self._smtp is None or not self._smtp.is_connected:
+                    continue
+                try:
+                    await self._smtp.noop()
+                except aiosmtplib.SMTPException as e:
+                    self.logger.debug(f"SMTP keepalive failed, connection will be reopened on next send: {e}")
+                    self._smtp = None
+
+    def _build_sms_payload(self, user: Any, subject: str, body: str) -> bytes:
+        """
+        Builds the SMS API request payload, serialized to JSON.
+
+        Args:
+            user (Any): The recipient user.
+            subject (str): The subject line of the notification.
+            body (str): The body of the notification.
+
+        Returns:
+            bytes: The JSON-encoded payload for the SMS API.
+        """
+        return _dumps({
+            'api_key': self.sms_api_key,
+            'to': user.phone,
+            'message': f"{subject}\n{body}"
+        })
+
+    async def _send_sms_async(self, payload: bytes):
+        """
+        Sends a single SMS through the external SMS API.
+
+        Args:
+            payload (bytes): The JSON-encoded payload for the SMS API.
+
+        Raises:
+            NotificationServiceError: If the SMS API responds with a non-200 status.
+        """
+        await self._post_async(self.sms_api_url, payload, 'SMS')
+
+    def _build_push_payload(self, user: Any, subject: str, body: str) -> bytes:
+        """
+        Builds the Push API request payload, serialized to JSON.
+
+        Args:
+            user (Any): The recipient user.
+            subject (str): The title of the push notification.
+            body (str): The message of the push notification.
+
+        Returns:
+            bytes: The JSON-encoded payload for the Push API.
+        """
+        return _dumps({
+            'api_key': self.push_api_key,
+            'user_id': user.id,
+            'title': subject,
+            'message': body
+        })
+
+    async def _send_push_async(self, payload: bytes):
+        """
+        Sends a single push notification through the external Push API.
+
+        Args:
+            payload (bytes): The JSON-encoded payload for the Push API.
+
+        Raises:
+            NotificationServiceError: If the Push API responds with a non-200 status.
+        """
+        await self._post_async(self.push_api_url, payload, 'Push')
+
+    async def _post_async(self, url: str, payload: bytes, api_name: str):
+        """
+        Posts a JSON payload to a provider API, capping concurrent requests per host.
+
+        Args:
+            url (str): The provider endpoint.
+            payload (bytes): The JSON-encoded payload to send.
+            api_name (str): The provider name used in error messages.
+
+        Raises:
+            NotificationServiceError: If the API responds with a non-200 status.
+        """
+        host = urlsplit(url).netloc
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._host_semaphores[host] = asyncio.Semaphore(HTTP_HOST_CONCURRENCY)
+        async with semaphore:
+            response = await self.http.post(url, content=payload, headers=JSON_HEADERS)
+        if response.status_code != 200:
+            raise NotificationServiceError(f"{api_name} API responded with status code {response.status_code}: {response.text}")
+
+    async def _send_all(self, send: Callable[[Any], Awaitable[None]], messages: List[Tuple[int, Any]]) -> List[Any]:
+        """
+        Sends a batch of messages concurrently.
+
+        Args:
+            send (Callable[[Any], Awaitable[None]]): Coroutine function sending a built message.
+            messages (List[Tuple[int, Any]]): (index, message) pairs for each message.
+
+        Returns:
+            List[Any]: None for each message that was sent, or the exception raised while sending it.
+        """
+        return await asyncio.gather(
+            *[send(message) for _, message in messages],
+            return_exceptions=True
+        )
+
+    def _render_template(self, template: NotificationTemplate, placeholders: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Renders a template's subject and body, compiling them once per template revision.
+
+        Args:
+            template (NotificationTemplate): The notification template to render.
+            placeholders (Dict[str, Any]): A dictionary of placeholder values.
+
+        Returns:
+            Tuple[str, str]: The rendered subject and body.
+        """
+        cached = self._tpl_cache.get(template.id)
+        if cached is None or cached[0] != template.updated_at:
+            cached = (template.updated_at, self._compile(template.subject), self._compile(template.body))
+            self._tpl_cache[template.id] = cached
+        values = _Placeholders(placeholders)
+        return self._fill(cached[1], values), self._fill(cached[2], values)
+
+    @staticmethod
+    def _compile(text: str) -> List[str]:
+        """
+        Splits {{placeholder}} markup once so rendering only has to join the parts.
+
+        Placeholder names may be any text, so they are not compiled into str.format fields,
+        which would read '.', '[', ':' and '!' as format syntax and digits as positional indices.
+
+        Args:
+            text (str): The text containing placeholders in the format {{placeholder}}.
+
+        Returns:
+            List[str]: Literal text at even indices and placeholder names at odd indices.
+        """
+        return _PH_RE.split(text)
+
+    @staticmethod
+    def _fill(parts: List[str], values: _Placeholders) -> str:
+        """
+        Joins compiled template parts, substituting each placeholder name with its value.
+
+        Args:
+            parts (List[str]): The parts returned by _compile.
+            values (_Placeholders): The placeholder values.
+
+        Returns:
+            str: The rendered text.
+        """
+        return ''.join(str(values[part]) if index % 2 else part for index, part in enumerate(parts))
+
+    def send_sms_notification(self, user_id: str, template_id: str, placeholders: Dict[str, Any]) -> Optional[str]:
+        """
+        Queues an SMS notification to a user based on a template.
+
+        The notification is recorded with status 'queued' and handed to the worker pool; its final
+        status ('sent' or 'failed') is recorded once delivery completes.
+
+        Args:
+            user_id (str): The unique identifier of the user.
+            template_id (str): The unique identifier of the notification template.
+            placeholders (Dict[str, Any]): A dictionary of placeholder values to personalize the SMS.
+
+        Returns:
+            Optional[str]: The notification ID if queuing is successful, else None.
+        """
+        return self._enqueue_notification('SMS', user_id, template_id, placeholders,
+                                          self._build_sms_payload, self._send_sms_async)
 
     def send_push_notification(self, user_id: str, template_id: str, placeholders: Dict[str, Any]) -> Optional[str]:
         """
-        Sends a push notification to a user based on a template.
+        Queues a push notification to a user based on a template.
+
+        The notification is recorded with status 'queued' and handed to the worker pool; its final
+        status ('sent' or 'failed') is recorded once delivery completes.
 
         Args:
             user_id (str): The unique identifier of the user.
@@ -393,69 +1095,10 @@ class NotificationService:
             placeholders (Dict[str, Any]): A dictionary of placeholder values to personalize the push notification.
 
         Returns:
-            Optional[str]: The notification ID if sending is successful, else None.
+            Optional[str]: The notification ID if queuing is successful, else None.
         """
-        try:
-            self.logger.debug(f"Sending push notification to user ID '{user_id}' using template ID '{template_id}'.")
-            with self.lock:
-                user = self.session.query(User).filter(User.id == user_id).first()
-                if not user:
-                    self.logger.error(f"User with ID '{user_id}' does not exist.")
-                    return None
-
-                template = self.session.query(NotificationTemplate).filter(NotificationTemplate.id == template_id).first()
-                if not template:
-                    self.logger.error(f"Notification template with ID '{template_id}' does not exist.")
-                    return None
-
-                subject = self._populate_placeholders(template.subject, placeholders)
-                body = self._populate_placeholders(template.body, placeholders)
-
-                # Send push notification using external Push API
-                payload = {
-                    'api_key': self.push_api_key,
-                    'user_id': user.id,
-                    'title': subject,
-                    'message': body
-                }
-                response = self.session_requests.post(
-                    self.push_api_url,
-                    json=payload,
-                    timeout=10
-                )
-                if response.status_code != 200:
-                    raise Exception(f"Push API responded with status code {response.status_code}: {response.text}")
-
-                # Log the sent notification
-                notification = UserNotification(
-                    user_id=user_id,
-                    template_id=template_id,
-                    sent_at=datetime.utcnow(),
-                    status='sent',
-                    error_message=None
-                )
-                self.session.add(notification)
-                self.session.commit()
-                notification_id = notification.id
-                self.logger.info(f"Push notification sent successfully with ID '{notification_id}' to user ID '{user_id}'.")
-                return notification_id
-        except SQLAlchemyError as e:
-            self.logger.error(f"Database error while sending push notification to user ID '{user_id}': {e}", exc_info=True)
-            self.session.rollback()
-            return None
-        except Exception as e:
-            self.logger.error(f"Error while sending push notification to user ID '{user_id}': {e}", exc_info=True)
-            # Log the failed notification
-            notification = UserNotification(
-                user_id=user_id,
-                template_id=template_id,
-                sent_at=datetime.utcnow(),
-                status='failed',
-                error_message=str(e)
-            )
-            self.session.add(notification)
-            self.session.commit()
-            return None
+        return self._enqueue_notification('push', user_id, template_id, placeholders,
+                                          self._build_push_payload, self._send_push_async)
 
     def create_user_notification(self, user_id: str, template_id: str, sent_at: datetime, status: str = 'sent',
                                  error_message: Optional[str] = None) -> Optional[str]:
@@ -472,75 +1115,106 @@ class NotificationService:
         Returns:
             Optional[str]: The notification ID if recording is successful, else None.
         """
+        session = self.Session()
         try:
             self.logger.debug(f"Recording user notification for user ID '{user_id}' with status '{status}'.")
-            with self.lock:
-                notification = UserNotification(
-                    user_id=user_id,
-                    template_id=template_id,
-                    sent_at=sent_at,
-                    status=status,
-                    error_message=error_message
-                )
-                self.session.add(notification)
-                self.session.commit()
-                notification_id = notification.id
-                self.logger.info(f"User notification recorded successfully with ID '{notification_id}' for user ID '{user_id}'.")
-                return notification_id
+            notification = UserNotification(
+                user_id=user_id,
+                template_id=template_id,
+                sent_at=sent_at,
+                status=status,
+                error_message=error_message
+            )
+            session.add(notification)
+            session.commit()
+            notification_id = notification.id
+            self.logger.info(f"User notification recorded successfully with ID '{notification_id}' for user ID '{user_id}'.")
+            return notification_id
         except SQLAlchemyError as e:
             self.logger.error(f"Database error while recording notification for user ID '{user_id}': {e}", exc_info=True)
-            self.session.rollback()
+            session.rollback()
             return None
         except Exception as e:
             self.logger.error(f"Unexpected error while recording notification for user ID '{user_id}': {e}", exc_info=True)
-            self.session.rollback()
+            session.rollback()
             return None
+        finally:
+            self.Session.remove()
 
     def get_notification_history(self, user_id: str, status_filter: Optional[List[str]] = None,
-                                 start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> Optional[List[Dict[str, Any]]]:
+                                 start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                                 page_size: int = 50, cursor: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
-        Retrieves the notification history for a user based on optional filters.
+        Retrieves one page of the notification history for a user based on optional filters.
 
         Args:
             user_id (str): The unique identifier of the user.
             status_filter (Optional[List[str]], optional): A list of statuses to filter notifications. Defaults to None.
             start_date (Optional[datetime], optional): The start date for filtering notifications. Defaults to None.
             end_date (Optional[datetime], optional): The end date for filtering notifications. Defaults to None.
+            page_size (int, optional): The maximum number of notifications to return. Defaults to 50.
+            cursor (Optional[str], optional): The next_cursor of the previous page. Defaults to None (first page).
 
         Returns:
-            Optional[List[Dict[str, Any]]]: A list of notifications if retrieval is successful, else None.
+            Optional[Dict[str, Any]]: A dict with the page of notifications under 'items' and the cursor of the
+            following page under 'next_cursor' (None on the last page) if retrieval is successful, else None.
         """
+        session = self.Session()
         try:
-            self.logger.debug(f"Retrieving notification history for user ID '{user_id}' with filters status={status_filter}, start_date={start_date}, end_date={end_date}.")
-            with self.lock:
-                query = self.session.query(UserNotification).filter(UserNotification.user_id == user_id)
-                if status_filter:
-                    query = query.filter(UserNotification.status.in_(status_filter))
-                if start_date:
-                    query = query.filter(UserNotification.sent_at >= start_date)
-                if end_date:
-                    query = query.filter(UserNotification.sent_at <= end_date)
-
-                notifications = query.order_by(UserNotification.sent_at.desc()).all()
-                notifications_list = [
-                    {
-                        'notification_id': notif.id,
-                        'template_name': notif.template.name,
-                        'subject': notif.template.subject,
-                        'body': notif.template.body,
-                        'sent_at': notif.sent_at.strftime('%Y-%m-%d %H:%M:%S'),
-                        'status': notif.status,
-                        'error_message': notif.error_message
-                    } for notif in notifications
-                ]
-                self.logger.info(f"Retrieved {len(notifications_list)} notifications for user ID '{user_id}'.")
-                return notifications_list
+            self.logger.debug(f"Retrieving notification history for user ID '{user_id}' with filters status={status_filter}, start_date={start_date}, end_date={end_date}, cursor={cursor}.")
+            query = (
+                session.query(UserNotification)
+                .options(selectinload(UserNotification.template))
+                .filter(UserNotification.user_id == user_id)
+            )
+            if status_filter:
+                query = query.filter(UserNotification.status.in_(status_filter))
+            if start_date:
+                query = query.filter(UserNotification.sent_at >= start_date)
+            if end_date:
+                query = query.filter(UserNotification.sent_at <= end_date)
+            if cursor:
+                # Keyset on (sent_at, id) so rows sharing a timestamp are neither skipped nor repeated
+                cursor_sent_at, cursor_id = cursor.rsplit('|', 1)
+                cursor_sent_at = datetime.fromisoformat(cursor_sent_at)
+                query = query.filter(or_(
+                    UserNotification.sent_at < cursor_sent_at,
+                    and_(UserNotification.sent_at == cursor_sent_at, UserNotification.id < cursor_id)
+                ))
+
+            # Fetch one extra row to learn whether another page follows
+            notifications = (
+                query.order_by(UserNotification.sent_at.desc(), UserNotification.id.desc())
+                .limit(page_size + 1)
+                .all()
+            )
+            has_more = len(notifications) > page_size
+            notifications = notifications[:page_size]
+            notifications_list = [
+                {
+                    'notification_id': notif.id,
+                    'template_name': notif.template.name,
+                    'subject': notif.template.subject,
+                    'body': notif.template.body,
+                    'sent_at': notif.sent_at.strftime('%Y-%m-%d %H:%M:%S'),
+                    'status': notif.status,
+                    'error_message': notif.error_message
+                } for notif in notifications
+            ]
+            next_cursor = None
+            if has_more:
+                last = notifications[-1]
+                next_cursor = f"{last.sent_at.isoformat()}|{last.id}"
+            self.logger.info(f"Retrieved {len(notifications_list)} notifications for user ID '{user_id}'.")
+            return {'items': notifications_list, 'next_cursor': next_cursor}
         except SQLAlchemyError as e:
             self.logger.error(f"Database error while retrieving notifications for user ID '{user_id}': {e}", exc_info=True)
             return None
         except Exception as e:
             self.logger.error(f"Unexpected error while retrieving notifications for user ID '{user_id}': {e}", exc_info=True)
             return None
+        finally:
+            self.Session.remove()
 
     def close_service(self):
         """
@@ -548,12 +1222,20 @@ class NotificationService:
         """
         try:
             self.logger.debug("Closing NotificationService resources.")
-            if self.session:
-                self.session.close()
-                self.logger.debug("Database session closed.")
-            if self.session_requests:
-                self.session_requests.close()
-                self.logger.debug("HTTP session closed.")
+            # Deliver whatever is still queued before tearing the connections down
+            self._run_async(self.jobs.join())
+            self._run_async(self._status_queue.join())
+            self._run_async(self._stop_workers())
+            self.Session.remove()
+            self.logger.debug("Database session closed.")
+            self._run_async(self.http.aclose())
+            self.logger.debug("HTTP client closed.")
+            if self._smtp is not None and self._smtp.is_connected:
+                self._run_async(self._smtp.quit())
+                self.logger.debug("SMTP connection closed.")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
             self.logger.info("NotificationService closed successfully.")
         except Exception as e:
             self.logger.error(f"Error closing NotificationService: {e}", exc_info=True)
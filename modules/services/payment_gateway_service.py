@@ -1,20 +1,200 @@
 # services/payment_gateway_service.py
 
+import asyncio
+import json
 import logging
+import random
+import re
 import threading
-from typing import Any, Dict, Optional
-import requests
+import time
+import uuid
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+import httpx
+import pybreaker
+import redis
+from cachetools import TTLCache
 from modules.utilities.logging_manager import setup_logging
 from modules.utilities.config_loader import ConfigLoader
 from modules.security.encryption_manager import EncryptionManager
 from modules.security.authentication import AuthenticationManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library codec
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({'GET', 'DELETE'})
+MAX_RETRIES = 5
+RETRY_BACKOFF_FACTOR = 0.5  # seconds; the cap on the n-th retry delay is factor * 2**n
+RETRY_BUDGET = 10.0  # seconds of backoff a single call may spend before giving up
+STATUS_CACHE_SIZE = 10000
+STATUS_CACHE_TTL = 2.0  # seconds a pending transaction's status is reused when the gateway sends no max-age
+TERMINAL_STATUS_TTL = 3600.0  # seconds a final status is reused; it can only change through this service
+TERMINAL_STATUSES = frozenset({'succeeded', 'failed', 'refunded', 'canceled'})
+BREAKER_FAIL_MAX = 5  # consecutive failed calls that open the circuit
+BREAKER_RESET_TIMEOUT = 30  # seconds the circuit stays open before a trial call is let through
+IDEMPOTENCY_KEY_PREFIX = 'payments:idem:'
+IDEMPOTENCY_TTL = 86400  # seconds a completed payment or refund is remembered for replay
+IDEMPOTENCY_LOCK_TTL = 120  # seconds a claim is held; outlasts one call's timeouts and retries if the process dies
+IDEMPOTENCY_MEMORY_SIZE = 100000
+REDIS_RETRY_INTERVAL = 30  # seconds to wait before retrying Redis after an error
+_IN_PROGRESS = b'{"status":"in_progress"}'
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+# Decrypted API keys by their encrypted form, shared by every service instance in the process
+_decrypted_api_keys: Dict[Any, str] = {}
+_decrypt_lock = threading.Lock()
+# ISO 4217 currencies without a minor unit; everything else is assumed to have two decimals
+ZERO_DECIMAL_CURRENCIES = frozenset({
+    'BIF', 'CLP', 'DJF', 'GNF', 'JPY', 'KMF', 'KRW', 'MGA', 'PYG', 'RWF', 'UGX', 'VND', 'VUV', 'XAF', 'XOF', 'XPF'
+})
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serializes an object to JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(data: bytes) -> Any:
+    """
+    Parses JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _to_minor_units(amount: Union[Decimal, int], currency: str) -> int:
+    """
+    Converts an amount in major units (e.g., dollars) to integer minor units (e.g., cents) of the given currency.
+
+    Only Decimal and int amounts are accepted, so the conversion is exact; an int is a whole number of major units.
+
+    Raises:
+        TypeError: If the amount is a float, bool or any other type.
+        ValueError: If the amount is negative or has more precision than the currency allows.
+    """
+    if isinstance(amount, bool) or not isinstance(amount, (Decimal, int)):
+        raise TypeError(f"Amount must be a Decimal or int in major units, not {type(amount).__name__}.")
+    exponent = 0 if currency.upper() in ZERO_DECIMAL_CURRENCIES else 2
+    scaled = Decimal(amount).scaleb(exponent)
+    minor = int(scaled.quantize(Decimal(1), rounding=ROUND_HALF_UP))
+    if minor != scaled:
+        raise ValueError(f"Amount {amount} has more precision than {currency} allows.")
+    if minor < 0:
+        raise ValueError(f"Amount must not be negative: {amount}.")
+    return minor
+
+
+def _status_ttl(response: httpx.Response, transaction_status: Dict[str, Any]) -> float:
+    """
+    Returns how long a transaction status may be served from cache, honoring Cache-Control.
+    """
+    cache_control = response.headers.get('Cache-Control', '')
+    if 'no-store' in cache_control or 'no-cache' in cache_control:
+        return 0.0
+    if transaction_status.get('status') in TERMINAL_STATUSES:
+        return TERMINAL_STATUS_TTL
+    match = _MAX_AGE_RE.search(cache_control)
+    return min(float(match.group(1)), TERMINAL_STATUS_TTL) if match else STATUS_CACHE_TTL
+
+
+def _describe_payment_method(payment_method: Dict[str, Any]) -> str:
+    """
+    Summarizes a payment method for logging without exposing card data, as PCI DSS requires.
+    """
+    kind = payment_method.get('type', 'unknown')
+    number = str(payment_method.get('number') or payment_method.get('card_number') or '')
+    return f"{kind} ending {number[-4:]}" if len(number) >= 4 else kind
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    """
+    Returns how long to wait before the next attempt, honoring Retry-After when the gateway sends one.
+    """
+    if response is not None:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after and retry_after.isdigit():
+            return float(retry_after)
+    # Full jitter keeps concurrent callers from retrying in lockstep
+    return random.uniform(0, RETRY_BACKOFF_FACTOR * 2 ** attempt)
+
+
+def _is_retryable(replay_safe: bool, response: Optional[httpx.Response] = None,
+                  error: Optional[httpx.TransportError] = None) -> bool:
+    """
+    Decides whether a failed attempt may be sent again.
+    """
+    if error is not None:
+        # Only connection failures are known not to have reached the gateway
+        return replay_safe or isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout))
+    if response.status_code not in RETRY_STATUS_CODES:
+        return False
+    return replay_safe or response.status_code == 429
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that paces requests to the gateway's rate limit.
+
+    Callers reserve a token and wait for the returned delay, so waiting happens outside the lock and
+    the same bucket can pace both threads and coroutines.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate (float): Tokens added per second.
+            capacity (int): Maximum burst size.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, borrowing against future refills if the bucket is empty.
+
+        Returns:
+            float: Seconds to wait before the reserved token may be used.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        """
+        Blocks until a token is available.
+        """
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
 
 class PaymentGatewayServiceError(Exception):
     """Custom exception for PaymentGatewayService-related errors."""
     pass
 
 
+class _GatewayUnavailable(Exception):
+    """Raised inside the circuit breaker for a 5xx response that survived retries, so it counts as a failure."""
+
+    def __init__(self, response: httpx.Response):
+        super().__init__(f"Gateway returned {response.status_code}")
+        self.response = response
+
+
 class PaymentGatewayService:
     """
     Provides payment processing capabilities, including handling transactions, refunds,
@@ -31,11 +211,354 @@ class PaymentGatewayService:
         self.config_loader = ConfigLoader()
         self.encryption_manager = EncryptionManager()
         self.auth_manager = AuthenticationManager()
-        self.lock = threading.Lock()
         self.payment_api_config = self._load_payment_api_config()
-        self.session = requests.Session()
+        # Read-only after initialization, so calls can run concurrently without a lock
+        self._api_key = self.payment_api_config['api_key']
+        self._base_url = self.payment_api_config['base_url']
+        # Fixed endpoints are built once; per-resource URLs only append their ids
+        self._payments_url = f"{self._base_url}/payments"
+        self._refunds_url = f"{self._base_url}/refunds"
+        self._users_url = f"{self._base_url}/users"
+        # Built once and shared by the sync and async clients; only per-call extras are passed per request
+        self._default_headers = {
+            'Authorization': f"Bearer {self._api_key}",
+            'Content-Type': 'application/json'
+        }
+        self.session = self._initialize_session()
+        # Paces every attempt, retries included, so bursts do not turn into 429s
+        self._limiter = TokenBucket(rate=self.payment_api_config['rps'], capacity=self.payment_api_config['burst'])
+        # Created on first use inside the caller's event loop by _get_async_session
+        self._async_session: Optional[httpx.AsyncClient] = None
+        self._async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batch_lock = asyncio.Lock()
+        # Sees only calls whose retries are exhausted; while open, calls fail fast instead of waiting on timeouts
+        self._breaker = pybreaker.CircuitBreaker(
+            fail_max=BREAKER_FAIL_MAX, reset_timeout=BREAKER_RESET_TIMEOUT, exclude=[PaymentGatewayServiceError],
+            name='PaymentGatewayService'
+        )
+        # Remembers completed payments and refunds by idempotency key; Redis makes this survive restarts and
+        # span processes, the in-memory store only covers this process while Redis is unreachable
+        self._redis = self._initialize_redis()
+        self._redis_retry_at = 0.0
+        self._idempotency_memory: TTLCache = TTLCache(maxsize=IDEMPOTENCY_MEMORY_SIZE, ttl=IDEMPOTENCY_TTL)
+        self._idempotency_lock = threading.Lock()
+        # Entries carry their own expiry; the cache TTL only bounds how long the longest-lived one is kept
+        self._status_cache: TTLCache = TTLCache(maxsize=STATUS_CACHE_SIZE, ttl=TERMINAL_STATUS_TTL)
+        self._status_cache_lock = threading.Lock()
         self.logger.info("PaymentGatewayService initialized successfully.")
 
+    def _initialize_session(self) -> httpx.Client:
+        """
+        Initializes a pooled HTTP/2 client carrying the gateway's default headers.
+
+        Returns:
+            httpx.Client: The configured client object.
+        """
+        try:
+            self.logger.debug("Initializing HTTP/2 client with connection pooling.")
+            # HTTP/2 multiplexes concurrent calls over a few connections instead of one connection per request
+            session = httpx.Client(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=self.payment_api_config['max_connections'],
+                    max_keepalive_connections=self.payment_api_config['max_keepalive_connections']
+                ),
+                headers=self._default_headers,
+                timeout=15.0
+            )
+            self.logger.debug("HTTP client initialized successfully.")
+            return session
+        except Exception as e:
+            self.logger.error("Error initializing HTTP client: %s", e, exc_info=True)
+            raise PaymentGatewayServiceError(f"Error initializing HTTP client: {e}")
+
+    def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Sends a request, retrying transient failures with exponential backoff and jitter.
+
+        GET and DELETE requests, and requests carrying an Idempotency-Key, are retried on
+        connection failures, timeouts, 429 and 5xx responses. Other requests are only retried when
+        the gateway cannot have seen them (connection failures and 429).
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            **kwargs: Additional arguments passed to httpx.Client.request.
+
+        Returns:
+            httpx.Response: The final response, which may still carry a retryable status once retries run out.
+
+        Raises:
+            httpx.HTTPError: If the request fails at the transport level and cannot be retried.
+        """
+        replay_safe = method in IDEMPOTENT_METHODS or 'Idempotency-Key' in (kwargs.get('headers') or {})
+        deadline = time.monotonic() + RETRY_BUDGET
+        attempt = 0
+        while True:
+            response = None
+            self._limiter.acquire()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if not _is_retryable(replay_safe, error=e):
+                    raise
+                failure = e
+            else:
+                if not _is_retryable(replay_safe, response=response):
+                    return response
+            delay = _retry_delay(attempt, response)
+            if attempt >= MAX_RETRIES or time.monotonic() + delay > deadline:
+                if response is not None:
+                    return response
+                raise failure
+            self.logger.warning("Transient failure on %s %s (attempt %s), retrying in %.2fs.", method, url, attempt + 1, delay)
+            time.sleep(delay)
+            attempt += 1
+
+    def _initialize_redis(self) -> Optional[redis.Redis]:
+        """
+        Initializes a pooled Redis client used as the shared idempotency store.
+
+        Returns:
+            Optional[redis.Redis]: The Redis client, or None if it cannot be configured.
+        """
+        try:
+            self.logger.debug("Initializing Redis connection pool for the idempotency store.")
+            pool = redis.ConnectionPool(
+                host=self.config_loader.get('REDIS_HOST', 'localhost'),
+                port=self.config_loader.get('REDIS_PORT', 6379),
+                max_connections=self.payment_api_config['max_connections'],
+                socket_connect_timeout=1,
+                socket_timeout=1
+            )
+            return redis.Redis(connection_pool=pool)
+        except Exception as e:
+            self.logger.error("Error initializing Redis client, using in-memory idempotency store only: %s", e, exc_info=True)
+            return None
+
+    def _redis_available(self) -> bool:
+        """
+        Checks whether the Redis store should be used for the next operation.
+
+        Returns:
+            bool: True if Redis is configured and not backing off after an error.
+        """
+        return self._redis is not None and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, error: Exception):
+        """
+        Records a Redis error and backs off to the in-memory store for a while.
+
+        Args:
+            error (Exception): The Redis error that occurred.
+        """
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_INTERVAL
+        self.logger.warning("Redis idempotency store unavailable, falling back to in-memory store: %s", error)
+
+    def _claim_idempotency_key(self, scope: str, key: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Atomically claims an idempotency key before its request is sent.
+
+        Args:
+            scope (str): The kind of operation the key belongs to (e.g., 'payment').
+            key (str): The caller's idempotency key.
+
+        Returns:
+            Tuple[bool, Optional[Dict[str, Any]]]: Whether the key was claimed, and the stored result of the
+                completed operation if it was not.
+        """
+        store_key = f"{IDEMPOTENCY_KEY_PREFIX}{scope}:{key}"
+        if self._redis_available():
+            try:
+                # SET NX is a single atomic round-trip, so concurrent retries cannot both claim the key
+                if self._redis.set(store_key, _IN_PROGRESS, nx=True, ex=IDEMPOTENCY_LOCK_TTL):
+                    return True, None
+                stored = self._redis.get(store_key)
+                if stored is None:
+                    # The claim expired between the two commands
+                    return bool(self._redis.set(store_key, _IN_PROGRESS, nx=True, ex=IDEMPOTENCY_LOCK_TTL)), None
+                return False, _loads(stored).get('response')
+            except redis.RedisError as e:
+                self._redis_failed(e)
+        now = time.monotonic()
+        with self._idempotency_lock:
+            entry = self._idempotency_memory.get(store_key)
+            if entry is None or entry[0] <= now:
+                self._idempotency_memory[store_key] = (now + IDEMPOTENCY_LOCK_TTL, None)
+                return True, None
+            return False, entry[1]
+
+    def _complete_idempotency_key(self, scope: str, key: str, result: Optional[Dict[str, Any]]):
+        """
+        Records the result of a claimed operation, or releases the claim if it failed so it can be retried.
+
+        Args:
+            scope (str): The kind of operation the key belongs to.
+            key (str): The caller's idempotency key.
+            result (Optional[Dict[str, Any]]): The gateway's response, or None if the operation failed.
+        """
+        store_key = f"{IDEMPOTENCY_KEY_PREFIX}{scope}:{key}"
+        if self._redis_available():
+            try:
+                if result is None:
+                    self._redis.delete(store_key)
+                else:
+                    self._redis.set(store_key, _dumps({'status': 'done', 'response': result}), ex=IDEMPOTENCY_TTL)
+                return
+            except redis.RedisError as e:
+                self._redis_failed(e)
+        with self._idempotency_lock:
+            if result is None:
+                self._idempotency_memory.pop(store_key, None)
+            else:
+                self._idempotency_memory[store_key] = (time.monotonic() + IDEMPOTENCY_TTL, result)
+
+    def _send_guarded(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Sends a request through the circuit breaker, treating transport errors and 5xx responses as failures.
+
+        Raises:
+            pybreaker.CircuitBreakerError: If the circuit is open.
+            httpx.HTTPError: If the request fails at the transport level.
+        """
+        try:
+            # calling() only holds the breaker's lock to check and update its state; breaker.call() would hold
+            # it for the whole request and serialize every gateway call
+            with self._breaker.calling():
+                response = self._send(method, url, **kwargs)
+                if response.status_code >= 500:
+                    raise _GatewayUnavailable(response)
+                return response
+        except _GatewayUnavailable as e:
+            return e.response
+
+    def _initialize_async_session(self) -> httpx.AsyncClient:
+        """
+        Creates an async HTTP/2 client with the same pool limits and default headers as the sync client.
+
+        Returns:
+            httpx.AsyncClient: The configured async client object.
+        """
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self.payment_api_config['max_connections'],
+                max_keepalive_connections=self.payment_api_config['max_keepalive_connections']
+            ),
+            headers=self._default_headers,
+            timeout=15.0
+        )
+
+    def _get_async_session(self) -> httpx.AsyncClient:
+        """
+        Returns the shared async client, creating it on first use inside the running event loop.
+
+        Returns:
+            httpx.AsyncClient: The shared async client.
+        """
+        loop = asyncio.get_running_loop()
+        # A client's connections belong to the loop that opened them, so a new loop (e.g., another asyncio.run) gets a new client
+        if self._async_session is None or self._async_session.is_closed or self._async_session_loop is not loop:
+            self.logger.debug("Initializing async HTTP/2 client with connection pooling.")
+            self._async_session = self._initialize_async_session()
+            self._async_session_loop = loop
+        return self._async_session
+
+    async def _send_async(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Async counterpart of _send, applying the same retry policy without blocking the event loop.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            **kwargs: Additional arguments passed to httpx.AsyncClient.request.
+
+        Returns:
+            httpx.Response: The final response.
+
+        Raises:
+            httpx.HTTPError: If the request fails at the transport level and cannot be retried.
+        """
+        client = self._get_async_session()
+        replay_safe = method in IDEMPOTENT_METHODS or 'Idempotency-Key' in (kwargs.get('headers') or {})
+        deadline = time.monotonic() + RETRY_BUDGET
+        attempt = 0
+        while True:
+            delay = self._limiter.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+            response = None
+            try:
+                response = await client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if not _is_retryable(replay_safe, error=e):
+                    raise
+                failure = e
+            else:
+                if not _is_retryable(replay_safe, response=response):
+                    return response
+            delay = _retry_delay(attempt, response)
+            if attempt >= MAX_RETRIES or time.monotonic() + delay > deadline:
+                if response is not None:
+                    return response
+                raise failure
+            self.logger.warning("Transient failure on %s %s (attempt %s), retrying in %.2fs.", method, url, attempt + 1, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_guarded_async(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Async counterpart of _send_guarded.
+
+        Raises:
+            pybreaker.CircuitBreakerError: If the circuit is open.
+            httpx.HTTPError: If the request fails at the transport level.
+        """
+        try:
+            with self._breaker.calling():
+                response = await self._send_async(method, url, **kwargs)
+                if response.status_code >= 500:
+                    raise _GatewayUnavailable(response)
+                return response
+        except _GatewayUnavailable as e:
+            return e.response
+
+    async def process_payments_batch(self, items: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Processes many payments concurrently over the shared multiplexed HTTP/2 client.
+
+        Only one batch runs at a time, so a batch cannot eat into another's rate-limit budget.
+
+        Args:
+            items (List[Dict[str, Any]]): One dict per payment, with the keys 'amount', 'currency',
+                'payment_method' and optionally 'description' and 'idempotency_key', as for process_payment.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: The transaction details for each item, in order, or None where
+                the payment failed.
+        """
+        if self._breaker.current_state == pybreaker.STATE_OPEN:
+            self.logger.error("Payment gateway circuit is open; failing batch of %s payments.", len(items))
+            return [None] * len(items)
+        async with self._batch_lock:
+            self.logger.debug("Processing batch of %s payments.", len(items))
+            semaphore = asyncio.Semaphore(self.payment_api_config['max_connections'])
+
+            async def submit(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+                async with semaphore:
+                    return await self.aprocess_payment(**item)
+
+            results = await asyncio.gather(*(submit(item) for item in items), return_exceptions=True)
+        transactions = []
+        for item, result in zip(items, results):
+            if isinstance(result, Exception):
+                self.logger.error("Error processing payment of %s %s: %s", item.get('amount'), item.get('currency'),
+                                  result, exc_info=result)
+                result = None
+            transactions.append(result)
+        self.logger.info("Batch processed: %s of %s payments succeeded.", sum(t is not None for t in transactions), len(items))
+        return transactions
+
     def _load_payment_api_config(self) -> Dict[str, Any]:
         """
         Loads payment API configurations securely.
@@ -51,127 +574,388 @@ class PaymentGatewayService:
             if not api_key_encrypted or not base_url:
                 self.logger.error("Payment API configuration is incomplete.")
                 raise PaymentGatewayServiceError("Payment API configuration is incomplete.")
-            api_key = self.encryption_manager.decrypt_data(api_key_encrypted).decode('utf-8')
+            api_key = _decrypted_api_keys.get(api_key_encrypted)
+            if api_key is None:
+                # Double-checked so concurrent first instantiations decrypt once between them
+                with _decrypt_lock:
+                    api_key = _decrypted_api_keys.get(api_key_encrypted)
+                    if api_key is None:
+                        api_key = self.encryption_manager.decrypt_data(api_key_encrypted).decode('utf-8')
+                        _decrypted_api_keys[api_key_encrypted] = api_key
             self.logger.debug("Payment API configurations loaded successfully.")
             return {
                 'api_key': api_key,
-                'base_url': base_url
+                'base_url': base_url,
+                'max_connections': api_config_encrypted.get('max_connections', 32),
+                'max_keepalive_connections': api_config_encrypted.get('max_keepalive_connections', 16),
+                'rps': api_config_encrypted.get('rps', 50),
+                'burst': api_config_encrypted.get('burst', 100)
             }
         except Exception as e:
-            self.logger.error(f"Error loading payment API configurations: {e}", exc_info=True)
+            self.logger.error("Error loading payment API configurations: %s", e, exc_info=True)
             raise PaymentGatewayServiceError(f"Error loading payment API configurations: {e}")
 
-    def process_payment(self, amount: float, currency: str, payment_method: Dict[str, Any], description: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def _call(self, method: str, url: str, action: str, *, payload: Optional[Dict[str, Any]] = None,
+              expect: Tuple[int, ...] = (200, 201), handle: Optional[Callable[[httpx.Response], Any]] = None,
+              **kwargs) -> Any:
+        """
+        Sends a gateway request and handles status checks, decoding and error logging in one place.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            action (str): What the call does, for log messages (e.g., 'process payment').
+            payload (Optional[Dict[str, Any]], optional): The JSON request body. Defaults to None.
+            expect (Tuple[int, ...], optional): Status codes that count as success. Defaults to (200, 201).
+            handle (Optional[Callable[[httpx.Response], Any]], optional): Turns a successful response into the
+                result. Defaults to None (the decoded JSON body).
+            **kwargs: Additional arguments passed to _send.
+
+        Returns:
+            Any: The result of a successful call, else None.
+        """
+        try:
+            self.logger.debug("Sending %s %s to %s.", method, url, action)
+            if payload is not None:
+                kwargs['content'] = _dumps(payload)
+            response = self._send_guarded(method, url, **kwargs)
+            return self._handle_response(response, action, expect, handle)
+        except pybreaker.CircuitBreakerError:
+            self.logger.error("Payment gateway circuit is open; not trying to %s.", action)
+            return None
+        except httpx.HTTPError as e:
+            self.logger.error("Request exception while trying to %s: %s", action, e, exc_info=True)
+            return None
+        except Exception as e:
+            self.logger.error("Unexpected error while trying to %s: %s", action, e, exc_info=True)
+            return None
+
+    async def _call_async(self, method: str, url: str, action: str, *, payload: Optional[Dict[str, Any]] = None,
+                          expect: Tuple[int, ...] = (200, 201), handle: Optional[Callable[[httpx.Response], Any]] = None,
+                          **kwargs) -> Any:
+        """
+        Async counterpart of _call, sending the request over the shared async client.
+
+        Returns:
+            Any: The result of a successful call, else None.
+        """
+        try:
+            self.logger.debug("Sending %s %s to %s.", method, url, action)
+            if payload is not None:
+                kwargs['content'] = _dumps(payload)
+            response = await self._send_guarded_async(method, url, **kwargs)
+            return self._handle_response(response, action, expect, handle)
+        except pybreaker.CircuitBreakerError:
+            self.logger.error("Payment gateway circuit is open; not trying to %s.", action)
+            return None
+        except httpx.HTTPError as e:
+            self.logger.error("Request exception while trying to %s: %s", action, e, exc_info=True)
+            return None
+        except Exception as e:
+            self.logger.error("Unexpected error while trying to %s: %s", action, e, exc_info=True)
+            return None
+
+    def _handle_response(self, response: httpx.Response, action: str, expect: Tuple[int, ...],
+                         handle: Optional[Callable[[httpx.Response], Any]]) -> Any:
+        """
+        Checks a response's status and turns it into the call's result.
+
+        Returns:
+            Any: The result of a successful call, else None.
+        """
+        if response.status_code not in expect:
+            self.logger.error("Failed to %s. Status Code: %s, Response: %s", action, response.status_code, response.text)
+            return None
+        return handle(response) if handle else _loads(response.content)
+
+    def _claim_or_replay(self, scope: str, key: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Claims an idempotency key, logging why the operation will not be sent when the key is taken.
+
+        Returns:
+            Tuple[bool, Optional[Dict[str, Any]]]: Whether to send the operation, and the stored result to
+                return instead when not.
+        """
+        claimed, stored = self._claim_idempotency_key(scope, key)
+        if not claimed:
+            if stored is None:
+                self.logger.error("%s with idempotency key '%s' is already in progress.", scope.capitalize(), key)
+            else:
+                self.logger.info("%s with idempotency key '%s' already processed: ID %s.", scope.capitalize(), key, stored.get('id'))
+        return claimed, stored
+
+    def _build_payment_payload(self, amount: Union[Decimal, int], currency: str, payment_method: Dict[str, Any],
+                               description: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Builds the request body for a payment.
+
+        Returns:
+            Optional[Dict[str, Any]]: The payload, or None if the amount is invalid.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Processing payment of %s %s with payment method: %s.", amount, currency,
+                              _describe_payment_method(payment_method))
+        try:
+            minor_units = _to_minor_units(amount, currency)
+        except ValueError as e:
+            self.logger.error("Invalid payment amount: %s", e)
+            return None
+        return {
+            'amount': minor_units,
+            'currency': currency,
+            'payment_method': payment_method,
+            'description': description or "Payment Transaction"
+        }
+
+    def _build_refund_payload(self, transaction_id: str, amount: Optional[Union[Decimal, int]],
+                              currency: str) -> Optional[Dict[str, Any]]:
+        """
+        Builds the request body for a refund.
+
+        Returns:
+            Optional[Dict[str, Any]]: The payload, or None if the amount is invalid.
+        """
+        self.logger.debug("Processing refund for Transaction ID '%s' with amount: %s.", transaction_id, amount)
+        payload = {'transaction_id': transaction_id}
+        if amount:
+            try:
+                payload['amount'] = _to_minor_units(amount, currency)
+            except ValueError as e:
+                self.logger.error("Invalid refund amount: %s", e)
+                return None
+        return payload
+
+    def _invalidate_status(self, transaction_id: str):
+        """
+        Drops a transaction's cached status; a refund changes it, even one cached as final.
+        """
+        with self._status_cache_lock:
+            self._status_cache.pop(transaction_id, None)
+
+    def _cached_status(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns a copy of a transaction's cached status if it is still fresh.
+        """
+        # TTLCache reorders on every read, so the lookup has to stay under the lock
+        with self._status_cache_lock:
+            cached = self._status_cache.get(transaction_id)
+        if cached is not None and cached[0] > time.monotonic():
+            self.logger.debug("Serving cached status for Transaction ID '%s'.", transaction_id)
+            return dict(cached[1])
+        return None
+
+    def _store_status(self, transaction_id: str, response: httpx.Response) -> Dict[str, Any]:
+        """
+        Decodes a transaction status response and caches it for as long as it may be reused.
+        """
+        transaction_status = _loads(response.content)
+        ttl = _status_ttl(response, transaction_status)
+        if ttl > 0:
+            with self._status_cache_lock:
+                self._status_cache[transaction_id] = (time.monotonic() + ttl, transaction_status)
+            transaction_status = dict(transaction_status)
+        return transaction_status
+
+    def process_payment(self, amount: Union[Decimal, int], currency: str, payment_method: Dict[str, Any], description: Optional[str] = None,
+                        idempotency_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Processes a payment transaction.
 
         Args:
-            amount (float): The amount to be charged.
+            amount (Union[Decimal, int]): The amount to be charged, in major units (e.g., Decimal('10.50') USD).
+                A float raises TypeError rather than risk binary rounding.
             currency (str): The currency in which the payment is made (e.g., 'USD').
             payment_method (Dict[str, Any]): The payment method details (e.g., card information).
             description (Optional[str], optional): A description for the transaction. Defaults to None.
+            idempotency_key (Optional[str], optional): A key identifying this logical payment. Store it with the
+                caller's own transaction record and pass it again when retrying, so the gateway charges at most
+                once. A key that already completed returns the stored transaction without calling the gateway,
+                and None is returned while the first attempt is still in flight. Defaults to None (a new key
+                is generated).
 
         Returns:
             Optional[Dict[str, Any]]: A dictionary containing transaction details if successful, else None.
+
+        Raises:
+            TypeError: If the amount is not a Decimal or int.
         """
-        try:
-            self.logger.debug(f"Processing payment of {amount} {currency} with payment method: {payment_method}.")
-            with self.lock:
-                headers = {
-                    'Authorization': f"Bearer {self.payment_api_config['api_key']}",
-                    'Content-Type': 'application/json'
-                }
-                payload = {
-                    'amount': amount,
-                    'currency': currency,
-                    'payment_method': payment_method,
-                    'description': description or "Payment Transaction"
-                }
-                response = self.session.post(f"{self.payment_api_config['base_url']}/payments", json=payload, headers=headers, timeout=15)
-                if response.status_code == 201:
-                    transaction = response.json()
-                    self.logger.info(f"Payment processed successfully: Transaction ID {transaction.get('id')}.")
-                    return transaction
-                else:
-                    self.logger.error(f"Failed to process payment. Status Code: {response.status_code}, Response: {response.text}")
-                    return None
-        except requests.RequestException as e:
-            self.logger.error(f"Request exception during payment processing: {e}", exc_info=True)
+        payload = self._build_payment_payload(amount, currency, payment_method, description)
+        if payload is None:
             return None
-        except Exception as e:
-            self.logger.error(f"Unexpected error during payment processing: {e}", exc_info=True)
+        if idempotency_key:
+            claimed, stored = self._claim_or_replay('payment', idempotency_key)
+            if not claimed:
+                return stored
+        transaction = self._call(
+            'POST', self._payments_url, 'process payment', payload=payload, expect=(201,),
+            # Reused across retries so the gateway charges at most once
+            headers={'Idempotency-Key': idempotency_key or str(uuid.uuid4())}, timeout=15
+        )
+        if idempotency_key:
+            self._complete_idempotency_key('payment', idempotency_key, transaction)
+        if transaction is not None:
+            self.logger.info("Payment processed successfully: Transaction ID %s.", transaction.get('id'))
+        return transaction
+
+    async def aprocess_payment(self, amount: Union[Decimal, int], currency: str, payment_method: Dict[str, Any],
+                               description: Optional[str] = None, idempotency_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Asynchronously processes a payment transaction.
+
+        Args:
+            amount (Union[Decimal, int]): The amount to be charged, as for process_payment.
+            currency (str): The currency in which the payment is made (e.g., 'USD').
+            payment_method (Dict[str, Any]): The payment method details (e.g., card information).
+            description (Optional[str], optional): A description for the transaction. Defaults to None.
+            idempotency_key (Optional[str], optional): A key identifying this logical payment, as for
+                process_payment. Defaults to None (a new key is generated).
+
+        Returns:
+            Optional[Dict[str, Any]]: A dictionary containing transaction details if successful, else None.
+
+        Raises:
+            TypeError: If the amount is not a Decimal or int.
+        """
+        payload = self._build_payment_payload(amount, currency, payment_method, description)
+        if payload is None:
             return None
+        if idempotency_key:
+            # The idempotency store is synchronous, so it runs off the event loop
+            claimed, stored = await asyncio.to_thread(self._claim_or_replay, 'payment', idempotency_key)
+            if not claimed:
+                return stored
+        transaction = await self._call_async(
+            'POST', self._payments_url, 'process payment', payload=payload, expect=(201,),
+            headers={'Idempotency-Key': idempotency_key or str(uuid.uuid4())}, timeout=15
+        )
+        if idempotency_key:
+            await asyncio.to_thread(self._complete_idempotency_key, 'payment', idempotency_key, transaction)
+        if transaction is not None:
+            self.logger.info("Payment processed successfully: Transaction ID %s.", transaction.get('id'))
+        return transaction
 
-    def refund_payment(self, transaction_id: str, amount: Optional[float] = None) -> Optional[Dict[str, Any]]:
+    def refund_payment(self, transaction_id: str, amount: Optional[Union[Decimal, int]] = None,
+                       currency: str = 'USD',
+                       idempotency_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Processes a refund for a specific transaction.
 
         Args:
             transaction_id (str): The unique identifier of the transaction to refund.
-            amount (Optional[float], optional): The amount to refund. If None, full refund is processed. Defaults to None.
+            amount (Optional[Union[Decimal, int]], optional): The amount to refund, in major units as for
+                process_payment. If None, full refund is processed. Defaults to None.
+            currency (str, optional): The currency of the transaction, used to convert the amount to minor units.
+                Defaults to 'USD'.
+            idempotency_key (Optional[str], optional): A key identifying this logical refund; pass it again when
+                retrying so the gateway refunds at most once. A key that already completed returns the stored
+                refund without calling the gateway. Defaults to None (a new key is generated).
 
         Returns:
             Optional[Dict[str, Any]]: A dictionary containing refund details if successful, else None.
+
+        Raises:
+            TypeError: If the amount is not a Decimal or int.
         """
-        try:
-            self.logger.debug(f"Processing refund for Transaction ID '{transaction_id}' with amount: {amount}.")
-            with self.lock:
-                headers = {
-                    'Authorization': f"Bearer {self.payment_api_config['api_key']}",
-                    'Content-Type': 'application/json'
-                }
-                payload = {
-                    'transaction_id': transaction_id,
-                    'amount': amount
-                } if amount else {
-                    'transaction_id': transaction_id
-                }
-                response = self.session.post(f"{self.payment_api_config['base_url']}/refunds", json=payload, headers=headers, timeout=15)
-                if response.status_code in [200, 201]:
-                    refund = response.json()
-                    self.logger.info(f"Refund processed successfully: Refund ID {refund.get('id')}.")
-                    return refund
-                else:
-                    self.logger.error(f"Failed to process refund. Status Code: {response.status_code}, Response: {response.text}")
-                    return None
-        except requests.RequestException as e:
-            self.logger.error(f"Request exception during refund processing: {e}", exc_info=True)
+        payload = self._build_refund_payload(transaction_id, amount, currency)
+        if payload is None:
             return None
-        except Exception as e:
-            self.logger.error(f"Unexpected error during refund processing: {e}", exc_info=True)
+        if idempotency_key:
+            claimed, stored = self._claim_or_replay('refund', idempotency_key)
+            if not claimed:
+                return stored
+        refund = self._call(
+            'POST', self._refunds_url, 'process refund', payload=payload,
+            headers={'Idempotency-Key': idempotency_key or str(uuid.uuid4())}, timeout=15
+        )
+        if idempotency_key:
+            self._complete_idempotency_key('refund', idempotency_key, refund)
+        self._invalidate_status(transaction_id)
+        if refund is not None:
+            self.logger.info("Refund processed successfully: Refund ID %s.", refund.get('id'))
+        return refund
+
+    async def arefund_payment(self, transaction_id: str, amount: Optional[Union[Decimal, int]] = None,
+                              currency: str = 'USD', idempotency_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Asynchronously processes a refund for a specific transaction.
+
+        Args:
+            transaction_id (str): The unique identifier of the transaction to refund.
+            amount (Optional[Union[Decimal, int]], optional): The amount to refund, as for refund_payment.
+                If None, full refund is processed. Defaults to None.
+            currency (str, optional): The currency of the transaction. Defaults to 'USD'.
+            idempotency_key (Optional[str], optional): A key identifying this logical refund, as for
+                refund_payment. Defaults to None (a new key is generated).
+
+        Returns:
+            Optional[Dict[str, Any]]: A dictionary containing refund details if successful, else None.
+
+        Raises:
+            TypeError: If the amount is not a Decimal or int.
+        """
+        payload = self._build_refund_payload(transaction_id, amount, currency)
+        if payload is None:
             return None
+        if idempotency_key:
+            claimed, stored = await asyncio.to_thread(self._claim_or_replay, 'refund', idempotency_key)
+            if not claimed:
+                return stored
+        refund = await self._call_async(
+            'POST', self._refunds_url, 'process refund', payload=payload,
+            headers={'Idempotency-Key': idempotency_key or str(uuid.uuid4())}, timeout=15
+        )
+        if idempotency_key:
+            await asyncio.to_thread(self._complete_idempotency_key, 'refund', idempotency_key, refund)
+        self._invalidate_status(transaction_id)
+        if refund is not None:
+            self.logger.info("Refund processed successfully: Refund ID %s.", refund.get('id'))
+        return refund
 
     def get_transaction_status(self, transaction_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieves the status of a specific transaction.
 
+        Statuses are cached briefly (or for as long as the gateway's Cache-Control max-age allows), and
+        final statuses for much longer, so repeated polling does not hit the gateway every time.
+
         Args:
             transaction_id (str): The unique identifier of the transaction.
 
         Returns:
             Optional[Dict[str, Any]]: A dictionary containing transaction status details if successful, else None.
         """
-        try:
-            self.logger.debug(f"Retrieving status for Transaction ID '{transaction_id}'.")
-            with self.lock:
-                headers = {
-                    'Authorization': f"Bearer {self.payment_api_config['api_key']}",
-                    'Content-Type': 'application/json'
-                }
-                response = self.session.get(f"{self.payment_api_config['base_url']}/payments/{transaction_id}", headers=headers, timeout=10)
-                if response.status_code == 200:
-                    transaction_status = response.json()
-                    self.logger.info(f"Transaction status retrieved successfully for Transaction ID '{transaction_id}'.")
-                    return transaction_status
-                else:
-                    self.logger.error(f"Failed to retrieve transaction status. Status Code: {response.status_code}, Response: {response.text}")
-                    return None
-        except requests.RequestException as e:
-            self.logger.error(f"Request exception during transaction status retrieval: {e}", exc_info=True)
-            return None
-        except Exception as e:
-            self.logger.error(f"Unexpected error during transaction status retrieval: {e}", exc_info=True)
-            return None
+        cached = self._cached_status(transaction_id)
+        if cached is not None:
+            return cached
+        transaction_status = self._call(
+            'GET', f"{self._payments_url}/{transaction_id}", 'retrieve transaction status',
+            expect=(200,), handle=lambda response: self._store_status(transaction_id, response), timeout=10
+        )
+        if transaction_status is not None:
+            self.logger.info("Transaction status retrieved successfully for Transaction ID '%s'.", transaction_id)
+        return transaction_status
+
+    async def aget_transaction_status(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Asynchronously retrieves the status of a specific transaction, sharing the status cache with
+        get_transaction_status.
+
+        Args:
+            transaction_id (str): The unique identifier of the transaction.
+
+        Returns:
+            Optional[Dict[str, Any]]: A dictionary containing transaction status details if successful, else None.
+        """
+        cached = self._cached_status(transaction_id)
+        if cached is not None:
+            return cached
+        transaction_status = await self._call_async(
+            'GET', f"{self._payments_url}/{transaction_id}", 'retrieve transaction status',
+            expect=(200,), handle=lambda response: self._store_status(transaction_id, response), timeout=10
+        )
+        if transaction_status is not None:
+            self.logger.info("Transaction status retrieved successfully for Transaction ID '%s'.", transaction_id)
+        return transaction_status
 
     def add_payment_method(self, user_id: str, payment_method: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
@@ -184,31 +968,44 @@ class PaymentGatewayService:
         Returns:
             Optional[Dict[str, Any]]: A dictionary containing payment method details if successful, else None.
         """
-        try:
-            self.logger.debug(f"Adding payment method for User ID '{user_id}': {payment_method}.")
-            with self.lock:
-                headers = {
-                    'Authorization': f"Bearer {self.payment_api_config['api_key']}",
-                    'Content-Type': 'application/json'
-                }
-                payload = {
-                    'user_id': user_id,
-                    'payment_method': payment_method
-                }
-                response = self.session.post(f"{self.payment_api_config['base_url']}/users/{user_id}/payment_methods", json=payload, headers=headers, timeout=15)
-                if response.status_code == 201:
-                    payment_method_response = response.json()
-                    self.logger.info(f"Payment method added successfully for User ID '{user_id}': Method ID {payment_method_response.get('id')}.")
-                    return payment_method_response
-                else:
-                    self.logger.error(f"Failed to add payment method. Status Code: {response.status_code}, Response: {response.text}")
-                    return None
-        except requests.RequestException as e:
-            self.logger.error(f"Request exception during adding payment method: {e}", exc_info=True)
-            return None
-        except Exception as e:
-            self.logger.error(f"Unexpected error during adding payment method: {e}", exc_info=True)
-            return None
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Adding payment method for User ID '%s': %s.", user_id, _describe_payment_method(payment_method))
+        payload = {
+            'user_id': user_id,
+            'payment_method': payment_method
+        }
+        payment_method_response = self._call(
+            'POST', f"{self._users_url}/{user_id}/payment_methods", 'add payment method',
+            payload=payload, expect=(201,), timeout=15
+        )
+        if payment_method_response is not None:
+            self.logger.info("Payment method added successfully for User ID '%s': Method ID %s.", user_id, payment_method_response.get('id'))
+        return payment_method_response
+
+    async def aadd_payment_method(self, user_id: str, payment_method: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Asynchronously adds a new payment method for a user.
+
+        Args:
+            user_id (str): The unique identifier of the user.
+            payment_method (Dict[str, Any]): The payment method details (e.g., card information).
+
+        Returns:
+            Optional[Dict[str, Any]]: A dictionary containing payment method details if successful, else None.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Adding payment method for User ID '%s': %s.", user_id, _describe_payment_method(payment_method))
+        payload = {
+            'user_id': user_id,
+            'payment_method': payment_method
+        }
+        payment_method_response = await self._call_async(
+            'POST', f"{self._users_url}/{user_id}/payment_methods", 'add payment method',
+            payload=payload, expect=(201,), timeout=15
+        )
+        if payment_method_response is not None:
+            self.logger.info("Payment method added successfully for User ID '%s': Method ID %s.", user_id, payment_method_response.get('id'))
+        return payment_method_response
 
     def remove_payment_method(self, user_id: str, payment_method_id: str) -> bool:
         """
@@ -221,26 +1018,34 @@ class PaymentGatewayService:
         Returns:
             bool: True if the payment method is removed successfully, False otherwise.
         """
-        try:
-            self.logger.debug(f"Removing payment method ID '{payment_method_id}' for User ID '{user_id}'.")
-            with self.lock:
-                headers = {
-                    'Authorization': f"Bearer {self.payment_api_config['api_key']}",
-                    'Content-Type': 'application/json'
-                }
-                response = self.session.delete(f"{self.payment_api_config['base_url']}/users/{user_id}/payment_methods/{payment_method_id}", headers=headers, timeout=10)
-                if response.status_code == 200:
-                    self.logger.info(f"Payment method ID '{payment_method_id}' removed successfully for User ID '{user_id}'.")
-                    return True
-                else:
-                    self.logger.error(f"Failed to remove payment method. Status Code: {response.status_code}, Response: {response.text}")
-                    return False
-        except requests.RequestException as e:
-            self.logger.error(f"Request exception during removing payment method: {e}", exc_info=True)
-            return False
-        except Exception as e:
-            self.logger.error(f"Unexpected error during removing payment method: {e}", exc_info=True)
-            return False
+        self.logger.debug("Removing payment method ID '%s' for User ID '%s'.", payment_method_id, user_id)
+        removed = self._call(
+            'DELETE', f"{self._users_url}/{user_id}/payment_methods/{payment_method_id}", 'remove payment method',
+            expect=(200,), handle=lambda response: True, timeout=10
+        )
+        if removed:
+            self.logger.info("Payment method ID '%s' removed successfully for User ID '%s'.", payment_method_id, user_id)
+        return bool(removed)
+
+    async def aremove_payment_method(self, user_id: str, payment_method_id: str) -> bool:
+        """
+        Asynchronously removes an existing payment method for a user.
+
+        Args:
+            user_id (str): The unique identifier of the user.
+            payment_method_id (str): The unique identifier of the payment method to remove.
+
+        Returns:
+            bool: True if the payment method is removed successfully, False otherwise.
+        """
+        self.logger.debug("Removing payment method ID '%s' for User ID '%s'.", payment_method_id, user_id)
+        removed = await self._call_async(
+            'DELETE', f"{self._users_url}/{user_id}/payment_methods/{payment_method_id}", 'remove payment method',
+            expect=(200,), handle=lambda response: True, timeout=10
+        )
+        if removed:
+            self.logger.info("Payment method ID '%s' removed successfully for User ID '%s'.", payment_method_id, user_id)
+        return bool(removed)
 
     def close_service(self):
         """
@@ -250,8 +1055,24 @@ class PaymentGatewayService:
             self.logger.debug("Closing PaymentGatewayService resources.")
             if self.session:
                 self.session.close()
-                self.logger.debug("HTTP session closed.")
+                self.logger.debug("HTTP client closed.")
+            if self._redis is not None:
+                self._redis.close()
             self.logger.info("PaymentGatewayService closed successfully.")
         except Exception as e:
-            self.logger.error(f"Error closing PaymentGatewayService: {e}", exc_info=True)
+            self.logger.error("Error closing PaymentGatewayService: %s", e, exc_info=True)
             raise PaymentGatewayServiceError(f"Error closing PaymentGatewayService: {e}")
+
+    async def aclose_service(self):
+        """
+        Closes the async HTTP client along with the other resources held by the service.
+        """
+        try:
+            if self._async_session is not None and not self._async_session.is_closed:
+                await self._async_session.aclose()
+            self._async_session = None
+            self._async_session_loop = None
+        except Exception as e:
+            self.logger.error("Error closing async HTTP client: %s", e, exc_info=True)
+            raise PaymentGatewayServiceError(f"Error closing async HTTP client: {e}")
+        self.close_service()
@@ -1,14 +1,28 @@
 # services/pdf_reader_service.py
 
-from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+import hashlib
+import heapq
+from io import BytesIO, StringIO
+import json
 import logging
+import mmap
+import multiprocessing
+import re
+import tempfile
 import threading
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Collection, Dict, Iterator, List, Optional, Tuple, Union
 import os
 from pathlib import Path
-from pdfminer.high_level import extract_text
+from pdfminer.converter import TextConverter
 from pdfminer.layout import LAParams
-from PyPDF2 import PdfReader, PdfWriter
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from PyPDF2 import PageObject, PdfReader, PdfWriter
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, NullObject, StreamObject
+from cachetools import LRUCache
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from modules.utilities.logging_manager import setup_logging
@@ -16,6 +30,574 @@ from modules.utilities.config_loader import ConfigLoader
 from modules.security.encryption_manager import EncryptionManager
 from modules.security.authentication import AuthenticationManager
 
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None  # Fall back to PDFMiner for text extraction
+
+try:
+    from pdfrw import PdfReader as RWPdfReader, PdfWriter as RWPdfWriter
+except ImportError:
+    RWPdfReader = RWPdfWriter = None  # PyPDF2 handles all page manipulation
+
+PARALLEL_PAGE_THRESHOLD = 64  # pages below which stamping a PDF in one process is faster than shipping it to workers
+PARALLEL_FILE_THRESHOLD = 8  # encrypted inputs below which merge_pdfs decrypts them in-process
+FINGERPRINT_CHUNK = 65536  # bytes hashed from each end of a file to fingerprint its content
+ENCRYPT_SCAN_SIZE = 4096  # bytes at the end of a file searched for the trailer's /Encrypt entry
+RESULT_CACHE_SIZE = 256  # extracted texts and metadata dicts kept in memory
+READER_CACHE_SIZE = 32  # parsed PdfReaders kept for reuse across calls on the same file
+DISK_CACHE_MAX_ENTRIES = 4096  # cached result files kept on disk before the oldest are pruned
+DISK_CACHE_PRUNE_INTERVAL = 64  # cache writes between scans of the cache directory for pruning
+WRITE_BUFFER_SIZE = 1024 * 1024  # PdfWriter issues many small writes; a large buffer batches them into few syscalls
+INHERITABLE_PAGE_ATTRIBUTES = ('/Resources', '/MediaBox', '/CropBox', '/Rotate')
+# Text-showing operators: Tj and TJ, and ' and " which follow a string operand
+TEXT_OPERATOR_PATTERN = re.compile(rb"\bT[jJ]\b|[)>]\s*['\"]")
+
+logger = logging.getLogger('PDFReaderService')
+_logging_configured = False  # setup_logging runs once per process, not once per service instance
+
+
+def _fingerprint(pdf_file: BinaryIO) -> str:
+    """
+    Fingerprints an open PDF by its size and its first and last 64 KB.
+
+    Edits to a PDF are appended as incremental updates or rewrite the file, so they change its size
+    or tail, while hashing only the ends keeps this cheap for very large files.
+    """
+    size = os.fstat(pdf_file.fileno()).st_size
+    digest = hashlib.blake2b(str(size).encode('ascii'), digest_size=16)
+    pdf_file.seek(0)
+    digest.update(pdf_file.read(FINGERPRINT_CHUNK))
+    if size > FINGERPRINT_CHUNK:
+        pdf_file.seek(max(FINGERPRINT_CHUNK, size - FINGERPRINT_CHUNK))
+        digest.update(pdf_file.read())
+    return digest.hexdigest()
+
+
+def _is_encrypted_fast(pdf_file: BinaryIO) -> bool:
+    """
+    Looks for the trailer's /Encrypt entry in the last 4 KB of a PDF, without parsing the file, so that
+    encrypted PDFs opened without a password fail before any expensive work.
+
+    Not finding it does not prove a PDF unencrypted (a linearized file may name it only in its first-page
+    trailer), so callers still check is_encrypted after parsing.
+    """
+    size = pdf_file.seek(0, os.SEEK_END)
+    pdf_file.seek(max(0, size - ENCRYPT_SCAN_SIZE))
+    return b'/Encrypt' in pdf_file.read()
+
+
+def _file_identity(pdf_file: BinaryIO) -> Tuple[int, int, int, int]:
+    """
+    Identifies the file behind an open handle by device, inode, modification time and size.
+    """
+    stat = os.fstat(pdf_file.fileno())
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+@contextmanager
+def _open_mmap(source: Union[str, BinaryIO], identity: Optional[Tuple[int, int, int, int]] = None) -> Iterator[mmap.mmap]:
+    """
+    Memory-maps a PDF read-only, so the OS pages it in on demand instead of it being read into memory.
+
+    Given a path, PyPDF2 reads the whole file into memory first; given the map, it reads it like a file.
+    Objects parsed from it read lazily, so finish with them before the block exits.
+
+    Args:
+        source (Union[str, BinaryIO]): An open PDF file to map, or the path of one to open.
+        identity (Optional[Tuple[int, int, int, int]], optional): The _file_identity the caller saw when it
+            opened the same path. Pool workers pass it so they never read a file replaced since. Defaults to None.
+
+    Raises:
+        PDFReaderServiceError: If the file at the path no longer matches identity.
+    """
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            if identity is not None and _file_identity(f) != identity:
+                raise PDFReaderServiceError(f"PDF '{source}' changed while it was being processed.")
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    else:
+        mapped = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield mapped
+    finally:
+        mapped.close()
+
+
+def _draw_watermark(can: canvas.Canvas, text: str, position: str, opacity: float):
+    """
+    Draws watermark text on the current page of a canvas, placed on a letter-size grid.
+
+    Args:
+        can (canvas.Canvas): The canvas to draw on.
+        text (str): The watermark text.
+        position (str): The position of the watermark ('center', 'top-left', 'top-right', 'bottom-left', 'bottom-right').
+        opacity (float): The opacity of the watermark.
+    """
+    can.saveState()
+    can.setFillAlpha(opacity)
+    can.setFont("Helvetica", 40)
+
+    width, height = letter
+    text_width = can.stringWidth(text, "Helvetica", 40)
+
+    if position == 'center':
+        x = (width - text_width) / 2
+        y = height / 2
+    elif position == 'top-left':
+        x = 50
+        y = height - 50
+    elif position == 'top-right':
+        x = width - text_width - 50
+        y = height - 50
+    elif position == 'bottom-left':
+        x = 50
+        y = 50
+    elif position == 'bottom-right':
+        x = width - text_width - 50
+        y = 50
+    else:
+        x = (width - text_width) / 2
+        y = height / 2
+
+    can.drawString(x, y, text)
+    can.restoreState()
+
+
+def _render_overlays(pages: List[Any], first_number: int, watermark: Union[None, bytes, Tuple[str, str, float]],
+                     number_pages: bool) -> List[Any]:
+    """
+    Renders the overlays for a run of pages on one canvas, parsed once, with one overlay page per source page.
+
+    When pages are both watermarked and numbered, each overlay carries both, so every source page is
+    merged only once. Without page numbers, one watermark page is rendered and shared by all pages.
+
+    Args:
+        pages (List[Any]): The source pages, whose sizes numbered overlays match.
+        first_number (int): The number printed on the first page.
+        watermark (Union[None, bytes, Tuple[str, str, float]]): The watermark text, position and opacity,
+            a watermark template rendered by create_watermark_template, or None.
+        number_pages (bool): Whether to add page numbers.
+
+    Returns:
+        List[Any]: The overlay pages, in the same order as the source pages.
+    """
+    template_page = PdfReader(BytesIO(watermark)).pages[0] if isinstance(watermark, bytes) else None
+    if not number_pages and template_page is not None:
+        return [template_page] * len(pages)
+    packet = BytesIO()
+    can = canvas.Canvas(packet, pagesize=letter)
+    if not number_pages:
+        _draw_watermark(can, *watermark)
+        can.showPage()
+        can.save()
+        packet.seek(0)
+        return [PdfReader(packet).pages[0]] * len(pages)
+    for number, page in enumerate(pages, start=first_number):
+        width, height = float(page.mediabox.width), float(page.mediabox.height)
+        can.setPageSize((width, height))
+        if isinstance(watermark, tuple):
+            _draw_watermark(can, *watermark)
+        can.setFont("Helvetica", 12)
+        can.drawString(width - 50, 20, f"Page {number}")
+        can.showPage()
+    can.save()
+    packet.seek(0)
+    overlays = PdfReader(packet).pages
+    if template_page is not None:
+        for overlay in overlays:
+            overlay.merge_page(template_page)
+    return overlays
+
+
+def _stamp_reader_pages(reader: PdfReader, start: int, stop: int,
+                        watermark: Union[None, bytes, Tuple[str, str, float]], number_pages: bool) -> PdfWriter:
+    """
+    Merges a watermark and/or page numbers onto a range of a reader's pages.
+
+    The overlays are merged into the reader's pages in place, so the reader must not be shared.
+
+    Args:
+        reader (PdfReader): The reader, already decrypted if the PDF is encrypted.
+        start (int): Index of the first page to stamp.
+        stop (int): Index one past the last page to stamp.
+        watermark (Union[None, bytes, Tuple[str, str, float]]): The watermark text, position and opacity,
+            a watermark template, or None.
+        number_pages (bool): Whether to add page numbers.
+
+    Returns:
+        PdfWriter: A writer holding the stamped pages, which read from the reader's source until written.
+    """
+    pages = [reader.pages[index] for index in range(start, stop)]
+    if watermark is not None or number_pages:
+        overlays = _render_overlays(pages, start + 1, watermark, number_pages)
+    else:
+        overlays = [None] * len(pages)
+    writer = PdfWriter()
+    for page, overlay in zip(pages, overlays):
+        if overlay is not None:
+            page.merge_page(overlay)
+        writer.add_page(page)
+    return writer
+
+
+def _stamp_pages(pdf_path: str, password: Optional[str], start: int, stop: int,
+                 watermark: Union[None, bytes, Tuple[str, str, float]], number_pages: bool,
+                 identity: Optional[Tuple[int, int, int, int]] = None) -> bytes:
+    """
+    Stamps a range of pages in a pool worker and serializes them as a PDF.
+
+    Runs in pool worker processes, so it returns bytes rather than a writer. Each worker maps the
+    source file itself, so only its path is sent to the worker and the pages are shared through the
+    OS page cache.
+
+    Args:
+        pdf_path (str): The path of the source PDF.
+        password (Optional[str]): The password for encrypted PDFs.
+        start (int): Index of the first page to stamp.
+        stop (int): Index one past the last page to stamp.
+        watermark (Union[None, bytes, Tuple[str, str, float]]): The watermark text, position and opacity,
+            a watermark template, or None.
+        number_pages (bool): Whether to add page numbers.
+        identity (Optional[Tuple[int, int, int, int]], optional): The source file's identity as seen by the
+            caller, checked when the worker opens the path. Defaults to None.
+
+    Returns:
+        bytes: A PDF containing the stamped pages.
+
+    Raises:
+        PDFReaderServiceError: If the file at the path is no longer the one the caller opened.
+    """
+    with _open_mmap(pdf_path, identity) as mapped:
+        reader = PdfReader(mapped)
+        if reader.is_encrypted:
+            reader.decrypt(password)
+        output = BytesIO()
+        _stamp_reader_pages(reader, start, stop, watermark, number_pages).write(output)
+    return output.getvalue()
+
+
+def _read_merge_input(pdf_path: str, password: Optional[str]) -> Optional[bytes]:
+    """
+    Decrypts one merge input in a pool worker, so the parent can append its pages directly.
+
+    Only inputs whose trailer names /Encrypt are sent here, but that scan can be fooled, so an input that
+    turns out unencrypted is left to the parent.
+
+    Returns:
+        Optional[bytes]: A decrypted copy of an encrypted PDF, or None if the PDF is not encrypted and the
+            parent can map the file itself.
+
+    Raises:
+        PDFReaderServiceError: If the PDF is encrypted and no password was provided.
+    """
+    with _open_mmap(pdf_path) as mapped:
+        reader = PdfReader(mapped)
+        if not reader.is_encrypted:
+            return None
+        if not password:
+            raise PDFReaderServiceError(f"PDF '{pdf_path}' is encrypted and no password was provided.")
+        reader.decrypt(password)
+        writer = PdfWriter()
+        for page in reader.pages:
+            writer.add_page(page)
+        output = BytesIO()
+        writer.write(output)
+    return output.getvalue()
+
+
+def _text_page_numbers(reader: PdfReader) -> Optional[List[int]]:
+    """
+    Finds the pages that may contain text, so PDFMiner can skip image-only pages such as scans.
+
+    A page qualifies if its content stream uses a text-showing operator or it draws form XObjects,
+    whose own streams may hold text. Decoding a content stream is far cheaper than running PDFMiner's
+    interpreter over a page and decompressing its images.
+
+    Args:
+        reader (PdfReader): The reader, already decrypted if the PDF is encrypted.
+
+    Returns:
+        Optional[List[int]]: Zero-based indices of the pages that may contain text, or None if the
+            PDF could not be scanned and every page should be extracted.
+    """
+    try:
+        page_numbers = []
+        for index, page in enumerate(reader.pages):
+            resources = page.get('/Resources')
+            xobjects = resources.get_object().get('/XObject') if resources is not None else None
+            if xobjects is not None and any(
+                    xobject.get_object().get('/Subtype') == '/Form' for xobject in xobjects.get_object().values()):
+                page_numbers.append(index)
+                continue
+            contents = page.get_contents()
+            if contents is not None and TEXT_OPERATOR_PATTERN.search(contents.get_data()):
+                page_numbers.append(index)
+        return page_numbers
+    except Exception:
+        return None
+
+
+def _extract_text_pymupdf(mapped: mmap.mmap, password: Optional[str], layout: bool = False) -> str:
+    """
+    Extracts text with PyMuPDF's C parser.
+
+    Args:
+        mapped (mmap.mmap): The memory-mapped PDF.
+        password (Optional[str]): The password for encrypted PDFs.
+        layout (bool, optional): Sort text blocks into reading order. Defaults to False.
+
+    Returns:
+        str: The extracted text; like PDFMiner, every page is followed by a form feed.
+
+    Raises:
+        PDFReaderServiceError: If the PDF is encrypted and the password is missing or wrong.
+    """
+    with memoryview(mapped) as view, pymupdf.open(stream=view, filetype='pdf') as doc:
+        if doc.needs_pass and not doc.authenticate(password or ''):
+            raise PDFReaderServiceError("PDF is encrypted and the password is missing or incorrect.")
+        return ''.join(page.get_text(sort=layout) + '\f' for page in doc)
+
+
+def _extract_text(pdf_file: BinaryIO, password: Optional[str], backend: str,
+                  layout_margins: Optional[Tuple[float, float, float]]) -> str:
+    """
+    Extracts the text of one open PDF with PyMuPDF, falling back to PDFMiner.
+
+    Every backend reads the given handle, so the text always comes from the file the caller
+    fingerprinted, even if the path is replaced meanwhile.
+
+    Args:
+        pdf_file (BinaryIO): The open PDF file.
+        password (Optional[str]): The password for encrypted PDFs.
+        backend (str): The extraction backend ('pymupdf' or 'pdfminer').
+        layout_margins (Optional[Tuple[float, float, float]]): PDFMiner's char, word and line margins
+            for layout analysis, or None for the defaults (and PyMuPDF's content stream order).
+
+    Returns:
+        str: The extracted text, with pages separated by form feeds.
+
+    Raises:
+        PDFReaderServiceError: If PyMuPDF finds the PDF encrypted and the password missing or wrong.
+    """
+    with _open_mmap(pdf_file) as mapped:
+        if backend == 'pymupdf' and pymupdf is not None:
+            try:
+                return _extract_text_pymupdf(mapped, password, layout_margins is not None)
+            except PDFReaderServiceError:
+                raise
+            except Exception as e:
+                logger.warning("PyMuPDF could not extract text from '%s', falling back to PDFMiner: %s", pdf_file.name, e)
+        try:
+            reader = PdfReader(mapped)
+            if reader.is_encrypted and password:
+                reader.decrypt(password)
+            page_numbers = _text_page_numbers(reader)
+            if page_numbers == []:
+                logger.debug("No page of '%s' shows text; skipping PDFMiner.", pdf_file.name)
+                return '\f' * len(reader.pages)
+        except Exception:
+            page_numbers = None
+    # Default margins unless layout tuning was asked for; PDFMiner needs layout analysis to break lines
+    laparams = LAParams()
+    if layout_margins is not None:
+        char_margin, word_margin, line_margin = layout_margins
+        laparams = LAParams(char_margin=char_margin, word_margin=word_margin, line_margin=line_margin)
+    return _extract_text_pdfminer(pdf_file, password, None if page_numbers is None else set(page_numbers), laparams)
+
+
+def _extract_text_pdfminer(pdf_file: BinaryIO, password: Optional[str], text_pages: Optional[Collection[int]],
+                           laparams: LAParams) -> str:
+    """
+    Extracts text with PDFMiner, interpreting only the pages that may hold text.
+
+    Skipped pages still get their form feed, so the output has one segment per page, matching
+    PyMuPDF's output and the page indices.
+
+    Args:
+        pdf_file (BinaryIO): The open PDF file. PDFMiner rejects maps, but seeks and reads a file object on demand.
+        password (Optional[str]): The password for encrypted PDFs.
+        text_pages (Optional[Collection[int]]): Zero-based indices of the pages to interpret, or None for all.
+        laparams (LAParams): The layout analysis parameters.
+
+    Returns:
+        str: The extracted text, with every page followed by a form feed.
+    """
+    pdf_file.seek(0)
+    with StringIO() as output:
+        # Caching reuses parsed fonts and resources across pages
+        resource_manager = PDFResourceManager(caching=True)
+        device = TextConverter(resource_manager, output, laparams=laparams)
+        interpreter = PDFPageInterpreter(resource_manager, device)
+        for index, page in enumerate(PDFPage.get_pages(pdf_file, password=password or '', caching=True)):
+            if text_pages is None or index in text_pages:
+                interpreter.process_page(page)
+            else:
+                output.write('\f')
+        return output.getvalue()
+
+
+def _extract_text_path(pdf_path: str, password: Optional[str], backend: str,
+                       layout_margins: Optional[Tuple[float, float, float]]) -> Tuple[str, str]:
+    """
+    Opens a PDF once, fingerprints it and extracts its text from the same handle. Runs in pool workers
+    for extract_text_batch, so it is a module-level function.
+
+    Args:
+        pdf_path (str): The file path to the PDF.
+        password (Optional[str]): The password for encrypted PDFs.
+        backend (str): The extraction backend ('pymupdf' or 'pdfminer').
+        layout_margins (Optional[Tuple[float, float, float]]): PDFMiner's layout margins, or None.
+
+    Returns:
+        Tuple[str, str]: The fingerprint of the file that was read, and its text.
+    """
+    with open(pdf_path, 'rb') as pdf_file:
+        return _fingerprint(pdf_file), _extract_text(pdf_file, password, backend, layout_margins)
+
+
+def _page_count(reader: PdfReader) -> int:
+    """
+    Reads the page count from the /Count entry of the page tree root, without walking the tree.
+    """
+    return int(reader.trailer['/Root'].get_object()['/Pages'].get_object()['/Count'])
+
+
+def _page_at(reader: PdfReader, index: int) -> PageObject:
+    """
+    Fetches one page by descending the page tree, skipping subtrees by their /Count.
+
+    PyPDF2 flattens the whole page tree on first access to reader.pages, which is wasted work when
+    only a few pages of a large PDF are needed.
+
+    Args:
+        reader (PdfReader): The reader, already decrypted if the PDF is encrypted.
+        index (int): The zero-based page index.
+
+    Returns:
+        PageObject: The page, with attributes inherited from its ancestors filled in.
+
+    Raises:
+        IndexError: If the page tree has no page at the index.
+    """
+    node_reference = reader.trailer['/Root'].get_object()['/Pages']
+    node = node_reference.get_object()
+    inherited: Dict[str, Any] = {}
+    while node.get('/Type', '/Pages') == '/Pages':
+        for attribute in INHERITABLE_PAGE_ATTRIBUTES:
+            if attribute in node:
+                inherited[attribute] = node[attribute]
+        for kid_reference in node['/Kids']:
+            kid = kid_reference.get_object()
+            kid_count = int(kid.get('/Count', 0)) if kid.get('/Type', '/Pages') == '/Pages' else 1
+            if index < kid_count:
+                node_reference, node = kid_reference, kid
+                break
+            index -= kid_count
+        else:
+            raise IndexError("Page index is out of range of the page tree.")
+    page = PageObject(reader, node_reference if isinstance(node_reference, IndirectObject) else None)
+    page.update(node)
+    for attribute, value in inherited.items():
+        if attribute not in page:
+            page[NameObject(attribute)] = value
+    return page
+
+
+def _object_digest(obj: Any, digests: Dict[int, bytes], visiting: Optional[set] = None) -> bytes:
+    """
+    Hashes a PDF object by content, following indirect references, so that copies of the same font or
+    image taken from different source files hash alike even though their object numbers differ.
+
+    Args:
+        obj (Any): The object to hash.
+        digests (Dict[int, bytes]): Digests of indirect objects already hashed, keyed by object number.
+        visiting (Optional[set], optional): Object numbers on the current path, to cut reference cycles.
+
+    Returns:
+        bytes: The content digest.
+    """
+    visiting = set() if visiting is None else visiting
+    if isinstance(obj, IndirectObject):
+        if obj.idnum in digests:
+            return digests[obj.idnum]
+        if obj.idnum in visiting:
+            return b'cycle'
+        visiting.add(obj.idnum)
+        digest = _object_digest(obj.get_object(), digests, visiting)
+        visiting.discard(obj.idnum)
+        digests[obj.idnum] = digest
+        return digest
+    hasher = hashlib.blake2b(type(obj).__name__.encode('ascii'), digest_size=16)
+    if isinstance(obj, DictionaryObject):
+        for key in sorted(obj):
+            if key == '/Parent':
+                continue
+            hasher.update(key.encode('utf-8'))
+            hasher.update(_object_digest(obj[key], digests, visiting))
+        if isinstance(obj, StreamObject):
+            hasher.update(obj._data)
+    elif isinstance(obj, ArrayObject):
+        for item in obj:
+            hasher.update(_object_digest(item, digests, visiting))
+    else:
+        hasher.update(repr(obj).encode('utf-8', 'surrogatepass'))
+    return hasher.digest()
+
+
+def _deduplicate_resources(writer: PdfWriter) -> int:
+    """
+    Points pages at one shared copy of each identical font and XObject, and empties the copies left unused.
+
+    Pages appended from different files carry their own copies of fonts and images even when they are
+    identical, which can inflate a merged PDF many times over.
+
+    Args:
+        writer (PdfWriter): The writer holding the merged pages.
+
+    Returns:
+        int: The number of resource references redirected to a shared copy.
+    """
+    digests: Dict[int, bytes] = {}
+    canonical: Dict[bytes, IndirectObject] = {}
+    redirected = 0
+    for page in writer.pages:
+        resources = page.get('/Resources')
+        if resources is None:
+            continue
+        resources = resources.get_object()
+        for category in ('/Font', '/XObject'):
+            entries = resources.get(category)
+            if entries is None:
+                continue
+            entries = entries.get_object()
+            for name, reference in list(entries.items()):
+                if not isinstance(reference, IndirectObject):
+                    continue
+                shared = canonical.setdefault(_object_digest(reference, digests), reference)
+                if shared.idnum != reference.idnum:
+                    entries[name] = shared
+                    redirected += 1
+    if redirected:
+        # Every object in the writer is serialized, so copies no longer referenced are replaced with null
+        reachable = set()
+        stack = [writer._root, writer._info, getattr(writer, '_encrypt', None)]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, IndirectObject):
+                if obj.pdf is not writer or obj.idnum in reachable:
+                    continue
+                reachable.add(obj.idnum)
+                stack.append(writer.get_object(obj))
+            elif isinstance(obj, DictionaryObject):
+                stack.extend(obj.values())
+            elif isinstance(obj, ArrayObject):
+                stack.extend(obj)
+        for index in range(len(writer._objects)):
+            if index + 1 not in reachable:
+                writer._objects[index] = NullObject()
+    return redirected
+
 
 class PDFReaderServiceError(Exception):
     """Custom exception for PDFReaderService-related errors."""
@@ -34,65 +616,392 @@ class PDFReaderService:
         """
         Initializes the PDFReaderService with necessary configurations and authentication.
         """
-        self.logger = setup_logging('PDFReaderService')
+        global _logging_configured
+        if not _logging_configured:
+            setup_logging('PDFReaderService')
+            _logging_configured = True
+        self.logger = logger
         self.config_loader = ConfigLoader()
         self.encryption_manager = EncryptionManager()
         self.auth_manager = AuthenticationManager()
         self.lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = int(os.environ.get('PDF_POOL_MAX') or self.config_loader.get('PDF_POOL_MAX', os.cpu_count() or 1))
+        # Extraction results keyed by content fingerprint, in memory and persisted under the cache directory
+        self._result_cache: LRUCache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+        # pdfrw copies pages without walking their resources, which makes split and merge faster
+        self._use_pdfrw = bool(self.config_loader.get('PDF_USE_PDFRW', False)) and RWPdfReader is not None
+        # Parsed readers keyed by file identity and modification time, each with a lock serializing its use
+        self._reader_cache: LRUCache = LRUCache(maxsize=READER_CACHE_SIZE)
+        self._cache_dir = Path(self.config_loader.get('PDF_CACHE_DIR', Path.home() / '.cache' / 'pdfreader'))
+        self._cache_max_entries = int(self.config_loader.get('PDF_CACHE_MAX_ENTRIES', DISK_CACHE_MAX_ENTRIES))
+        self._cache_writes = 0
         self.logger.info("PDFReaderService initialized successfully.")
 
-    def extract_text_from_pdf(self, pdf_path: str, password: Optional[str] = None) -> Optional[str]:
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """
+        Returns the process pool used for CPU-bound page work, creating it on first use.
+
+        Returns:
+            ProcessPoolExecutor: The shared process pool.
+        """
+        with self.lock:
+            if self._pool is None:
+                self.logger.debug("Starting PDF process pool with %s workers.", self._pool_workers)
+                # Forkserver workers start from a small server process instead of a copy of this one
+                context = multiprocessing.get_context('forkserver') if 'forkserver' in multiprocessing.get_all_start_methods() else None
+                self._pool = ProcessPoolExecutor(max_workers=self._pool_workers, mp_context=context)
+            return self._pool
+
+    def _open_pdf(self, pdf_path: str) -> Optional[BinaryIO]:
+        """
+        Opens a PDF for reading, logging an error if it does not exist.
+
+        Opening once and handing the file to every later step replaces a separate existence check and
+        the re-opening of the path, and leaves no window for the file to vanish in between.
+
+        Args:
+            pdf_path (str): The file path to the PDF.
+
+        Returns:
+            Optional[BinaryIO]: The open file, which the caller closes, or None if the file does not exist.
+        """
+        try:
+            return open(pdf_path, 'rb')
+        except FileNotFoundError:
+            self.logger.error("PDF file '%s' does not exist.", pdf_path)
+            return None
+
+    @contextmanager
+    def _open_reader(self, pdf_file: BinaryIO, password: Optional[str]) -> Iterator[PdfReader]:
+        """
+        Provides a memory-mapped PdfReader for a file, reusing one parsed by an earlier call when the file
+        is unchanged, so a pipeline of calls on one file parses its cross-reference table only once.
+
+        The reader is decrypted when a password is given. It stays encrypted otherwise, so callers still
+        check is_encrypted. PyPDF2 readers are not thread-safe, so the reader is locked while in use.
+
+        Args:
+            pdf_file (BinaryIO): The open PDF file.
+            password (Optional[str]): The password for encrypted PDFs.
+
+        Yields:
+            PdfReader: The reader.
+        """
+        stat = os.fstat(pdf_file.fileno())
+        password_digest = hashlib.blake2b(password.encode('utf-8')).digest() if password else None
+        key = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size, password_digest)
+        with self.lock:
+            entry: Optional[Tuple[PdfReader, threading.Lock]] = self._reader_cache.get(key)
+        if entry is None:
+            # The map outlives the file object; it is closed when an evicted reader is garbage collected
+            mapped = mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ)
+            reader = PdfReader(mapped)
+            if reader.is_encrypted and password:
+                reader.decrypt(password)
+            with self.lock:
+                entry = self._reader_cache.setdefault(key, (reader, threading.Lock()))
+        reader, reader_lock = entry
+        with reader_lock:
+            yield reader
+
+    def _cached_result(self, fingerprint: str, kind: str) -> Any:
+        """
+        Looks up a cached extraction result, first in memory and then on disk.
+
+        Args:
+            fingerprint (str): The content fingerprint of the PDF.
+            kind (str): The kind of result (e.g., 'metadata' or 'text:pymupdf').
+
+        Returns:
+            Any: The cached result, or None if there is none.
+        """
+        with self.lock:
+            result = self._result_cache.get((fingerprint, kind))
+        if result is not None:
+            return result
+        try:
+            with open(self._cache_dir / f"{fingerprint}.json", 'r', encoding='utf-8') as f:
+                result = json.load(f).get(kind)
+        except (OSError, ValueError):
+            return None
+        if result is not None:
+            with self.lock:
+                self._result_cache[(fingerprint, kind)] = result
+        return result
+
+    def _cache_result(self, fingerprint: str, kind: str, result: Any):
+        """
+        Stores an extraction result in memory and on disk. Failing to persist it is not an error.
+        Every few writes, the oldest files beyond PDF_CACHE_MAX_ENTRIES are pruned from the cache directory.
+
+        Args:
+            fingerprint (str): The content fingerprint of the PDF.
+            kind (str): The kind of result.
+            result (Any): The JSON-serializable result.
+        """
+        with self.lock:
+            self._result_cache[(fingerprint, kind)] = result
+            self._cache_writes += 1
+            prune = self._cache_writes % DISK_CACHE_PRUNE_INTERVAL == 0
+        cache_path = self._cache_dir / f"{fingerprint}.json"
+        tmp_path = None
+        try:
+            # Extracted text may be confidential, so the cache is private to the owning user
+            self._cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = {}
+            entry[kind] = result
+            # Written to a temporary file (created with mode 0600) and renamed, so readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', prefix=f"{fingerprint}.", dir=self._cache_dir)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, default=str)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+        except OSError as e:
+            self.logger.warning("Could not persist PDF cache entry '%s': %s", cache_path, e)
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        if prune:
+            self._prune_disk_cache()
+
+    def _prune_disk_cache(self):
+        """
+        Removes the least recently written result files beyond the configured maximum entry count.
+        """
+        entries = []
+        try:
+            with os.scandir(self._cache_dir) as it:
+                for dir_entry in it:
+                    if dir_entry.name.endswith('.json'):
+                        try:
+                            entries.append((dir_entry.stat().st_mtime, dir_entry.path))
+                        except FileNotFoundError:
+                            continue
+        except OSError as e:
+            self.logger.warning("Could not scan PDF cache directory '%s': %s", self._cache_dir, e)
+            return
+        excess = len(entries) - self._cache_max_entries
+        if excess <= 0:
+            return
+        for _, path in heapq.nsmallest(excess, entries):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.logger.debug("Pruned %d entries from the PDF cache directory.", excess)
+
+    def _stamp_pdf(self, pdf_file: BinaryIO, reader: PdfReader, page_count: int, password: Optional[str],
+                   watermark: Union[None, bytes, Tuple[str, str, float]], number_pages: bool) -> PdfWriter:
+        """
+        Stamps every page of a PDF, splitting large documents into page ranges processed in parallel.
+
+        PyPDF2's page merging and serialization are CPU-bound pure Python, so separate processes sidestep
+        the GIL. Small documents, and all documents on single-worker setups, are stamped in-process from the
+        caller's reader, where shipping them to workers would cost more. Workers reopen the file by path and
+        refuse to stamp it if it is no longer the file open here.
+
+        Args:
+            pdf_file (BinaryIO): The open source PDF.
+            reader (PdfReader): A reader of pdf_file owned by the caller, already decrypted if needed. Its
+                pages are stamped in place, and the writer returned reads from it until written.
+            page_count (int): The number of pages in the source PDF.
+            password (Optional[str]): The password for encrypted PDFs.
+            watermark (Union[None, bytes, Tuple[str, str, float]]): The watermark text, position and opacity,
+                a watermark template, or None.
+            number_pages (bool): Whether to add page numbers.
+
+        Returns:
+            PdfWriter: A writer holding the stamped pages in order.
+        """
+        if page_count < PARALLEL_PAGE_THRESHOLD or self._pool_workers < 2:
+            return _stamp_reader_pages(reader, 0, page_count, watermark, number_pages)
+        pool = self._get_pool()
+        chunk_size = -(-page_count // self._pool_workers)
+        starts = range(0, page_count, chunk_size)
+        stops = [min(start + chunk_size, page_count) for start in starts]
+        count = len(starts)
+        chunks = pool.map(_stamp_pages, [pdf_file.name] * count, [password] * count, starts, stops,
+                          [watermark] * count, [number_pages] * count, [_file_identity(pdf_file)] * count)
+        writer = PdfWriter()
+        for chunk in chunks:
+            for page in PdfReader(BytesIO(chunk)).pages:
+                writer.add_page(page)
+        return writer
+
+    def extract_text_from_pdf(self, pdf_path: str, password: Optional[str] = None, backend: str = 'pymupdf',
+                              force_refresh: bool = False, layout: bool = False, char_margin: float = 2.0,
+                              word_margin: float = 0.1, line_margin: float = 0.5) -> Optional[str]:
         """
         Extracts all text from a specified PDF file.
 
         Args:
             pdf_path (str): The file path to the PDF.
             password (Optional[str], optional): The password for encrypted PDFs. Defaults to None.
+            backend (str, optional): The extraction backend ('pymupdf' or 'pdfminer'). PyMuPDF is much faster;
+                PDFMiner is used when PyMuPDF is not installed or fails on a file. Defaults to 'pymupdf'.
+            force_refresh (bool, optional): Re-extract even if the text is cached. Defaults to False.
+            layout (bool, optional): Order text by layout analysis (reading order, columns) instead of content
+                stream order. PDFMiner always needs layout analysis to break lines; this applies the margins
+                below instead of its defaults. Defaults to False.
+            char_margin (float, optional): PDFMiner layout tuning: how close characters must be to form a line.
+                Defaults to 2.0.
+            word_margin (float, optional): PDFMiner layout tuning: the gap that separates words. Defaults to 0.1.
+            line_margin (float, optional): PDFMiner layout tuning: how close lines must be to form a paragraph.
+                Defaults to 0.5.
 
         Returns:
-            Optional[str]: The extracted text, or None if extraction fails.
+            Optional[str]: The extracted text, with pages separated by form feeds, or None if extraction fails.
+
+        Text from unencrypted PDFs is cached by content fingerprint, so repeat calls on the same file skip
+        parsing. Text from PDFs opened with a password is never cached. The PDFMiner backend skips pages
+        with no text-showing operators, but still emits their form feeds, so both backends produce one
+        segment per page.
         """
         try:
-            self.logger.debug(f"Extracting text from PDF '{pdf_path}' with password '{password}'.")
-            if not os.path.exists(pdf_path):
-                self.logger.error(f"PDF file '{pdf_path}' does not exist.")
+            self.logger.debug("Extracting text from PDF '%s'.", pdf_path)
+            pdf_file = self._open_pdf(pdf_path)
+            if pdf_file is None:
                 return None
-            text = extract_text(pdf_path, password=password, laparams=LAParams())
-            self.logger.info(f"Text extracted successfully from '{pdf_path}'.")
-            return text
+            with pdf_file:
+                if not password and _is_encrypted_fast(pdf_file):
+                    self.logger.error("PDF is encrypted and no password was provided.")
+                    return None
+                cacheable = password is None
+                if cacheable:
+                    fingerprint = _fingerprint(pdf_file)
+                    cache_kind = f"text:{backend}:layout={char_margin},{word_margin},{line_margin}" if layout else f"text:{backend}"
+                    if not force_refresh:
+                        text = self._cached_result(fingerprint, cache_kind)
+                        if text is not None:
+                            self.logger.debug("Text for '%s' served from cache.", pdf_path)
+                            return text
+                text = _extract_text(pdf_file, password, backend, (char_margin, word_margin, line_margin) if layout else None)
+                if cacheable:
+                    self._cache_result(fingerprint, cache_kind, text)
+                self.logger.info("Text extracted successfully from '%s'.", pdf_path)
+                return text
         except Exception as e:
-            self.logger.error(f"Error extracting text from PDF '{pdf_path}': {e}", exc_info=True)
+            self.logger.error("Error extracting text from PDF '%s': %s", pdf_path, e, exc_info=True)
             return None
 
-    def get_pdf_metadata(self, pdf_path: str, password: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    def extract_text_batch(self, pdf_paths: List[str], password: Optional[str] = None, backend: str = 'pymupdf',
+                           force_refresh: bool = False, layout: bool = False, char_margin: float = 2.0,
+                           word_margin: float = 0.1, line_margin: float = 0.5) -> List[Optional[str]]:
+        """
+        Extracts the text of several PDFs, one per worker process.
+
+        Extraction is CPU-bound pure Python under PDFMiner and holds the GIL, so separate processes,
+        not threads, are what scale it across cores. The pool size is set by PDF_POOL_MAX. Cached
+        texts are returned without touching the pool.
+
+        Args:
+            pdf_paths (List[str]): The file paths to the PDFs.
+            password (Optional[str], optional): The password for encrypted PDFs. Defaults to None.
+            backend (str, optional): The extraction backend ('pymupdf' or 'pdfminer'). Defaults to 'pymupdf'.
+            force_refresh (bool, optional): Re-extract even if the text is cached. Defaults to False.
+            layout (bool, optional): Order text by layout analysis. Defaults to False.
+            char_margin (float, optional): PDFMiner layout tuning. Defaults to 2.0.
+            word_margin (float, optional): PDFMiner layout tuning. Defaults to 0.1.
+            line_margin (float, optional): PDFMiner layout tuning. Defaults to 0.5.
+
+        Returns:
+            List[Optional[str]]: The extracted texts, in the order of pdf_paths, with None for each PDF
+                that could not be read.
+        """
+        self.logger.debug("Extracting text from %s PDFs.", len(pdf_paths))
+        cacheable = password is None
+        cache_kind = f"text:{backend}:layout={char_margin},{word_margin},{line_margin}" if layout else f"text:{backend}"
+        layout_margins = (char_margin, word_margin, line_margin) if layout else None
+        texts: List[Optional[str]] = [None] * len(pdf_paths)
+        pending = []
+        for index, pdf_path in enumerate(pdf_paths):
+            try:
+                with open(pdf_path, 'rb') as pdf_file:
+                    if not password and _is_encrypted_fast(pdf_file):
+                        self.logger.error("PDF '%s' is encrypted and no password was provided.", pdf_path)
+                        continue
+                    if cacheable and not force_refresh:
+                        texts[index] = self._cached_result(_fingerprint(pdf_file), cache_kind)
+                        if texts[index] is not None:
+                            continue
+                pending.append(index)
+            except OSError as e:
+                self.logger.error("PDF file '%s' could not be read: %s", pdf_path, e)
+
+        if len(pending) > 1 and self._pool_workers > 1:
+            pool = self._get_pool()
+            futures = {index: pool.submit(_extract_text_path, pdf_paths[index], password, backend, layout_margins)
+                       for index in pending}
+            results = ((index, futures[index].result) for index in pending)
+        else:
+            results = ((index, partial(_extract_text_path, pdf_paths[index], password, backend, layout_margins))
+                       for index in pending)
+        for index, result in results:
+            try:
+                # Cached under the fingerprint of the file actually read, in case it was replaced since the lookup
+                fingerprint, texts[index] = result()
+            except Exception as e:
+                self.logger.error("Error extracting text from PDF '%s': %s", pdf_paths[index], e, exc_info=True)
+                continue
+            if cacheable:
+                self._cache_result(fingerprint, cache_kind, texts[index])
+        self.logger.info("Text extracted from %s of %s PDFs.", sum(text is not None for text in texts), len(pdf_paths))
+        return texts
+
+    def get_pdf_metadata(self, pdf_path: str, password: Optional[str] = None, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
         """
         Retrieves metadata from a specified PDF file.
 
+        Metadata of unencrypted PDFs is cached by content fingerprint, like extracted text. Values are
+        returned as plain strings.
+
         Args:
             pdf_path (str): The file path to the PDF.
             password (Optional[str], optional): The password for encrypted PDFs. Defaults to None.
+            force_refresh (bool, optional): Re-read the metadata even if it is cached. Defaults to False.
 
         Returns:
             Optional[Dict[str, Any]]: A dictionary containing metadata, or None if retrieval fails.
         """
         try:
-            self.logger.debug(f"Retrieving metadata from PDF '{pdf_path}' with password '{password}'.")
-            if not os.path.exists(pdf_path):
-                self.logger.error(f"PDF file '{pdf_path}' does not exist.")
+            self.logger.debug("Retrieving metadata from PDF '%s'.", pdf_path)
+            pdf_file = self._open_pdf(pdf_path)
+            if pdf_file is None:
                 return None
-            reader = PdfReader(pdf_path)
-            if reader.is_encrypted:
-                if password:
-                    reader.decrypt(password)
-                else:
+            with pdf_file:
+                if not password and _is_encrypted_fast(pdf_file):
                     self.logger.error("PDF is encrypted and no password was provided.")
                     return None
-            metadata = reader.metadata
-            metadata_dict = {key[1:]: value for key, value in metadata.items()}  # Remove leading '/'
-            self.logger.info(f"Metadata retrieved successfully from '{pdf_path}': {metadata_dict}")
-            return metadata_dict
+                cacheable = password is None
+                if cacheable:
+                    fingerprint = _fingerprint(pdf_file)
+                    if not force_refresh:
+                        metadata_dict = self._cached_result(fingerprint, 'metadata')
+                        if metadata_dict is not None:
+                            self.logger.debug("Metadata for '%s' served from cache.", pdf_path)
+                            return dict(metadata_dict)
+                with self._open_reader(pdf_file, password) as reader:
+                    if reader.is_encrypted and not password:
+                        self.logger.error("PDF is encrypted and no password was provided.")
+                        return None
+                    metadata = reader.metadata or {}
+                    # One dict of plain strings serves as both the result and the cache entry, matching what comes
+                    # back from disk; keys lose their leading '/' and indirect values are resolved
+                    metadata_dict = {key[1:]: str(value.get_object()) for key, value in metadata.items()}
+                if cacheable:
+                    self._cache_result(fingerprint, 'metadata', metadata_dict)
+                self.logger.info("Metadata retrieved successfully from '%s': %s", pdf_path, metadata_dict)
+                return dict(metadata_dict)
         except Exception as e:
-            self.logger.error(f"Error retrieving metadata from PDF '{pdf_path}': {e}", exc_info=True)
+            self.logger.error("Error retrieving metadata from PDF '%s': %s", pdf_path, e, exc_info=True)
             return None
 
     def split_pdf(self, pdf_path: str, pages: List[int], output_path: str, password: Optional[str] = None) -> bool:
@@ -109,29 +1018,44 @@ class PDFReaderService:
             bool: True if the PDF is split successfully, False otherwise.
         """
         try:
-            self.logger.debug(f"Splitting PDF '{pdf_path}' into pages {pages} into '{output_path}' with password '{password}'.")
-            if not os.path.exists(pdf_path):
-                self.logger.error(f"PDF file '{pdf_path}' does not exist.")
+            self.logger.debug("Splitting PDF '%s' into pages %s into '%s'.", pdf_path, pages, output_path)
+            pdf_file = self._open_pdf(pdf_path)
+            if pdf_file is None:
                 return False
-            reader = PdfReader(pdf_path)
-            if reader.is_encrypted:
-                if password:
-                    reader.decrypt(password)
-                else:
+            with pdf_file:
+                if not password and _is_encrypted_fast(pdf_file):
                     self.logger.error("PDF is encrypted and no password was provided.")
                     return False
-            writer = PdfWriter()
-            for page_num in pages:
-                if page_num < 1 or page_num > len(reader.pages):
-                    self.logger.warning(f"Page number {page_num} is out of range for PDF '{pdf_path}'.")
-                    continue
-                writer.add_page(reader.pages[page_num - 1])
-            with open(output_path, 'wb') as f_out:
-                writer.write(f_out)
-            self.logger.info(f"PDF split successfully into '{output_path}'.")
-            return True
+                if self._use_pdfrw:
+                    try:
+                        if self._split_pdf_pdfrw(pdf_path, pages, output_path):
+                            self.logger.info("PDF split successfully into '%s'.", output_path)
+                            return True
+                    except Exception as e:
+                        self.logger.warning("pdfrw could not split '%s', falling back to PyPDF2: %s", pdf_path, e)
+                with self._open_reader(pdf_file, password) as reader:
+                    if reader.is_encrypted and not password:
+                        self.logger.error("PDF is encrypted and no password was provided.")
+                        return False
+                    # Pages are looked up individually, so only the requested branches of the page tree are read
+                    try:
+                        page_count = _page_count(reader)
+                        lazy_pages = True
+                    except (KeyError, TypeError, ValueError):
+                        page_count = len(reader.pages)
+                        lazy_pages = False
+                    writer = PdfWriter()
+                    for page_num in pages:
+                        if page_num < 1 or page_num > page_count:
+                            self.logger.warning("Page number %s is out of range for PDF '%s'.", page_num, pdf_path)
+                            continue
+                        writer.add_page(_page_at(reader, page_num - 1) if lazy_pages else reader.pages[page_num - 1])
+                    with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f_out:
+                        writer.write(f_out)
+                self.logger.info("PDF split successfully into '%s'.", output_path)
+                return True
         except Exception as e:
-            self.logger.error(f"Error splitting PDF '{pdf_path}': {e}", exc_info=True)
+            self.logger.error("Error splitting PDF '%s': %s", pdf_path, e, exc_info=True)
             return False
 
     def merge_pdfs(self, pdf_paths: List[str], output_path: str, password: Optional[str] = None) -> bool:
@@ -147,135 +1071,228 @@ class PDFReaderService:
             bool: True if the PDFs are merged successfully, False otherwise.
         """
         try:
-            self.logger.debug(f"Merging PDFs {pdf_paths} into '{output_path}' with password '{password}'.")
-            writer = PdfWriter()
+            self.logger.debug("Merging PDFs %s into '%s'.", pdf_paths, output_path)
+            existing_paths = []
+            encrypted_paths = []
             for pdf_path in pdf_paths:
-                if not os.path.exists(pdf_path):
-                    self.logger.warning(f"PDF file '{pdf_path}' does not exist. Skipping.")
+                try:
+                    with open(pdf_path, 'rb') as pdf_file:
+                        encrypted = _is_encrypted_fast(pdf_file)
+                except FileNotFoundError:
+                    self.logger.warning("PDF file '%s' does not exist. Skipping.", pdf_path)
                     continue
-                reader = PdfReader(pdf_path)
-                if reader.is_encrypted:
-                    if password:
-                        reader.decrypt(password)
-                    else:
-                        self.logger.error(f"PDF '{pdf_path}' is encrypted and no password was provided.")
+                if encrypted and not password:
+                    self.logger.error("PDF '%s' is encrypted and no password was provided.", pdf_path)
+                    return False
+                existing_paths.append(pdf_path)
+                if encrypted and pdf_path not in encrypted_paths:
+                    encrypted_paths.append(pdf_path)
+            if self._use_pdfrw:
+                try:
+                    if self._merge_pdfs_pdfrw(existing_paths, output_path):
+                        self.logger.info("PDFs merged successfully into '%s'.", output_path)
+                        return True
+                except Exception as e:
+                    self.logger.warning("pdfrw could not merge into '%s', falling back to PyPDF2: %s", output_path, e)
+            decrypted: Dict[str, Optional[bytes]] = {}
+            if len(encrypted_paths) >= PARALLEL_FILE_THRESHOLD and self._pool_workers > 1:
+                # Decryption is the CPU-heavy part, so only encrypted inputs go to workers. Pages are appended
+                # here, in order, since a writer cannot be shared across processes.
+                decrypted = dict(zip(encrypted_paths, self._get_pool().map(
+                    _read_merge_input, encrypted_paths, [password] * len(encrypted_paths))))
+            writer = PdfWriter()
+            # add_page copies each page's objects into the writer, so a reader is only needed while appending
+            for pdf_path in existing_paths:
+                data = decrypted.get(pdf_path)
+                if data is not None:
+                    for page in PdfReader(BytesIO(data)).pages:
+                        writer.add_page(page)
+                    continue
+                with open(pdf_path, 'rb') as pdf_file, self._open_reader(pdf_file, password) as reader:
+                    if reader.is_encrypted and not password:
+                        self.logger.error("PDF '%s' is encrypted and no password was provided.", pdf_path)
                         return False
-                for page in reader.pages:
-                    writer.add_page(page)
-            with open(output_path, 'wb') as f_out:
+                    for page in reader.pages:
+                        writer.add_page(page)
+            redirected = _deduplicate_resources(writer)
+            if redirected:
+                self.logger.debug("Shared %s duplicate font and image references in '%s'.", redirected, output_path)
+            with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f_out:
                 writer.write(f_out)
-            self.logger.info(f"PDFs merged successfully into '{output_path}'.")
+            self.logger.info("PDFs merged successfully into '%s'.", output_path)
             return True
         except Exception as e:
-            self.logger.error(f"Error merging PDFs into '{output_path}': {e}", exc_info=True)
+            self.logger.error("Error merging PDFs into '%s': %s", output_path, e, exc_info=True)
             return False
 
-    def add_watermark(self, pdf_path: str, watermark_text: str, output_path: str, position: str = 'center', opacity: float = 0.3, password: Optional[str] = None) -> bool:
+    def decorate_pdf(self, pdf_path: str, output_path: str, watermark_text: Optional[str] = None,
+                     page_numbers: bool = True, position: str = 'center', opacity: float = 0.3,
+                     password: Optional[str] = None, watermark_template: Optional[bytes] = None) -> bool:
         """
-        Adds a watermark to each page of a PDF.
+        Adds a watermark and/or page numbers to each page of a PDF in a single pass.
+
+        Doing both at once reads, merges and writes the document once, where add_watermark followed by
+        add_page_numbers would do each twice.
 
         Args:
             pdf_path (str): The file path to the original PDF.
-            watermark_text (str): The text to use as the watermark.
-            output_path (str): The file path for the watermarked PDF.
+            output_path (str): The file path for the decorated PDF.
+            watermark_text (Optional[str], optional): The text to use as the watermark, or None for no watermark.
+                Defaults to None.
+            page_numbers (bool, optional): Whether to add page numbers. Defaults to True.
             position (str, optional): The position of the watermark ('center', 'top-left', 'top-right', 'bottom-left', 'bottom-right'). Defaults to 'center'.
             opacity (float, optional): The opacity of the watermark (0.0 to 1.0). Defaults to 0.3.
             password (Optional[str], optional): The password for encrypted PDFs. Defaults to None.
+            watermark_template (Optional[bytes], optional): A watermark rendered by create_watermark_template,
+                used instead of watermark_text, position and opacity. Defaults to None.
 
         Returns:
-            bool: True if the watermark is added successfully, False otherwise.
+            bool: True if the PDF is decorated successfully, False otherwise.
         """
         try:
-            self.logger.debug(f"Adding watermark to PDF '{pdf_path}' with text '{watermark_text}' at position '{position}' and opacity '{opacity}'.")
-            if not os.path.exists(pdf_path):
-                self.logger.error(f"PDF file '{pdf_path}' does not exist.")
+            self.logger.debug("Decorating PDF '%s' into '%s' with watermark '%s' at position '%s' and opacity '%s', page numbers %s.",
+                              pdf_path, output_path, watermark_text, position, opacity, page_numbers)
+            pdf_file = self._open_pdf(pdf_path)
+            if pdf_file is None:
                 return False
-
-            # Create a temporary PDF with the watermark
-            watermark_pdf = self._create_watermark_pdf(watermark_text, position, opacity)
-            if not watermark_pdf:
-                self.logger.error("Failed to create watermark PDF.")
-                return False
-
-            # Merge the watermark with the original PDF
-            reader = PdfReader(pdf_path)
-            if reader.is_encrypted:
-                if password:
-                    reader.decrypt(password)
-                else:
+            with pdf_file:
+                if not password and _is_encrypted_fast(pdf_file):
                     self.logger.error("PDF is encrypted and no password was provided.")
                     return False
-            watermark_reader = PdfReader(watermark_pdf)
-            watermark_page = watermark_reader.pages[0]
 
-            writer = PdfWriter()
-            for page_num, page in enumerate(reader.pages, start=1):
-                page.merge_page(watermark_page)
-                writer.add_page(page)
-                self.logger.debug(f"Watermark added to page {page_num}.")
+                # Parsed once, and not through the reader cache: stamping merges overlays into its pages in place
+                with _open_mmap(pdf_file) as mapped:
+                    reader = PdfReader(mapped)
+                    if reader.is_encrypted:
+                        if not password:
+                            self.logger.error("PDF is encrypted and no password was provided.")
+                            return False
+                        reader.decrypt(password)
+                    try:
+                        page_count = _page_count(reader)
+                    except (KeyError, TypeError, ValueError):
+                        page_count = len(reader.pages)
 
-            with open(output_path, 'wb') as f_out:
-                writer.write(f_out)
-            self.logger.info(f"Watermark added successfully to '{output_path}'.")
-            os.remove(watermark_pdf)
-            self.logger.debug(f"Temporary watermark PDF '{watermark_pdf}' removed.")
-            return True
+                    watermark = watermark_template or ((watermark_text, position, opacity) if watermark_text else None)
+                    if watermark is None and not page_numbers:
+                        self.logger.warning("No watermark or page numbers requested for '%s'; copying it unchanged.", pdf_path)
+                    writer = self._stamp_pdf(pdf_file, reader, page_count, password, watermark, page_numbers)
+                    self.logger.debug("Decorated %s pages.", page_count)
+
+                    with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f_out:
+                        writer.write(f_out)
+                self.logger.info("PDF decorated successfully into '%s'.", output_path)
+                return True
         except Exception as e:
-            self.logger.error(f"Error adding watermark to PDF '{pdf_path}': {e}", exc_info=True)
+            self.logger.error("Error decorating PDF '%s': %s", pdf_path, e, exc_info=True)
             return False
 
-    def _create_watermark_pdf(self, text: str, position: str, opacity: float) -> Optional[str]:
+    def _split_pdf_pdfrw(self, pdf_path: str, pages: List[int], output_path: str) -> bool:
         """
-        Creates a PDF file containing the watermark text.
+        Splits a PDF with pdfrw, which copies the selected pages without PyPDF2's per-page object walk.
+
+        Args:
+            pdf_path (str): The file path to the original PDF.
+            pages (List[int]): A list of page numbers to include in the split PDF.
+            output_path (str): The file path for the split PDF.
+
+        Returns:
+            bool: True if the PDF was split, False if it is encrypted and must be handled by PyPDF2.
+        """
+        source = RWPdfReader(pdf_path)
+        if source.Encrypt:
+            return False
+        writer = RWPdfWriter()
+        for page_num in pages:
+            if page_num < 1 or page_num > len(source.pages):
+                self.logger.warning("Page number %s is out of range for PDF '%s'.", page_num, pdf_path)
+                continue
+            writer.addpage(source.pages[page_num - 1])
+        with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f_out:
+            writer.write(f_out)
+        return True
+
+    def _merge_pdfs_pdfrw(self, pdf_paths: List[str], output_path: str) -> bool:
+        """
+        Merges PDFs with pdfrw. Unlike the PyPDF2 path, identical fonts and images are not shared.
+
+        Args:
+            pdf_paths (List[str]): A list of file paths to the PDFs to merge.
+            output_path (str): The file path for the merged PDF.
+
+        Returns:
+            bool: True if the PDFs were merged, False if any is encrypted and must be handled by PyPDF2.
+        """
+        sources = [RWPdfReader(pdf_path) for pdf_path in pdf_paths]
+        if any(source.Encrypt for source in sources):
+            return False
+        writer = RWPdfWriter()
+        for source in sources:
+            writer.addpages(source.pages)
+        with open(output_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f_out:
+            writer.write(f_out)
+        return True
+
+    def add_watermark(self, pdf_path: str, watermark_text: str, output_path: str, position: str = 'center', opacity: float = 0.3, password: Optional[str] = None) -> bool:
+        """
+        Adds a watermark to each page of a PDF.
+
+        Args:
+            pdf_path (str): The file path to the original PDF.
+            watermark_text (str): The text to use as the watermark.
+            output_path (str): The file path for the watermarked PDF.
+            position (str, optional): The position of the watermark ('center', 'top-left', 'top-right', 'bottom-left', 'bottom-right'). Defaults to 'center'.
+            opacity (float, optional): The opacity of the watermark (0.0 to 1.0). Defaults to 0.3.
+            password (Optional[str], optional): The password for encrypted PDFs. Defaults to None.
+
+        Returns:
+            bool: True if the watermark is added successfully, False otherwise.
+        """
+        return self.decorate_pdf(pdf_path, output_path, watermark_text=watermark_text, page_numbers=False,
+                                 position=position, opacity=opacity, password=password)
+
+    def create_watermark_template(self, text: str, position: str = 'center', opacity: float = 0.3) -> Optional[bytes]:
+        """
+        Renders a watermark once, for reuse across many PDFs with apply_watermark_template.
 
         Args:
             text (str): The watermark text.
-            position (str): The position of the watermark.
-            opacity (float): The opacity of the watermark.
+            position (str, optional): The position of the watermark ('center', 'top-left', 'top-right', 'bottom-left', 'bottom-right'). Defaults to 'center'.
+            opacity (float, optional): The opacity of the watermark (0.0 to 1.0). Defaults to 0.3.
 
         Returns:
-            Optional[str]: The file path to the watermark PDF, or None if creation fails.
+            Optional[bytes]: A one-page PDF holding the watermark, or None if rendering fails.
         """
         try:
-            self.logger.debug(f"Creating watermark PDF with text '{text}', position '{position}', and opacity '{opacity}'.")
-            watermark_path = Path('./temp_watermark.pdf')
-            c = canvas.Canvas(str(watermark_path), pagesize=letter)
-            c.setFillAlpha(opacity)
-            c.setFont("Helvetica", 40)
-
-            width, height = letter
-            text_width = c.stringWidth(text, "Helvetica", 40)
-
-            if position == 'center':
-                x = (width - text_width) / 2
-                y = height / 2
-            elif position == 'top-left':
-                x = 50
-                y = height - 50
-            elif position == 'top-right':
-                x = width - text_width - 50
-                y = height - 50
-            elif position == 'bottom-left':
-                x = 50
-                y = 50
-            elif position == 'bottom-right':
-                x = width - text_width - 50
-                y = 50
-            else:
-                x = (width - text_width) / 2
-                y = height / 2
-
-            c.drawString(x, y, text)
-            c.save()
-            self.logger.debug(f"Watermark PDF created at '{watermark_path}'.")
-            return str(watermark_path)
+            self.logger.debug("Creating watermark template with text '%s', position '%s', and opacity '%s'.", text, position, opacity)
+            packet = BytesIO()
+            can = canvas.Canvas(packet, pagesize=letter)
+            _draw_watermark(can, text, position, opacity)
+            can.showPage()
+            can.save()
+            return packet.getvalue()
         except Exception as e:
-            self.logger.error(f"Error creating watermark PDF: {e}", exc_info=True)
+            self.logger.error("Error creating watermark template: %s", e, exc_info=True)
             return None
 
+    def apply_watermark_template(self, template: bytes, pdf_path: str, output_path: str, password: Optional[str] = None) -> bool:
+        """
+        Adds a watermark rendered by create_watermark_template to each page of a PDF.
+
+        Args:
+            template (bytes): The watermark template.
+            pdf_path (str): The file path to the original PDF.
+            output_path (str): The file path for the watermarked PDF.
+            password (Optional[str], optional): The password for encrypted PDFs. Defaults to None.
+
+        Returns:
+            bool: True if the watermark is added successfully, False otherwise.
+        """
+        return self.decorate_pdf(pdf_path, output_path, page_numbers=False, password=password, watermark_template=template)
+
     def create_pdf(self, text: str, output_path: str, font: str = 'Helvetica', font_size: int = 12, page_size: str = 'letter') -> bool:
         """
-        Creates a new PDF file from the provided text.
+        Creates a new PDF file from the provided text, starting a new page when the text fills one.
 
         Args:
             text (str): The text content to include in the PDF.
@@ -288,23 +1305,28 @@ class PDFReaderService:
             bool: True if the PDF is created successfully, False otherwise.
         """
         try:
-            self.logger.debug(f"Creating PDF at '{output_path}' with font '{font}', font size '{font_size}', and page size '{page_size}'.")
+            self.logger.debug("Creating PDF at '%s' with font '%s', font size '%s', and page size '%s'.", output_path, font, font_size, page_size)
             if page_size.lower() == 'a4':
                 page_dimensions = (595.27, 841.89)  # A4 size in points
             else:
                 page_dimensions = letter
 
             c = canvas.Canvas(output_path, pagesize=page_dimensions)
-            c.setFont(font, font_size)
-            text_object = c.beginText(40, page_dimensions[1] - 40)
-            for line in text.split('\n'):
-                text_object.textLine(line)
-            c.drawText(text_object)
+            leading = font_size * 1.2  # ReportLab's default leading for a font size
+            lines_per_page = max(1, int((page_dimensions[1] - 80) // leading))
+            lines = text.split('\n')
+            # Each page's lines go to one textLines call; text that overflows a page continues on the next
+            for first_line in range(0, len(lines), lines_per_page):
+                text_object = c.beginText(40, page_dimensions[1] - 40)
+                text_object.setFont(font, font_size, leading)
+                text_object.textLines(lines[first_line:first_line + lines_per_page], trim=0)
+                c.drawText(text_object)
+                c.showPage()
             c.save()
-            self.logger.info(f"PDF created successfully at '{output_path}'.")
+            self.logger.info("PDF created successfully at '%s'.", output_path)
             return True
         except Exception as e:
-            self.logger.error(f"Error creating PDF at '{output_path}': {e}", exc_info=True)
+            self.logger.error("Error creating PDF at '%s': %s", output_path, e, exc_info=True)
             return False
 
     def add_page_numbers(self, pdf_path: str, output_path: str, password: Optional[str] = None) -> bool:
@@ -319,46 +1341,15 @@ class PDFReaderService:
         Returns:
             bool: True if page numbers are added successfully, False otherwise.
         """
-        try:
-            self.logger.debug(f"Adding page numbers to PDF '{pdf_path}' into '{output_path}' with password '{password}'.")
-            if not os.path.exists(pdf_path):
-                self.logger.error(f"PDF file '{pdf_path}' does not exist.")
-                return False
-
-            reader = PdfReader(pdf_path)
-            if reader.is_encrypted:
-                if password:
-                    reader.decrypt(password)
-                else:
-                    self.logger.error("PDF is encrypted and no password was provided.")
-                    return False
-
-            writer = PdfWriter()
-            for i, page in enumerate(reader.pages, start=1):
-                packet = BytesIO()
-                can = canvas.Canvas(packet, pagesize=page.mediabox)
-                can.setFont("Helvetica", 12)
-                can.drawString(page.mediabox.width - 50, 20, f"Page {i}")
-                can.save()
-
-                packet.seek(0)
-                watermark = PdfReader(packet)
-                page.merge_page(watermark.pages[0])
-                writer.add_page(page)
-                self.logger.debug(f"Page number {i} added.")
-
-            with open(output_path, 'wb') as f_out:
-                writer.write(f_out)
-            self.logger.info(f"Page numbers added successfully to '{output_path}'.")
-            return True
-        except Exception as e:
-            self.logger.error(f"Error adding page numbers to PDF '{pdf_path}': {e}", exc_info=True)
-            return False
+        return self.decorate_pdf(pdf_path, output_path, page_numbers=True, password=password)
 
     def extract_images_from_pdf(self, pdf_path: str, output_dir: str, password: Optional[str] = None) -> bool:
         """
         Extracts all images from a specified PDF file.
 
+        Images are extracted with PyMuPDF, which writes each in its real format (e.g., PNG for
+        Flate-compressed pixels). PyPDF2 is used when PyMuPDF is not installed or fails on a file.
+
         Args:
             pdf_path (str): The file path to the PDF.
             output_dir (str): The directory where extracted images will be saved.
@@ -368,56 +1359,102 @@ class PDFReaderService:
             bool: True if images are extracted successfully, False otherwise.
         """
         try:
-            self.logger.debug(f"Extracting images from PDF '{pdf_path}' into directory '{output_dir}' with password '{password}'.")
-            if not os.path.exists(pdf_path):
-                self.logger.error(f"PDF file '{pdf_path}' does not exist.")
+            self.logger.debug("Extracting images from PDF '%s' into directory '%s'.", pdf_path, output_dir)
+            pdf_file = self._open_pdf(pdf_path)
+            if pdf_file is None:
                 return False
-            os.makedirs(output_dir, exist_ok=True)
-
-            reader = PdfReader(pdf_path)
-            if reader.is_encrypted:
-                if password:
-                    reader.decrypt(password)
-                else:
+            with pdf_file:
+                if not password and _is_encrypted_fast(pdf_file):
                     self.logger.error("PDF is encrypted and no password was provided.")
                     return False
+                os.makedirs(output_dir, exist_ok=True)
 
-            image_count = 0
-            for page_num, page in enumerate(reader.pages, start=1):
-                if '/XObject' in page['/Resources']:
-                    xObject = page['/Resources']['/XObject'].get_object()
-                    for obj in xObject:
-                        if xObject[obj]['/Subtype'] == '/Image':
-                            size = (xObject[obj]['/Width'], xObject[obj]['/Height'])
-                            data = xObject[obj]._data
-                            if '/Filter' in xObject[obj]:
-                                if xObject[obj]['/Filter'] == '/DCTDecode':
-                                    file_type = 'jpg'
-                                elif xObject[obj]['/Filter'] == '/FlateDecode':
-                                    file_type = 'png'
-                                else:
-                                    file_type = 'png'
-                            else:
-                                file_type = 'png'
-                            image_path = os.path.join(output_dir, f"page_{page_num}_image_{image_count}.{file_type}")
-                            with open(image_path, 'wb') as img_file:
-                                img_file.write(data)
-                            self.logger.debug(f"Image extracted to '{image_path}'.")
-                            image_count += 1
-            self.logger.info(f"Extracted {image_count} images from PDF '{pdf_path}' into '{output_dir}'.")
-            return True
+                image_count = None
+                if pymupdf is not None:
+                    try:
+                        image_count = self._extract_images_pymupdf(pdf_path, output_dir, password)
+                    except PDFReaderServiceError as e:
+                        self.logger.error("Error extracting images from PDF '%s': %s", pdf_path, e)
+                        return False
+                    except Exception as e:
+                        self.logger.warning("PyMuPDF could not extract images from '%s', falling back to PyPDF2: %s", pdf_path, e)
+                if image_count is None:
+                    with self._open_reader(pdf_file, password) as reader:
+                        if reader.is_encrypted and not password:
+                            self.logger.error("PDF is encrypted and no password was provided.")
+                            return False
+
+                        image_count = 0
+                        for page_num, page in enumerate(reader.pages, start=1):
+                            if '/XObject' in page['/Resources']:
+                                xObject = page['/Resources']['/XObject'].get_object()
+                                for obj in xObject:
+                                    if xObject[obj]['/Subtype'] == '/Image':
+                                        size = (xObject[obj]['/Width'], xObject[obj]['/Height'])
+                                        data = xObject[obj]._data
+                                        if '/Filter' in xObject[obj]:
+                                            if xObject[obj]['/Filter'] == '/DCTDecode':
+                                                file_type = 'jpg'
+                                            elif xObject[obj]['/Filter'] == '/FlateDecode':
+                                                file_type = 'png'
+                                            else:
+                                                file_type = 'png'
+                                        else:
+                                            file_type = 'png'
+                                        image_path = os.path.join(output_dir, f"page_{page_num}_image_{image_count}.{file_type}")
+                                        with open(image_path, 'wb') as img_file:
+                                            img_file.write(data)
+                                        self.logger.debug("Image extracted to '%s'.", image_path)
+                                        image_count += 1
+                self.logger.info("Extracted %s images from PDF '%s' into '%s'.", image_count, pdf_path, output_dir)
+                return True
         except Exception as e:
-            self.logger.error(f"Error extracting images from PDF '{pdf_path}': {e}", exc_info=True)
+            self.logger.error("Error extracting images from PDF '%s': %s", pdf_path, e, exc_info=True)
             return False
 
+    def _extract_images_pymupdf(self, pdf_path: str, output_dir: str, password: Optional[str]) -> int:
+        """
+        Extracts images with PyMuPDF, which returns each image encoded in its proper format.
+
+        Args:
+            pdf_path (str): The file path to the PDF.
+            output_dir (str): The directory where extracted images will be saved.
+            password (Optional[str]): The password for encrypted PDFs.
+
+        Returns:
+            int: The number of images extracted.
+
+        Raises:
+            PDFReaderServiceError: If the PDF is encrypted and the password is missing or wrong.
+        """
+        image_count = 0
+        with pymupdf.open(pdf_path) as doc:
+            if doc.needs_pass and not doc.authenticate(password or ''):
+                raise PDFReaderServiceError("PDF is encrypted and the password is missing or incorrect.")
+            for page_index in range(len(doc)):
+                for image in doc.get_page_images(page_index):
+                    extracted = doc.extract_image(image[0])
+                    if not extracted:
+                        continue
+                    image_path = os.path.join(output_dir, f"page_{page_index + 1}_image_{image_count}.{extracted['ext']}")
+                    with open(image_path, 'wb') as img_file:
+                        img_file.write(extracted['image'])
+                    self.logger.debug("Image extracted to '%s'.", image_path)
+                    image_count += 1
+        return image_count
+
     def close_service(self):
         """
         Closes any resources or sessions held by the service.
         """
         try:
             self.logger.debug("Closing PDFReaderService resources.")
-            # Currently, no persistent resources to close
+            with self.lock:
+                if self._pool is not None:
+                    self._pool.shutdown(wait=True)
+                    self._pool = None
+                self._reader_cache.clear()
             self.logger.info("PDFReaderService closed successfully.")
         except Exception as e:
-            self.logger.error(f"Error closing PDFReaderService: {e}", exc_info=True)
+            self.logger.error("Error closing PDFReaderService: %s", e, exc_info=True)
             raise PDFReaderServiceError(f"Error closing PDFReaderService: {e}")
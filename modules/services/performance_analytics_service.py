@@ -2,16 +2,20 @@
 
 import logging
 import threading
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 import uuid
 import json
+import hashlib
+import math
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, func
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, LargeBinary, bindparam, func, inspect, select, text
 from sqlalchemy.orm import sessionmaker, relationship, declarative_base
 from sqlalchemy.exc import SQLAlchemyError
-import matplotlib.pyplot as plt
-import seaborn as sns
+from cachetools import LRUCache
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import io
 import base64
 import requests
@@ -41,10 +45,127 @@ class PerformanceReport(Base):
     report_name = Column(String, nullable=False)
     generated_at = Column(DateTime, default=datetime.utcnow)
     report_data = Column(Text, nullable=False)  # JSON string containing report details
-    chart_image = Column(Text, nullable=False)  # Base64 encoded image
+    chart_image = Column(LargeBinary, nullable=False)  # Raw encoded image bytes (WebP or PNG)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+# DataFrame column names for the usage metrics, in SELECT order after the timestamp
+RESOURCE_COLUMNS = ['timestamp', 'CPU', 'Memory', 'Disk', 'Network']
+# Rows pulled from the cursor per round while building a report DataFrame
+FETCH_CHUNK_SIZE = 50000
+# Points kept per chart series; a 10-inch-wide chart cannot show more distinct x positions
+CHART_MAX_POINTS = 2000
+# Rendered charts kept for reports regenerated over unchanged data
+CHART_CACHE_SIZE = 64
+# Lossy WebP is several times smaller than PNG for line charts at no visible cost
+CHART_IMAGE_FORMAT = 'webp'
+CHART_IMAGE_QUALITY = 80
+# Series drawn on the performance chart as (DataFrame column, legend label)
+CHART_SERIES = [
+    ('CPU', 'CPU Usage (%)'),
+    ('Memory', 'Memory Usage (%)'),
+    ('Disk', 'Disk Usage (%)'),
+    ('Network', 'Network Usage (Mbps)')
+]
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Picks the points to keep when downsampling a series with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. The points between them are split into
+    n_out - 2 buckets, and each bucket keeps the point forming the largest triangle with the
+    previously kept point and the average of the next bucket.
+
+    Args:
+        x (np.ndarray): The x values as floats, in ascending order.
+        y (np.ndarray): The y values, the same length as x.
+        n_out (int): The number of points to keep.
+
+    Returns:
+        np.ndarray: The ascending indices of the kept points.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+    kept = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket + 2 < len(edges):
+            next_start, next_stop = edges[bucket + 1], edges[bucket + 2]
+        else:
+            next_start, next_stop = n - 1, n
+        avg_x = x[next_start:next_stop].mean()
+        avg_y = y[next_start:next_stop].mean()
+        areas = np.abs((x[kept] - avg_x) * (y[start:stop] - y[kept])
+                       - (x[kept] - x[start:stop]) * (avg_y - y[kept]))
+        kept = start + int(np.argmax(areas))
+        indices[bucket + 1] = kept
+    return indices
+
+def encode_chart_image(chart_image: Union[bytes, str]) -> Tuple[str, str]:
+    """
+    Base64-encodes a stored chart for JSON payloads and identifies its image format.
+
+    Rows saved before charts were stored as raw bytes hold base64 PNG text, which is returned as-is.
+
+    Args:
+        chart_image (Union[bytes, str]): The chart_image value of a PerformanceReport.
+
+    Returns:
+        Tuple[str, str]: The base64-encoded image and its MIME type.
+    """
+    if isinstance(chart_image, str):
+        return chart_image, 'image/png'
+    content_type = 'image/webp' if chart_image[:4] == b'RIFF' and chart_image[8:12] == b'WEBP' else 'image/png'
+    return base64.b64encode(chart_image).decode('ascii'), content_type
+
+def migrate_chart_images(engine) -> int:
+    """
+    Converts performance_reports.chart_image from base64 text to raw image bytes on databases created
+    before the column became binary. create_all never alters existing tables, so this runs at start-up
+    and does nothing once the table is converted.
+
+    Args:
+        engine: The SQLAlchemy engine of the database holding performance_reports.
+
+    Returns:
+        int: The number of rows converted.
+    """
+    table = PerformanceReport.__tablename__
+    inspector = inspect(engine)
+    if not inspector.has_table(table):
+        return 0
+    column = next(column for column in inspector.get_columns(table) if column['name'] == 'chart_image')
+    legacy = column['type'].python_type is not bytes
+    dialect = engine.dialect.name
+    with engine.begin() as conn:
+        if dialect == 'sqlite':
+            # SQLite keeps the declared TEXT type but stores blobs as given, so only the values need decoding
+            rows = conn.execute(text(f"SELECT id, chart_image FROM {table} WHERE typeof(chart_image) = 'text'")).all()
+            if rows:
+                conn.execute(
+                    PerformanceReport.__table__.update()
+                    .where(PerformanceReport.__table__.c.id == bindparam('report_id'))
+                    .values(chart_image=bindparam('chart_image')),
+                    [{'report_id': row[0], 'chart_image': base64.b64decode(row[1])} for row in rows]
+                )
+            return len(rows)
+        if not legacy:
+            return 0
+        count = conn.execute(text(f"SELECT COUNT(*) FROM {table}")).scalar()
+        if dialect == 'postgresql':
+            conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN chart_image TYPE BYTEA USING decode(chart_image, 'base64')"))
+        elif dialect == 'mysql':
+            conn.execute(text(f"ALTER TABLE {table} MODIFY chart_image LONGBLOB NOT NULL"))
+            conn.execute(text(f"UPDATE {table} SET chart_image = FROM_BASE64(chart_image)"))
+        else:
+            return 0
+        return count
+
 class PerformanceAnalyticsServiceError(Exception):
     """Custom exception for PerformanceAnalyticsService-related errors."""
     pass
@@ -66,6 +187,10 @@ class PerformanceAnalyticsService:
         self.encryption_manager = EncryptionManager()
         self.auth_manager = AuthenticationManager()
         self.lock = threading.Lock()
+        # Chart and quartiles per (report, range, data digest); guarded by self.lock
+        self._chart_cache: LRUCache = LRUCache(maxsize=self.config_loader.get('PERFORMANCE_CHART_CACHE_SIZE', CHART_CACHE_SIZE))
+        # Agg-backed figure reused by every chart render; created on first use, guarded by self.lock
+        self._chart_figure: Optional[Figure] = None
         self._initialize_database()
         self.session = self.Session()
         self.analytics_api_url = self.config_loader.get('ANALYTICS_API_URL', 'https://api.analyticsservice.com/reports')
@@ -94,9 +219,17 @@ class PerformanceAnalyticsService:
 
             password = self.encryption_manager.decrypt_data(password_encrypted).decode('utf-8')
             connection_string = self._build_connection_string(db_type, username, password, host, port, database)
-            self.engine = create_engine(connection_string, pool_pre_ping=True, echo=False)
+            engine_options = {'pool_pre_ping': True, 'echo': False}
+            if db_type.lower() == 'postgresql':
+                # Let psycopg2 page executemany() batches instead of sending one statement per row
+                engine_options['executemany_mode'] = 'values_plus_batch'
+            self.engine = create_engine(connection_string, **engine_options)
             Base.metadata.create_all(self.engine)
-            self.Session = sessionmaker(bind=self.engine)
+            converted = migrate_chart_images(self.engine)
+            if converted:
+                self.logger.info(f"Converted {converted} stored report charts from base64 text to binary.")
+            # Keep attributes loaded after commit so reading new report IDs does not re-SELECT them
+            self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
             self.logger.debug("Database initialized and tables created if not existing.")
         except Exception as e:
             self.logger.error(f"Error initializing database: {e}", exc_info=True)
@@ -143,53 +276,11 @@ class PerformanceAnalyticsService:
         try:
             self.logger.debug(f"Generating performance report '{report_name}' from '{start_date}' to '{end_date}'.")
             with self.lock:
-                query = self.session.query(SystemResourceUsage)
-                if start_date:
-                    query = query.filter(SystemResourceUsage.timestamp >= start_date)
-                if end_date:
-                    query = query.filter(SystemResourceUsage.timestamp <= end_date)
-                data = query.order_by(SystemResourceUsage.timestamp).all()
-
-                if not data:
+                report = self._build_performance_report(report_name, start_date, end_date)
+                if report is None:
                     self.logger.error("No data available for the specified date range.")
                     return None
 
-                # Convert data to DataFrame for analysis
-                df = pd.DataFrame([{
-                    'timestamp': record.timestamp,
-                    'CPU': record.cpu_usage,
-                    'Memory': record.memory_usage,
-                    'Disk': record.disk_usage,
-                    'Network': record.network_usage
-                } for record in data])
-
-                # Perform analysis
-                summary = df.describe().to_dict()
-                correlation = df.corr().to_dict()
-
-                # Generate visualization
-                chart_image = self._generate_performance_chart(df, report_name)
-
-                # Compile report data
-                report_data = {
-                    'report_name': report_name,
-                    'generated_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
-                    'summary': summary,
-                    'correlation': correlation,
-                    'start_date': start_date.strftime('%Y-%m-%d %H:%M:%S') if start_date else None,
-                    'end_date': end_date.strftime('%Y-%m-%d %H:%M:%S') if end_date else None
-                }
-
-                # Encode chart image to base64
-                chart_base64 = base64.b64encode(chart_image.getvalue()).decode('utf-8')
-
-                # Save report to database
-                report = PerformanceReport(
-                    report_name=report_name,
-                    generated_at=datetime.utcnow(),
-                    report_data=json.dumps(report_data),
-                    chart_image=chart_base64
-                )
                 self.session.add(report)
                 self.session.commit()
                 report_id = report.id
@@ -204,6 +295,261 @@ class PerformanceAnalyticsService:
             self.session.rollback()
             return None
 
+    def generate_performance_reports(self, batch: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Generates several performance reports and saves them with a single batched insert and commit.
+
+        Args:
+            batch (List[Dict[str, Any]]): One entry per report, each with a 'report_name' key and
+                optional 'start_date' and 'end_date' datetimes.
+
+        Returns:
+            List[Optional[str]]: The report ID for each entry in order, or None for entries that
+                could not be generated. Every entry is None if the save fails.
+        """
+        if not batch:
+            return []
+        try:
+            self.logger.debug(f"Generating {len(batch)} performance reports.")
+            with self.lock:
+                reports = []
+                for entry in batch:
+                    report_name = entry.get('report_name')
+                    try:
+                        report = self._build_performance_report(report_name, entry.get('start_date'), entry.get('end_date'))
+                        if report is None:
+                            self.logger.error(f"No data available for performance report '{report_name}' in the specified date range.")
+                    except Exception as e:
+                        self.logger.error(f"Error generating performance report '{report_name}': {e}", exc_info=True)
+                        report = None
+                    reports.append(report)
+
+                to_save = [report for report in reports if report is not None]
+                if to_save:
+                    self.session.add_all(to_save)
+                    self.session.commit()
+                report_ids = [report.id if report is not None else None for report in reports]
+                self.logger.info(f"Generated {len(to_save)} of {len(batch)} performance reports.")
+                return report_ids
+        except SQLAlchemyError as e:
+            self.logger.error(f"Database error while saving {len(batch)} performance reports: {e}", exc_info=True)
+            self.session.rollback()
+            return [None] * len(batch)
+        except Exception as e:
+            self.logger.error(f"Unexpected error while generating {len(batch)} performance reports: {e}", exc_info=True)
+            self.session.rollback()
+            return [None] * len(batch)
+
+    def _build_performance_report(self, report_name: str, start_date: Optional[datetime],
+                                  end_date: Optional[datetime]) -> Optional[PerformanceReport]:
+        """
+        Analyzes the usage data in the given range and builds an unsaved report for it.
+
+        Args:
+            report_name (str): The name of the performance report.
+            start_date (Optional[datetime]): The start date for the report data.
+            end_date (Optional[datetime]): The end date for the report data.
+
+        Returns:
+            Optional[PerformanceReport]: The report, not yet added to the session, or None if the
+                range holds no data.
+        """
+        # Perform analysis in the database so only the aggregates cross the wire
+        analysis = self._analyze_resource_usage(start_date, end_date)
+        if analysis is None:
+            return None
+        summary, correlation = analysis
+
+        cache_key = self._chart_cache_key(report_name, start_date, end_date, summary, correlation)
+        cached = self._chart_cache.get(cache_key)
+        if cached is None:
+            df = self._load_resource_usage(start_date, end_date)
+            if df is None:
+                return None
+            quartiles = df[RESOURCE_COLUMNS[1:]].quantile([0.25, 0.5, 0.75])
+
+            # Generate visualization
+            chart_image = self._generate_performance_chart(df, report_name)
+            cached = (chart_image.getvalue(), quartiles)
+            self._chart_cache[cache_key] = cached
+        else:
+            self.logger.debug(f"Reusing cached performance chart for report '{report_name}'.")
+        chart_bytes, quartiles = cached
+
+        for name in RESOURCE_COLUMNS[1:]:
+            stats = summary[name]
+            summary[name] = {
+                'count': stats['count'],
+                'mean': stats['mean'],
+                'std': stats['std'],
+                'min': stats['min'],
+                '25%': float(quartiles.at[0.25, name]),
+                '50%': float(quartiles.at[0.5, name]),
+                '75%': float(quartiles.at[0.75, name]),
+                'max': stats['max']
+            }
+
+        # Compile report data
+        report_data = {
+            'report_name': report_name,
+            'generated_at': datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
+            'summary': summary,
+            'correlation': correlation,
+            'start_date': start_date.strftime('%Y-%m-%d %H:%M:%S') if start_date else None,
+            'end_date': end_date.strftime('%Y-%m-%d %H:%M:%S') if end_date else None
+        }
+
+        return PerformanceReport(
+            report_name=report_name,
+            generated_at=datetime.utcnow(),
+            report_data=json.dumps(report_data),
+            chart_image=chart_bytes
+        )
+
+    @staticmethod
+    def _chart_cache_key(report_name: str, start_date: Optional[datetime], end_date: Optional[datetime],
+                         summary: Dict[str, Dict[str, Any]], correlation: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Builds the chart cache key for a report from its inputs and the aggregates of its data.
+
+        The aggregates stand in for a hash of the rows: any inserted, removed or changed sample
+        alters the count or at least one of the sums they are derived from.
+
+        Args:
+            report_name (str): The name of the performance report.
+            start_date (Optional[datetime]): The start date for the report data.
+            end_date (Optional[datetime]): The end date for the report data.
+            summary (Dict[str, Dict[str, Any]]): The per-metric statistics of the range.
+            correlation (Dict[str, Dict[str, Any]]): The correlation matrix of the range.
+
+        Returns:
+            str: The hex digest identifying the chart.
+        """
+        material = json.dumps([report_name, str(start_date), str(end_date), summary, correlation], sort_keys=True)
+        return hashlib.blake2b(material.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _resource_usage_query(self, start_date: Optional[datetime], end_date: Optional[datetime]):
+        """
+        Builds a column-only SELECT over the resource usage samples in the given range.
+
+        Args:
+            start_date (Optional[datetime]): Inclusive lower bound on the sample timestamp.
+            end_date (Optional[datetime]): Inclusive upper bound on the sample timestamp.
+
+        Returns:
+            Select: The statement yielding rows in RESOURCE_COLUMNS order, oldest first.
+        """
+        query = select(
+            SystemResourceUsage.timestamp,
+            SystemResourceUsage.cpu_usage,
+            SystemResourceUsage.memory_usage,
+            SystemResourceUsage.disk_usage,
+            SystemResourceUsage.network_usage
+        )
+        if start_date:
+            query = query.where(SystemResourceUsage.timestamp >= start_date)
+        if end_date:
+            query = query.where(SystemResourceUsage.timestamp <= end_date)
+        return query.order_by(SystemResourceUsage.timestamp)
+
+    def _analyze_resource_usage(self, start_date: Optional[datetime],
+                                end_date: Optional[datetime]) -> Optional[Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]]:
+        """
+        Computes per-metric statistics and pairwise Pearson correlations with one aggregate query.
+
+        The database returns counts, sums, sums of squares and sums of pairwise products, from
+        which the sample standard deviation and correlation coefficients are derived.
+
+        Args:
+            start_date (Optional[datetime]): Inclusive lower bound on the sample timestamp.
+            end_date (Optional[datetime]): Inclusive upper bound on the sample timestamp.
+
+        Returns:
+            Optional[Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]]: The summary
+                (count, mean, std, min and max per metric) and the correlation matrix, or None
+                if the range holds no data.
+        """
+        metrics = list(zip(RESOURCE_COLUMNS[1:], [
+            SystemResourceUsage.cpu_usage,
+            SystemResourceUsage.memory_usage,
+            SystemResourceUsage.disk_usage,
+            SystemResourceUsage.network_usage
+        ]))
+        pairs = [(i, j) for i in range(len(metrics)) for j in range(i + 1, len(metrics))]
+        aggregates = [func.count(SystemResourceUsage.id)]
+        for _, column in metrics:
+            aggregates += [func.sum(column), func.sum(column * column), func.min(column), func.max(column)]
+        aggregates += [func.sum(metrics[i][1] * metrics[j][1]) for i, j in pairs]
+
+        query = select(*aggregates)
+        if start_date:
+            query = query.where(SystemResourceUsage.timestamp >= start_date)
+        if end_date:
+            query = query.where(SystemResourceUsage.timestamp <= end_date)
+        row = self.session.execute(query).one()
+
+        count = row[0]
+        if not count:
+            return None
+        summary = {}
+        sums = []
+        spreads = []
+        for index, (name, _) in enumerate(metrics):
+            total, squares, minimum, maximum = (float(value) for value in row[1 + 4 * index:5 + 4 * index])
+            # N * sum(x^2) - sum(x)^2, shared by the variance and the correlation denominators
+            spread = max(count * squares - total * total, 0.0)
+            sums.append(total)
+            spreads.append(spread)
+            summary[name] = {
+                'count': float(count),
+                'mean': total / count,
+                'std': math.sqrt(spread / (count * (count - 1))) if count > 1 else None,
+                'min': minimum,
+                'max': maximum
+            }
+
+        correlation = {name: {} for name, _ in metrics}
+        for index, (name, _) in enumerate(metrics):
+            correlation[name][name] = 1.0 if spreads[index] else None
+        products = row[1 + 4 * len(metrics):]
+        for (i, j), product in zip(pairs, products):
+            denominator = math.sqrt(spreads[i] * spreads[j])
+            value = (count * float(product) - sums[i] * sums[j]) / denominator if denominator else None
+            correlation[metrics[i][0]][metrics[j][0]] = value
+            correlation[metrics[j][0]][metrics[i][0]] = value
+        return summary, correlation
+
+    def _load_resource_usage(self, start_date: Optional[datetime], end_date: Optional[datetime]) -> Optional[pd.DataFrame]:
+        """
+        Streams the resource usage samples in the given range into a DataFrame.
+
+        Rows are fetched FETCH_CHUNK_SIZE at a time through a server-side cursor, so only
+        one chunk of raw tuples is held alongside the frames built so far.
+
+        Args:
+            start_date (Optional[datetime]): Inclusive lower bound on the sample timestamp.
+            end_date (Optional[datetime]): Inclusive upper bound on the sample timestamp.
+
+        Returns:
+            Optional[pd.DataFrame]: The samples in RESOURCE_COLUMNS layout, or None if there are none.
+        """
+        query = self._resource_usage_query(start_date, end_date).execution_options(yield_per=FETCH_CHUNK_SIZE)
+        result = self.session.execute(query)
+        chunks = []
+        try:
+            while True:
+                rows = result.fetchmany(FETCH_CHUNK_SIZE)
+                if not rows:
+                    break
+                chunks.append(pd.DataFrame.from_records(rows, columns=RESOURCE_COLUMNS))
+        finally:
+            result.close()
+        if not chunks:
+            return None
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, ignore_index=True, copy=False)
+
     def _generate_performance_chart(self, df: pd.DataFrame, report_name: str) -> io.BytesIO:
         """
         Generates a performance chart from the DataFrame and returns it as a BytesIO object.
@@ -213,24 +559,38 @@ class PerformanceAnalyticsService:
             report_name (str): The name of the report for chart titling.
 
         Returns:
-            io.BytesIO: The in-memory bytes buffer containing the chart image.
+            io.BytesIO: The in-memory bytes buffer containing the chart image in CHART_IMAGE_FORMAT.
         """
         try:
             self.logger.debug(f"Generating performance chart for report '{report_name}'.")
-            plt.figure(figsize=(10, 6))
-            sns.lineplot(x='timestamp', y='CPU', data=df, label='CPU Usage (%)')
-            sns.lineplot(x='timestamp', y='Memory', data=df, label='Memory Usage (%)')
-            sns.lineplot(x='timestamp', y='Disk', data=df, label='Disk Usage (%)')
-            sns.lineplot(x='timestamp', y='Network', data=df, label='Network Usage (Mbps)')
-            plt.title(f"Performance Report: {report_name}")
-            plt.xlabel("Timestamp")
-            plt.ylabel("Usage")
-            plt.legend()
-            plt.tight_layout()
+            if self._chart_figure is None:
+                # Bind an Agg canvas directly so rendering never goes through pyplot's global state
+                self._chart_figure = Figure(figsize=(10, 6))
+                FigureCanvasAgg(self._chart_figure)
+                self._chart_figure.add_subplot()
+            fig = self._chart_figure
+            ax = fig.axes[0]
+            ax.clear()
+            timestamps = df['timestamp'].to_numpy()
+            downsample = len(df) > 2 * CHART_MAX_POINTS
+            if downsample:
+                x = (timestamps - timestamps[0]).astype('timedelta64[us]').astype(np.float64)
+            for column, label in CHART_SERIES:
+                values = df[column].to_numpy(dtype=np.float64)
+                if downsample:
+                    # Draw only the points that shape each line; the rest land on the same pixels
+                    kept = _lttb_indices(x, values, CHART_MAX_POINTS)
+                    ax.plot(timestamps[kept], values[kept], label=label)
+                else:
+                    ax.plot(timestamps, values, label=label)
+            ax.set_title(f"Performance Report: {report_name}")
+            ax.set_xlabel("Timestamp")
+            ax.set_ylabel("Usage")
+            ax.legend()
+            fig.tight_layout()
 
             img_buffer = io.BytesIO()
-            plt.savefig(img_buffer, format='png')
-            plt.close()
+            fig.savefig(img_buffer, format=CHART_IMAGE_FORMAT, pil_kwargs={'quality': CHART_IMAGE_QUALITY})
             img_buffer.seek(0)
             self.logger.debug(f"Performance chart for report '{report_name}' generated successfully.")
             return img_buffer
@@ -261,12 +621,14 @@ class PerformanceAnalyticsService:
                     'Authorization': f"Bearer {self.analytics_api_key}",
                     'Content-Type': 'application/json'
                 }
+                chart_image, chart_content_type = encode_chart_image(report.chart_image)
                 payload = {
                     'report_id': report.id,
                     'report_name': report.report_name,
                     'generated_at': report.generated_at.strftime('%Y-%m-%d %H:%M:%S'),
                     'report_data': json.loads(report.report_data),
-                    'chart_image': report.chart_image,
+                    'chart_image': chart_image,
+                    'chart_content_type': chart_content_type,
                     'recipient_email': user_email
                 }
                 response = self.session_requests.post(
@@ -310,12 +672,14 @@ class PerformanceAnalyticsService:
                     self.logger.error(f"Performance report with ID '{report_id}' does not exist.")
                     return None
 
+                chart_image, chart_content_type = encode_chart_image(report.chart_image)
                 report_details = {
                     'report_id': report.id,
                     'report_name': report.report_name,
                     'generated_at': report.generated_at.strftime('%Y-%m-%d %H:%M:%S'),
                     'report_data': json.loads(report.report_data),
-                    'chart_image': report.chart_image,
+                    'chart_image': chart_image,
+                    'chart_content_type': chart_content_type,
                     'created_at': report.created_at.strftime('%Y-%m-%d %H:%M:%S'),
                     'updated_at': report.updated_at.strftime('%Y-%m-%d %H:%M:%S')
                 }
@@ -12,6 +12,7 @@ from flask import url_for
 from unittest.mock import patch, MagicMock
 from flask_testing import TestCase
 from __init__ import app, db, User, Notification
+from modules.services.notification_service import NotificationService, _Placeholders
 
 class TestConfig:
     TESTING = True
@@ -169,3 +170,20 @@ def test_notifications_csrf_protection(mock_encryption_manager, mock_communicati
     assert response.status_code == 400
     assert b"The CSRF token is missing." in response.data
     app.config['WTF_CSRF_ENABLED'] = False
+
+def render(text, placeholders):
+    return NotificationService._fill(NotificationService._compile(text), _Placeholders(placeholders))
+
+@pytest.mark.parametrize('key', ['name', 'order-id', 'user.name', 'first name', '2fa_code', '0', 'total:usd'])
+def test_template_placeholders_accept_any_key(key):
+    """
+    Test that placeholders are substituted whatever characters their keys contain.
+    """
+    assert render(f"Value: {{{{{key}}}}}.", {key: 'X'}) == "Value: X."
+
+def test_template_placeholders_leave_other_text_untouched():
+    """
+    Test that unknown placeholders and literal braces are rendered as written.
+    """
+    text = "Hi {{name}}, {{missing}} {single} {} }{"
+    assert render(text, {'name': 'Bob'}) == "Hi Bob, {{missing}} {single} {} }{"
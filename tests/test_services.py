@@ -0,0 +1,534 @@
+# tests/test_services.py
+
+"""
+Unit Tests for Services
+
+This module contains unit tests for the services under modules/services, exercising each
+service against temporary files, a SQLite database and mocked upstream APIs.
+"""
+
+import base64
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+import httpx
+import numpy as np
+import pandas as pd
+import pytest
+import requests
+from PIL import Image
+from PyPDF2 import PdfReader
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
+from sqlalchemy import text
+
+from modules.services.news_aggregation_service import HTTP_RETRIES, NewsAggregationService
+from modules.services.payment_gateway_service import BREAKER_FAIL_MAX, PaymentGatewayService
+from modules.services.pdf_reader_service import PDFReaderService
+from modules.services.performance_analytics_service import (
+    RESOURCE_COLUMNS, PerformanceAnalyticsService, SystemResourceUsage, _lttb_indices, migrate_chart_images
+)
+
+
+def config_values(values):
+    """
+    Returns a stand-in for ConfigLoader.get serving the given values.
+    """
+    return lambda key, default=None: values.get(key, default)
+
+
+# PDFReaderService
+
+@pytest.fixture
+def pdf_service(tmp_path):
+    with patch('modules.services.pdf_reader_service.ConfigLoader') as mock_config_loader, \
+            patch('modules.services.pdf_reader_service.EncryptionManager'), \
+            patch('modules.services.pdf_reader_service.AuthenticationManager'):
+        mock_config_loader.return_value.get.side_effect = config_values({'PDF_CACHE_DIR': str(tmp_path / 'cache')})
+        service = PDFReaderService()
+        yield service
+        service.close_service()
+
+
+def make_image_pdf(path, image, label, pages=2):
+    """
+    Writes a PDF whose pages all draw the same image and a line of text.
+    """
+    can = canvas.Canvas(str(path), pagesize=letter)
+    for number in range(1, pages + 1):
+        can.drawImage(ImageReader(image), 72, 400, width=200, height=200)
+        can.drawString(72, 72, f"{label} page {number}")
+        can.showPage()
+    can.save()
+
+
+def image_ids(reader):
+    """
+    Returns the object numbers of the XObjects referenced by a PDF's pages.
+    """
+    return {
+        xobjects.raw_get(name).idnum
+        for page in reader.pages
+        for xobjects in [page['/Resources']['/XObject']]
+        for name in xobjects
+    }
+
+
+def test_merge_pdfs_shares_identical_resources(pdf_service, tmp_path):
+    """
+    Test that merging PDFs carrying the same image keeps one copy of it and a smaller, valid output.
+    """
+    # Random pixels do not compress, so each copy of the image is large
+    image = Image.frombytes('RGB', (200, 200), os.urandom(200 * 200 * 3))
+    labels = ['First', 'Second', 'Third']
+    inputs = []
+    for label in labels:
+        path = tmp_path / f"{label}.pdf"
+        make_image_pdf(path, image, label)
+        inputs.append(str(path))
+
+    merged_path = tmp_path / 'merged.pdf'
+    assert pdf_service.merge_pdfs(inputs, str(merged_path))
+    plain_path = tmp_path / 'plain.pdf'
+    with patch('modules.services.pdf_reader_service._deduplicate_resources', return_value=0):
+        assert pdf_service.merge_pdfs(inputs, str(plain_path))
+
+    assert merged_path.stat().st_size < plain_path.stat().st_size / 2
+    reader = PdfReader(str(merged_path), strict=True)
+    assert [page.extract_text().strip() for page in reader.pages] == [
+        f"{label} page {number}" for label in labels for number in (1, 2)
+    ]
+    assert len(image_ids(reader)) == 1
+
+
+def test_merge_pdfs_keeps_distinct_resources(pdf_service, tmp_path):
+    """
+    Test that images differing in content are not merged into one.
+    """
+    inputs = []
+    for label in ('First', 'Second'):
+        path = tmp_path / f"{label}.pdf"
+        make_image_pdf(path, Image.frombytes('RGB', (50, 50), os.urandom(50 * 50 * 3)), label, pages=1)
+        inputs.append(str(path))
+
+    merged_path = tmp_path / 'merged.pdf'
+    assert pdf_service.merge_pdfs(inputs, str(merged_path))
+    reader = PdfReader(str(merged_path), strict=True)
+    assert len(reader.pages) == 2
+    assert len(image_ids(reader)) == 2
+
+
+# PerformanceAnalyticsService
+
+METRICS = ['cpu_usage', 'memory_usage', 'disk_usage', 'network_usage']
+
+
+@pytest.fixture
+def analytics_service(tmp_path):
+    config = {
+        'DATABASE_CONFIG': {'type': 'sqlite', 'username': 'test', 'password': 'encrypted', 'host': 'localhost',
+                            'port': 1, 'database': str(tmp_path / 'analytics.db')},
+        'ANALYTICS_API_KEY': 'encrypted'
+    }
+    with patch('modules.services.performance_analytics_service.ConfigLoader') as mock_config_loader, \
+            patch('modules.services.performance_analytics_service.EncryptionManager') as mock_encryption_manager, \
+            patch('modules.services.performance_analytics_service.AuthenticationManager'):
+        mock_config_loader.return_value.get.side_effect = config_values(config)
+        mock_encryption_manager.return_value.decrypt_data.return_value = b'secret'
+        service = PerformanceAnalyticsService()
+        yield service
+        service.close_service()
+
+
+def seed_resource_usage(service, count):
+    """
+    Inserts one resource usage sample per minute and returns them as a DataFrame.
+    """
+    rng = np.random.default_rng(42)
+    cpu = rng.uniform(0, 100, count)
+    frame = pd.DataFrame({
+        'id': [str(index) for index in range(count)],
+        'timestamp': [datetime(2024, 1, 1) + timedelta(minutes=index) for index in range(count)],
+        'cpu_usage': cpu,
+        # Correlated with CPU so the coefficients are not all near zero
+        'memory_usage': cpu * 0.6 + rng.normal(20, 5, count),
+        'disk_usage': rng.uniform(0, 100, count),
+        'network_usage': 100 - cpu * 0.3 + rng.normal(0, 10, count)
+    })
+    service.session.execute(SystemResourceUsage.__table__.insert(), frame.to_dict('records'))
+    service.session.commit()
+    return frame
+
+
+def assert_matches_pandas(summary, correlation, frame):
+    """
+    Checks _analyze_resource_usage results against pandas, which reports them under the report's column names.
+    """
+    names = RESOURCE_COLUMNS[1:]
+    metrics = frame[METRICS].set_axis(names, axis=1)
+    expected_summary = metrics.describe()
+    expected_correlation = metrics.corr()
+    for name in names:
+        for statistic in ('count', 'mean', 'std', 'min', 'max'):
+            assert summary[name][statistic] == pytest.approx(expected_summary.loc[statistic, name])
+        for other in names:
+            assert correlation[name][other] == pytest.approx(expected_correlation.loc[name, other])
+
+
+def test_analyze_resource_usage_matches_pandas(analytics_service):
+    """
+    Test that the SQL aggregates reproduce DataFrame.describe() and DataFrame.corr().
+    """
+    frame = seed_resource_usage(analytics_service, 500)
+    summary, correlation = analytics_service._analyze_resource_usage(None, None)
+    assert_matches_pandas(summary, correlation, frame)
+
+
+def test_analyze_resource_usage_applies_date_range(analytics_service):
+    """
+    Test that the aggregates only cover samples inside the inclusive date range.
+    """
+    frame = seed_resource_usage(analytics_service, 500)
+    start_date, end_date = datetime(2024, 1, 1, 1, 0), datetime(2024, 1, 1, 3, 0)
+    summary, correlation = analytics_service._analyze_resource_usage(start_date, end_date)
+    in_range = frame[(frame['timestamp'] >= start_date) & (frame['timestamp'] <= end_date)]
+    assert summary['CPU']['count'] == 121
+    assert_matches_pandas(summary, correlation, in_range)
+
+
+def test_analyze_resource_usage_empty_range(analytics_service):
+    """
+    Test that a range without samples yields None.
+    """
+    seed_resource_usage(analytics_service, 10)
+    assert analytics_service._analyze_resource_usage(datetime(2025, 1, 1), None) is None
+
+
+def test_lttb_indices_keep_endpoints_and_ascend():
+    """
+    Test that downsampling keeps the first and last points and returns strictly ascending indices.
+    """
+    rng = np.random.default_rng(7)
+    x = np.arange(10000, dtype=float)
+    y = rng.normal(size=10000).cumsum()
+    indices = _lttb_indices(x, y, 500)
+    assert len(indices) == 500
+    assert indices[0] == 0
+    assert indices[-1] == 9999
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_lttb_indices_keep_spikes():
+    """
+    Test that an isolated spike survives downsampling.
+    """
+    x = np.arange(10000, dtype=float)
+    y = np.zeros(10000)
+    y[4321] = 100.0
+    assert 4321 in _lttb_indices(x, y, 100)
+
+
+def test_lttb_indices_short_series_unchanged():
+    """
+    Test that series no longer than the target are returned whole.
+    """
+    x = np.arange(10, dtype=float)
+    np.testing.assert_array_equal(_lttb_indices(x, x, 10), np.arange(10))
+    np.testing.assert_array_equal(_lttb_indices(x, x, 2000), np.arange(10))
+
+
+PNG_BYTES = b'\x89PNG\r\n\x1a\n' + b'\x00' * 16
+
+
+def test_legacy_base64_charts_are_migrated(analytics_service):
+    """
+    Test that charts stored as base64 text before the column became binary are decoded in place.
+    """
+    legacy_chart = base64.b64encode(PNG_BYTES).decode('ascii')
+    with analytics_service.engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO performance_reports (id, report_name, generated_at, report_data, chart_image, created_at, updated_at) "
+                 "VALUES ('legacy', 'Legacy', :now, '{}', :chart_image, :now, :now)"),
+            {'now': datetime(2024, 1, 1), 'chart_image': legacy_chart}
+        )
+
+    # Rows not yet migrated are served as stored
+    report = analytics_service.retrieve_performance_report('legacy')
+    assert (report['chart_image'], report['chart_content_type']) == (legacy_chart, 'image/png')
+
+    assert migrate_chart_images(analytics_service.engine) == 1
+    with analytics_service.engine.connect() as conn:
+        assert conn.execute(text("SELECT chart_image FROM performance_reports WHERE id = 'legacy'")).scalar() == PNG_BYTES
+    analytics_service.session.expire_all()
+    report = analytics_service.retrieve_performance_report('legacy')
+    assert (report['chart_image'], report['chart_content_type']) == (legacy_chart, 'image/png')
+    assert migrate_chart_images(analytics_service.engine) == 0
+
+
+def test_generated_charts_are_sent_as_webp(analytics_service):
+    """
+    Test that new reports store raw WebP bytes and label them in the report details.
+    """
+    seed_resource_usage(analytics_service, 100)
+    report_id = analytics_service.generate_performance_report('Weekly')
+    report = analytics_service.retrieve_performance_report(report_id)
+    assert report['chart_content_type'] == 'image/webp'
+    assert base64.b64decode(report['chart_image'])[8:12] == b'WEBP'
+
+
+# PaymentGatewayService
+
+CARD = {'type': 'card', 'number': '4242424242424242', 'exp_month': 12, 'exp_year': 2030}
+
+
+@pytest.fixture
+def payment_service():
+    config = {'PAYMENT_API_CONFIG': {'api_key': 'encrypted', 'base_url': 'https://gateway.test/v1'}}
+    with patch('modules.services.payment_gateway_service.ConfigLoader') as mock_config_loader, \
+            patch('modules.services.payment_gateway_service.EncryptionManager') as mock_encryption_manager, \
+            patch('modules.services.payment_gateway_service.AuthenticationManager'):
+        mock_config_loader.return_value.get.side_effect = config_values(config)
+        mock_encryption_manager.return_value.decrypt_data.return_value = b'sk_test'
+        service = PaymentGatewayService()
+    # Only the in-memory idempotency store is exercised
+    service._redis = None
+    yield service
+    service.close_service()
+
+
+def test_breaker_opens_after_consecutive_gateway_failures(payment_service):
+    """
+    Test that repeated 5xx responses open the circuit, after which calls fail without reaching the gateway.
+    """
+    with patch.object(payment_service, '_send', return_value=httpx.Response(503)) as mock_send:
+        for _ in range(BREAKER_FAIL_MAX):
+            assert payment_service.process_payment(Decimal('10.00'), 'USD', CARD) is None
+        assert payment_service._breaker.current_state == 'open'
+        assert payment_service.process_payment(Decimal('10.00'), 'USD', CARD) is None
+    assert mock_send.call_count == BREAKER_FAIL_MAX
+
+
+def test_breaker_counts_transport_errors(payment_service):
+    """
+    Test that connection failures count towards opening the circuit.
+    """
+    with patch.object(payment_service, '_send', side_effect=httpx.ConnectError("Connection refused")):
+        for _ in range(BREAKER_FAIL_MAX):
+            assert payment_service.process_payment(Decimal('10.00'), 'USD', CARD) is None
+    assert payment_service._breaker.current_state == 'open'
+
+
+def test_breaker_ignores_client_errors(payment_service):
+    """
+    Test that 4xx responses, such as declined cards, leave the circuit closed.
+    """
+    declined = httpx.Response(402, json={'error': 'card_declined'})
+    with patch.object(payment_service, '_send', return_value=declined) as mock_send:
+        for _ in range(BREAKER_FAIL_MAX + 1):
+            assert payment_service.process_payment(Decimal('10.00'), 'USD', CARD) is None
+    assert payment_service._breaker.current_state == 'closed'
+    assert mock_send.call_count == BREAKER_FAIL_MAX + 1
+
+
+def test_breaker_closes_after_successful_trial_call(payment_service):
+    """
+    Test that a successful call in the half-open state closes the circuit again.
+    """
+    with patch.object(payment_service, '_send', return_value=httpx.Response(503)):
+        for _ in range(BREAKER_FAIL_MAX):
+            payment_service.process_payment(Decimal('10.00'), 'USD', CARD)
+    # Stands in for the reset timeout elapsing
+    payment_service._breaker.half_open()
+    created = httpx.Response(201, json={'id': 'txn_1', 'status': 'succeeded'})
+    with patch.object(payment_service, '_send', return_value=created):
+        assert payment_service.process_payment(Decimal('10.00'), 'USD', CARD) == {'id': 'txn_1', 'status': 'succeeded'}
+    assert payment_service._breaker.current_state == 'closed'
+
+
+def use_gateway(service, *responses):
+    """
+    Routes the service's HTTP client to a mock gateway answering with the given responses in turn.
+
+    Returns:
+        List[httpx.Request]: The requests the gateway receives.
+    """
+    received = []
+    answers = iter(responses)
+
+    def handler(request):
+        received.append(request)
+        return next(answers)
+
+    service.session.close()
+    service.session = httpx.Client(transport=httpx.MockTransport(handler), headers=service._default_headers)
+    return received
+
+
+def test_idempotent_payment_is_replayed(payment_service):
+    """
+    Test that a payment retried with the same idempotency key returns the stored transaction without a second charge.
+    """
+    received = use_gateway(payment_service, httpx.Response(201, json={'id': 'txn_1', 'status': 'succeeded'}))
+    first = payment_service.process_payment(Decimal('25.00'), 'USD', CARD, idempotency_key='order-1')
+    second = payment_service.process_payment(Decimal('25.00'), 'USD', CARD, idempotency_key='order-1')
+    assert first == second == {'id': 'txn_1', 'status': 'succeeded'}
+    assert len(received) == 1
+    assert received[0].headers['Idempotency-Key'] == 'order-1'
+
+
+def test_failed_payment_releases_idempotency_key(payment_service):
+    """
+    Test that a failed payment can be retried with the same idempotency key.
+    """
+    received = use_gateway(
+        payment_service,
+        httpx.Response(402, json={'error': 'card_declined'}),
+        httpx.Response(201, json={'id': 'txn_2', 'status': 'succeeded'})
+    )
+    assert payment_service.process_payment(Decimal('25.00'), 'USD', CARD, idempotency_key='order-2') is None
+    assert payment_service.process_payment(Decimal('25.00'), 'USD', CARD, idempotency_key='order-2') == {
+        'id': 'txn_2', 'status': 'succeeded'
+    }
+    assert len(received) == 2
+
+
+def test_in_progress_payment_is_not_sent_again(payment_service):
+    """
+    Test that a payment whose idempotency key is still claimed by another attempt is not sent.
+    """
+    received = use_gateway(payment_service)
+    claimed, _ = payment_service._claim_idempotency_key('payment', 'order-3')
+    assert claimed
+    assert payment_service.process_payment(Decimal('25.00'), 'USD', CARD, idempotency_key='order-3') is None
+    assert received == []
+
+
+def test_idempotency_keys_are_scoped_by_operation(payment_service):
+    """
+    Test that a refund does not replay a payment stored under the same key.
+    """
+    received = use_gateway(
+        payment_service,
+        httpx.Response(201, json={'id': 'txn_4', 'status': 'succeeded'}),
+        httpx.Response(200, json={'id': 'ref_4', 'status': 'refunded'})
+    )
+    payment_service.process_payment(Decimal('25.00'), 'USD', CARD, idempotency_key='order-4')
+    assert payment_service.refund_payment('txn_4', idempotency_key='order-4') == {'id': 'ref_4', 'status': 'refunded'}
+    assert len(received) == 2
+
+
+# NewsAggregationService
+
+ARTICLES = {'status': 'ok', 'totalResults': 1, 'articles': [{'title': 'Headline'}]}
+
+
+@pytest.fixture
+def news_service():
+    with patch('modules.services.news_aggregation_service.ConfigLoader') as mock_config_loader, \
+            patch('modules.services.news_aggregation_service.EncryptionManager') as mock_encryption_manager, \
+            patch('modules.services.news_aggregation_service.AuthenticationManager'):
+        mock_config_loader.return_value.get.side_effect = config_values({'NEWS_API_KEY_ENCRYPTED': 'encrypted'})
+        mock_encryption_manager.return_value.decrypt_data.return_value = b'news-key'
+        service = NewsAggregationService()
+    # Only the in-memory cache is exercised
+    service._redis = None
+    yield service
+    service.close_service()
+
+
+def test_concurrent_misses_share_one_request(news_service):
+    """
+    Test that concurrent callers missing the cache on the same key wait for a single upstream request.
+    """
+    release = threading.Event()
+    requested = []
+
+    def slow_request(endpoint, params, cache_key, stale_entry=None):
+        requested.append(cache_key)
+        release.wait(5)
+        news_service._cache_response(endpoint, cache_key, ARTICLES)
+        return ARTICLES
+
+    with patch.object(NewsAggregationService, '_request_news_data', side_effect=slow_request):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(news_service.search_news, 'python') for _ in range(8)]
+            # Give every caller time to miss the cache and start waiting on the leader
+            time.sleep(0.2)
+            release.set()
+            results = [future.result() for future in futures]
+    assert results == [ARTICLES] * 8
+    assert len(requested) == 1
+    assert news_service._inflight == {}
+
+
+def test_different_keys_are_fetched_separately(news_service):
+    """
+    Test that misses on different keys are not coalesced.
+    """
+    with patch.object(NewsAggregationService, '_request_news_data', return_value=ARTICLES) as mock_request:
+        news_service.search_news('python')
+        news_service.search_news('rust')
+    assert mock_request.call_count == 2
+
+
+def test_inflight_wait_outlasts_leader_request(news_service):
+    """
+    Test that waiters allow for every retry attempt of the leader's request to use its full timeouts.
+    """
+    for endpoint in ('sources', 'top-headlines', 'everything'):
+        connect_timeout, read_timeout = news_service._timeout(endpoint)
+        assert news_service._inflight_wait_timeout(endpoint) > (HTTP_RETRIES + 1) * (connect_timeout + read_timeout)
+
+
+def news_response(status_code, body):
+    """
+    Builds a news API response with the given status and raw body.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.url = 'https://newsapi.org/v2/everything'
+    return response
+
+
+def test_error_payload_is_negative_cached(news_service):
+    """
+    Test that an API error payload sent with a 4xx status absorbs retries briefly and is never served stale.
+    """
+    rate_limited = news_response(429, b'{"status": "error", "code": "rateLimited"}')
+    with patch.object(news_service._session, 'get', return_value=rate_limited) as mock_get:
+        assert news_service.search_news('python') is None
+        assert news_service.search_news('python') == {'status': 'error', 'code': 'rateLimited'}
+    assert mock_get.call_count == 1
+    params = news_service._build_search_params('python', None, None, 'en', 'relevancy', 20)
+    _, fresh_until, stale_until, _, _ = news_service._get_cached(news_service._get_cache_key('everything', params))
+    assert stale_until == fresh_until
+
+
+def test_non_api_error_body_is_not_cached(news_service):
+    """
+    Test that error pages that are not API payloads, such as a proxy's, are not cached.
+    """
+    bad_gateway = news_response(502, b'<html>Bad Gateway</html>')
+    with patch.object(news_service._session, 'get', return_value=bad_gateway) as mock_get:
+        assert news_service.search_news('python') is None
+        assert news_service.search_news('python') is None
+    assert mock_get.call_count == 2
+    assert news_service.list_cached_data() == {}
+
+
+def test_empty_results_are_not_cached(news_service):
+    """
+    Test that successful responses without results are fetched again rather than cached.
+    """
+    empty = news_response(200, b'{"status": "ok", "totalResults": 0, "articles": []}')
+    with patch.object(news_service._session, 'get', return_value=empty) as mock_get:
+        news_service.search_news('python')
+        news_service.search_news('python')
+    assert mock_get.call_count == 2